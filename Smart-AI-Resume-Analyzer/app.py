@@ -2,9 +2,7 @@
 Smart Resume AI - Main Application
 """
 import time
-from PIL import Image
 from jobs.job_search import render_job_search
-from datetime import datetime
 from ui_components import (
     apply_modern_styles, hero_section, feature_card, about_section,
     page_header, render_analytics_section, render_activity_section,
@@ -15,36 +13,40 @@ from ui.modern_components import (
     create_modern_card, create_metric_cards, create_feature_grid
 )
 from ui.footer_nav import create_bottom_navigation_with_js
-from docx.enum.text import WD_ALIGN_PARAGRAPH
-from docx.shared import Inches, Pt
-from docx import Document
 import io
+import hashlib
+import xlsxwriter
 import base64
-import plotly.graph_objects as go
-from streamlit_lottie import st_lottie
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from dashboard.dashboard import DashboardManager
-from config.courses import COURSES_BY_CATEGORY, RESUME_VIDEOS, INTERVIEW_VIDEOS, get_courses_for_role, get_category_for_role
+from config.courses import COURSES_BY_ROLE, RESUME_VIDEOS, INTERVIEW_VIDEOS
 from config.job_roles import JOB_ROLES
 from config.database import (
     get_database_connection, save_resume_data, save_analysis_data,
     init_database, verify_admin, log_admin_action, save_ai_analysis_data,
     get_ai_analysis_stats, reset_ai_analysis_stats, get_detailed_ai_analysis_stats,
-    save_resume_radar_analysis, get_resume_radar_stats
+    save_resume_radar_analysis, get_resume_radar_stats, with_database_lock
 )
-from utils.ai_resume_analyzer import AIResumeAnalyzer
 from utils.resume_builder import ResumeBuilder
 from utils.resume_analyzer import ResumeAnalyzer
 from utils.pdf_utils import extract_text_from_pdf, extract_text_from_docx
-from resume_radar.resume_radar_service import ResumeRadarService
-from resume_radar.jd_parser import JobDescriptionParser
-from resume_radar.matching_engine import ResumeJDMatcher
 import traceback
-import plotly.express as px
 import json
+import copy
+import logging
 import streamlit as st
 import datetime
 import os
+import sqlite3
+import tempfile
+import re
+import functools
+import bisect
+import threading
+from types import SimpleNamespace
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
 
 # Conditional import for pandas
@@ -67,6 +69,8 @@ except ImportError:
     
     pd = MockPandas()
 
+logger = logging.getLogger(__name__)
+
 # Load environment variables from .env file
 load_dotenv()
 
@@ -78,555 +82,1520 @@ st.set_page_config(
     initial_sidebar_state="collapsed"  # Collapsed for modern footer nav
 )
 
+PLACEMENT_DB_PATH = "placement_dashboard.db"
+
+# WAL journaling lets dashboard reads proceed while analyses are written;
+# the DDL runs inside one transaction so first start-up pays a single fsync
+PLACEMENT_DB_SCHEMA = """
+    PRAGMA journal_mode=WAL;
+    PRAGMA synchronous=NORMAL;
+    PRAGMA temp_store=MEMORY;
+    BEGIN;
+    CREATE TABLE IF NOT EXISTS job_descriptions (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        role_title TEXT NOT NULL,
+        company TEXT,
+        location TEXT,
+        must_have_skills TEXT,
+        good_to_have_skills TEXT,
+        qualifications TEXT,
+        experience_years INTEGER,
+        created_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        raw_jd TEXT
+    );
+    CREATE TABLE IF NOT EXISTS resume_analysis (
+        id INTEGER PRIMARY KEY AUTOINCREMENT,
+        job_id INTEGER,
+        candidate_name TEXT,
+        resume_filename TEXT,
+        relevance_score REAL,
+        verdict TEXT,
+        matched_skills TEXT,
+        missing_skills TEXT,
+        semantic_score REAL,
+        analysis_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+        full_analysis TEXT,
+        FOREIGN KEY (job_id) REFERENCES job_descriptions (id)
+    );
+    CREATE INDEX IF NOT EXISTS idx_ra_job_id ON resume_analysis(job_id);
+    CREATE INDEX IF NOT EXISTS idx_ra_verdict_score ON resume_analysis(verdict, relevance_score DESC);
+    CREATE INDEX IF NOT EXISTS idx_ra_date ON resume_analysis(analysis_date);
+    CREATE INDEX IF NOT EXISTS idx_jd_role ON job_descriptions(role_title);
+    COMMIT;
+"""
 
-class ResumeApp:
-    def __init__(self):
-        """Initialize the application"""
-        if 'form_data' not in st.session_state:
-            st.session_state.form_data = {
-                'personal_info': {
-                    'full_name': '',
-                    'email': '',
-                    'phone': '',
-                    'location': '',
-                    'linkedin': '',
-                    'portfolio': ''
-                },
-                'summary': '',
-                'experiences': [],
-                'education': [],
-                'projects': [],
-                'skills_categories': {
-                    'technical': [],
-                    'soft': [],
-                    'languages': [],
-                    'tools': []
-                }
-            }
+# Statements reused on the shared connection; keeping one string per statement
+# lets sqlite3's statement cache skip re-parsing on every call
+INSERT_JOB_DESCRIPTION = """
+    INSERT INTO job_descriptions
+    (role_title, company, location, must_have_skills, good_to_have_skills,
+     qualifications, experience_years, raw_jd)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+"""
+INSERT_RESUME_ANALYSIS = """
+    INSERT INTO resume_analysis
+    (job_id, candidate_name, resume_filename, relevance_score, verdict,
+     matched_skills, missing_skills, semantic_score, full_analysis)
+    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+"""
 
-        # Initialize navigation state
-        if 'page' not in st.session_state:
-            st.session_state.page = 'home'
 
-        # Initialize admin state
-        if 'is_admin' not in st.session_state:
-            st.session_state.is_admin = False
+@st.cache_resource
+def _get_placement_conn():
+    """Open the placement dashboard database once per server process"""
+    conn = sqlite3.connect(PLACEMENT_DB_PATH, check_same_thread=False)
+    conn.executescript(PLACEMENT_DB_SCHEMA)
+    # Refresh planner statistics so the new indexes are used
+    conn.execute("ANALYZE")
+    return conn
+
+
+@st.cache_resource
+def _placement_lock():
+    """Lock serializing writes on the shared placement connection"""
+    return threading.Lock()
+
+
+# Pooled HTTP session so repeated asset fetches reuse connections
+_HTTP_SESSION = requests.Session()
+_HTTP_SESSION.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=8,
+                                            max_retries=Retry(total=2, backoff_factor=0.2)))
+
+
+@st.cache_data(ttl=86400, show_spinner=False)
+def load_lottie_url(url: str):
+    """Load Lottie animation from URL"""
+    try:
+        r = _HTTP_SESSION.get(url, timeout=5)
+    except requests.RequestException:
+        return None
+    if r.status_code != 200:
+        return None
+    return r.json()
+
+
+EXPORT_QUERY = """
+    SELECT
+        rd.name, rd.email, rd.phone, rd.linkedin, rd.github, rd.portfolio,
+        rd.summary, rd.target_role, rd.target_category,
+        rd.education, rd.experience, rd.projects, rd.skills,
+        ra.ats_score, ra.keyword_match_score, ra.format_score, ra.section_score,
+        ra.missing_skills, ra.recommendations,
+        rd.created_at
+    FROM resume_data rd
+    LEFT JOIN resume_analysis ra ON rd.id = ra.resume_id
+"""
 
-        self.pages = {
-            "🏠 HOME": self.render_home,
-            "🔍 RESUME ANALYZER": self.render_analyzer,
-            "⌖ RESUME RADAR": self.render_resume_radar,
-            "🎯 PLACEMENT DASHBOARD": self.render_placement_dashboard,
-            "📝 RESUME BUILDER": self.render_builder,
-            "📊 DASHBOARD": self.render_dashboard,
-            "🎯 JOB SEARCH": self.render_job_search,
-            "ℹ️ ABOUT": self.render_about
-        }
 
-        # Initialize dashboard manager
-        self.dashboard_manager = DashboardManager()
-        
-        # Initialize job description parser for placement dashboard
-        self.jd_parser = JobDescriptionParser()
-        
-        # Initialize footer navigation
-        self.footer_nav = FooterNavigation()
+@with_database_lock
+def _export_fingerprint():
+    """Cheap summary of the export tables used as the cache key"""
+    cursor = get_database_connection().cursor()
+    cursor.execute("""
+        SELECT (SELECT MAX(id) FROM resume_data),
+               (SELECT MAX(id) FROM resume_analysis),
+               (SELECT COUNT(*) FROM resume_data),
+               (SELECT COUNT(*) FROM resume_analysis)
+    """)
+    return cursor.fetchone()
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+@with_database_lock
+def _build_export_workbook(fingerprint):
+    """Stream the export JOIN into an xlsx workbook; cached per table fingerprint"""
+    output = io.BytesIO()
+    workbook = xlsxwriter.Workbook(output, {'constant_memory': True})
+    worksheet = workbook.add_worksheet('Resume Data')
+    # Rows go straight from the SQLite cursor to the worksheet; no DataFrame
+    # is built because xlsxwriter consumes plain Python values anyway
+    cursor = get_database_connection().cursor()
+    cursor.execute(EXPORT_QUERY)
+    worksheet.write_row(0, 0, [col[0] for col in cursor.description])
+    row_idx = 1
+    while True:
+        rows = cursor.fetchmany(5000)
+        if not rows:
+            break
+        for values in rows:
+            worksheet.write_row(row_idx, 0, values)
+            row_idx += 1
+    workbook.close()
+    return output.getvalue()
+
+
+@st.cache_data(max_entries=32, show_spinner=False)
+def _load_image_data_url(image_name):
+    """Find an image in the app's asset folders and return it as a base64 data URL"""
+    app_dir = os.path.dirname(os.path.abspath(__file__))
+    # Try multiple possible paths for deployment compatibility
+    for folder in ("assets", "static", "images", ""):
+        image_path = os.path.join(app_dir, folder, image_name)
+        try:
+            with open(image_path, "rb") as f:
+                encoded = base64.b64encode(f.read()).decode("ascii")
+            return f"data:image/png;base64,{encoded}"
+        except OSError:
+            continue
+
+    # If no local image found, return None (will use GitHub avatar as fallback)
+    return None
+
+
+@st.cache_data(show_spinner=False)
+def get_image_as_base64(file_path):
+    """Load a JPEG file as a base64 data URL"""
+    try:
+        with open(file_path, "rb") as image_file:
+            encoded = base64.b64encode(image_file.read()).decode("ascii")
+            return f"data:image/jpeg;base64,{encoded}"
+    except OSError:
+        return None
+
+
+def _upload_key(file_buffer):
+    """Short content hash of an uploaded file, used as a cache key"""
+    return hashlib.blake2b(file_buffer, digest_size=16).hexdigest()
+
+
+@st.cache_data(ttl=3600, max_entries=64, show_spinner=False)
+def _extract_text(file_key, mime, _file_buffer):
+    """Extract text from an uploaded resume; cached on its content hash"""
+    # _file_buffer is a zero-copy view that st.cache_data does not hash
+    analyzer = _get_services().analyzer
+    if mime == "application/pdf":
+        return analyzer.extract_text_from_pdf(_file_buffer)
+    elif mime == "application/vnd.openxmlformats-officedocument.wordprocessingml.document":
+        return analyzer.extract_text_from_docx(io.BytesIO(_file_buffer))
+    # Decoded straight from the buffer view, no bytes copy; stray bytes become U+FFFD
+    return str(_file_buffer, 'utf-8', errors='replace')
+
+
+@st.cache_data(ttl=3600, max_entries=64, show_spinner=False)
+def _extract_ai_text(file_key, mime, _file_buffer):
+    """Extract text for the AI analyzer (pdfplumber with OCR fallback); cached like _extract_text"""
+    ai_analyzer = _get_services().ai_analyzer
+    if mime == "application/pdf":
+        return ai_analyzer.extract_text_from_pdf(_file_buffer)
+    elif mime == "application/vnd.openxmlformats-officedocument.wordprocessingml.document":
+        return ai_analyzer.extract_text_from_docx(io.BytesIO(_file_buffer))
+    return str(_file_buffer, 'utf-8', errors='replace')
+
+
+@st.cache_data(ttl=3600, max_entries=64, show_spinner=False)
+def _analyze_resume(text, category, role):
+    """Run the standard resume analysis; cached per (text, category, role)"""
+    role_info = JOB_ROLES[category][role]
+    return _get_services().analyzer.analyze_resume({'raw_text': text}, role_info)
+
+
+# How long a finished Gemini analysis is reused for the same resume, role and job description
+AI_ANALYSIS_TTL = 24 * 3600
+# Most analyses kept at once; the oldest are dropped first
+AI_ANALYSIS_MAX_ENTRIES = 200
+
+
+@st.cache_resource
+def _ai_analysis_store():
+    """Finished Gemini analyses shared across sessions: key -> (saved_at, result), oldest first"""
+    return {}
+
+
+@st.cache_resource
+def _ai_analysis_lock():
+    """Lock guarding the shared analysis store"""
+    return threading.Lock()
+
+
+def _stored_ai_analysis(key):
+    """A stored analysis younger than AI_ANALYSIS_TTL, or None"""
+    with _ai_analysis_lock():
+        entry = _ai_analysis_store().get(key)
+    if entry and time.monotonic() - entry[0] < AI_ANALYSIS_TTL:
+        return entry[1]
+    return None
+
+
+def _store_ai_analysis(key, result):
+    """Keep a successful analysis, dropping expired entries and then the oldest past the cap"""
+    store = _ai_analysis_store()
+    now = time.monotonic()
+    with _ai_analysis_lock():
+        # Entries stay in insertion order, so expired ones are at the front
+        store.pop(key, None)
+        while store and (len(store) >= AI_ANALYSIS_MAX_ENTRIES
+                         or now - next(iter(store.values()))[0] >= AI_ANALYSIS_TTL):
+            del store[next(iter(store))]
+        store[key] = (now, result)
+
+
+def _ai_analyze_resume(resume_text, job_role, job_description=None):
+    """Gemini analysis, streamed into the page while it is generated.
+
+    Repeat requests for the same resume, role and job description come from
+    the store without calling Gemini. Errors come back as {"error": ...} and
+    are never stored.
+    """
+    key = (hashlib.blake2b(resume_text.encode(), digest_size=16).hexdigest(), job_role, job_description)
+    result = _stored_ai_analysis(key)
+    if result is not None:
+        return result
+
+    ai_analyzer = _get_services().ai_analyzer
+    live = st.empty()
+    try:
+        with live.container():
+            analysis = st.write_stream(ai_analyzer.analyze_resume_with_gemini_stream(
+                resume_text, job_description=job_description, job_role=job_role))
+    except Exception as e:
+        return {"error": str(e)}
+    finally:
+        # The formatted report replaces the raw streamed text
+        live.empty()
+
+    result = ai_analyzer.gemini_result_from_text(analysis)
+    if result["analysis"]:
+        _store_ai_analysis(key, result)
+    return result
+
+
+@st.cache_resource
+def _db_executor():
+    """Background writer shared by all sessions, so SQLite commits stay off the request path"""
+    return ThreadPoolExecutor(max_workers=2)
+
+
+def _submit_db_write(fn, *args):
+    """Run a database write in the background and keep its future for this session.
+
+    The arguments are deep-copied so later session-state edits can't change what
+    gets written. _report_db_writes checks the outcome on a later run. Writes
+    submitted here must not touch st.cache_data, because they run off the script thread.
+    """
+    future = _db_executor().submit(fn, *copy.deepcopy(args))
+    st.session_state.setdefault('_db_writes', []).append((fn.__name__, future))
+    return future
+
+
+def _report_db_writes():
+    """Warn about this session's finished background writes that failed.
+
+    Runs in the script thread. A write that raised or returned no row ID counts
+    as failed; writes still running are checked again on the next run.
+    """
+    writes = st.session_state.get('_db_writes')
+    if not writes:
+        return
+    pending = []
+    for name, future in writes:
+        if not future.done():
+            pending.append((name, future))
+            continue
+        exc = future.exception()
+        if exc is not None or not future.result():
+            reason = exc if exc is not None else "no row was saved"
+            logger.warning("Background database write %s failed: %s", name, reason)
+            st.warning(f"⚠️ Some results could not be saved to the database: {reason}")
+    st.session_state['_db_writes'] = pending
+
+
+def _save_resume_with_analysis(resume_data, analysis_data):
+    """Save a resume and its analysis, linking the analysis to the new resume ID"""
+    resume_id = save_resume_data(resume_data)
+    if not resume_id:
+        return None
+    analysis_data['resume_id'] = resume_id
+    return save_analysis_data(resume_id, analysis_data)
+
+
+# (analysis key, emoji, heading) for each section of the suggestions card
+SUGGESTION_SECTIONS = (
+    ('contact_suggestions', '📞', 'Contact Information'),
+    ('summary_suggestions', '📝', 'Professional Summary'),
+    ('skills_suggestions', '🎯', 'Skills'),
+    ('experience_suggestions', '💼', 'Work Experience'),
+    ('education_suggestions', '🎓', 'Education'),
+    ('format_suggestions', '📄', 'Formatting'),
+)
 
-        self.analyzer = ResumeAnalyzer()
-        self.ai_analyzer = AIResumeAnalyzer()
-        self.builder = ResumeBuilder()
-        self.resume_radar = ResumeRadarService()
-        self.job_roles = JOB_ROLES
-        self.matcher = ResumeJDMatcher()
-        
-        # Initialize placement dashboard database
-        self._initialize_placement_database()
 
-    def _initialize_placement_database(self):
-        """Initialize SQLite database for placement dashboard"""
-        import sqlite3
-        db_path = "placement_dashboard.db"
-        conn = sqlite3.connect(db_path)
-        
-        # Create tables
-        conn.execute('''
-            CREATE TABLE IF NOT EXISTS job_descriptions (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                role_title TEXT NOT NULL,
-                company TEXT,
-                location TEXT,
-                must_have_skills TEXT,
-                good_to_have_skills TEXT,
-                qualifications TEXT,
-                experience_years INTEGER,
-                created_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                raw_jd TEXT
-            )
-        ''')
-        
-        conn.execute('''
-            CREATE TABLE IF NOT EXISTS resume_analysis (
-                id INTEGER PRIMARY KEY AUTOINCREMENT,
-                job_id INTEGER,
-                candidate_name TEXT,
-                resume_filename TEXT,
-                relevance_score REAL,
-                verdict TEXT,
-                matched_skills TEXT,
-                missing_skills TEXT,
-                semantic_score REAL,
-                analysis_date TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
-                full_analysis TEXT,
-                FOREIGN KEY (job_id) REFERENCES job_descriptions (id)
-            )
-        ''')
-        
-        conn.commit()
-        conn.close()
-        self.job_roles = JOB_ROLES
+SUGGESTION_PREFIX = "- ✓ "
+NESTED_BULLET_PREFIX = "    - "
 
-        # Initialize session state
-        if 'user_id' not in st.session_state:
-            st.session_state.user_id = 'default_user'
-        if 'selected_role' not in st.session_state:
-            st.session_state.selected_role = None
 
-        # Initialize database
-        init_database()
+def bullet_list(items):
+    """Join items into one '•' list string so it renders as a single element"""
+    return "\n\n".join("• " + str(item) for item in items)
 
-        # Load external CSS (conditional loading)
-        try:
-            import os
-            css_path = os.path.join(os.path.dirname(__file__), 'style', 'style.css')
-            if os.path.exists(css_path):
-                with open(css_path, 'r', encoding='utf-8') as f:
-                    st.markdown(f'<style>{f.read()}</style>', unsafe_allow_html=True)
-            else:
-                # Fallback: use inline basic styling
-                st.markdown("""
-                <style>
-                .main { padding: 1rem; }
-                .stApp { background-color: #f0f2f6; }
-                </style>
-                """, unsafe_allow_html=True)
-        except Exception as e:
-            st.warning(f"CSS loading failed, using default styling: {e}")
 
-        # Load Google Fonts
-        st.markdown("""
-            <link href="https://fonts.googleapis.com/css2?family=Roboto:wght@400;500;700&family=Poppins:wght@400;500;600&display=swap" rel="stylesheet">
-            <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/5.15.4/css/all.min.css">
-        """, unsafe_allow_html=True)
+def render_suggestion_block(title, emoji, items, missing_skills=()):
+    """Render one suggestions section with native elements in a bordered container"""
+    body = "\n".join(SUGGESTION_PREFIX + str(s) for s in items)
+    if missing_skills:
+        body += ("\n" + SUGGESTION_PREFIX + "Consider adding these relevant skills:\n" +
+                 "\n".join(NESTED_BULLET_PREFIX + str(skill) for skill in missing_skills))
+    with st.container(border=True):
+        st.subheader(f"{emoji} {title}")
+        st.markdown(body)
 
-        if 'resume_data' not in st.session_state:
-            st.session_state.resume_data = []
-        if 'ai_analysis_stats' not in st.session_state:
-            st.session_state.ai_analysis_stats = {
-                'score_distribution': {},
-                'total_analyses': 0,
-                'average_score': 0
-            }
 
-    def load_lottie_url(self, url: str):
-        """Load Lottie animation from URL"""
-        r = requests.get(url)
-        if r.status_code != 200:
-            return None
-        return r.json()
+VIDEO_FRAME_TEMPLATE = (
+    '<iframe src="https://www.youtube.com/embed/{video_id}" title="{title}" loading="lazy" allowfullscreen '
+    'style="width: 100%; aspect-ratio: 16 / 9; border: 0; border-radius: 10px;"></iframe>'
+)
 
-    def apply_global_styles(self):
-        st.markdown("""
-        <style>
-        /* Custom Scrollbar */
-        ::-webkit-scrollbar {
-            width: 8px;
-            height: 8px;
-        }
 
-        ::-webkit-scrollbar-track {
-            background: #1a1a1a;
-            border-radius: 4px;
-        }
+COURSE_CARD_TEMPLATE = (
+    "<div style='background-color: #1e1e1e; padding: 15px; border-radius: 10px;'>"
+    "<h4>{name}</h4><a href='{url}' target='_blank' rel='noopener'>View Course</a></div>"
+)
 
-        ::-webkit-scrollbar-thumb {
-            background: #4CAF50;
-            border-radius: 4px;
-        }
 
-        ::-webkit-scrollbar-thumb:hover {
-            background: #45a049;
-        }
+def course_grid_html(courses):
+    """Two-column grid of course cards, emitted as a single markdown element"""
+    cards = "".join(COURSE_CARD_TEMPLATE.format(name=name, url=url) for name, url in courses)
+    return f"<div style='display: grid; grid-template-columns: 1fr 1fr; gap: 10px; margin: 10px 0;'>{cards}</div>"
 
-        /* Global Styles */
-        .main-header {
-            background: linear-gradient(135deg, #4CAF50 0%, #45a049 100%);
-            padding: 2rem;
-            border-radius: 15px;
-            margin-bottom: 2rem;
-            box-shadow: 0 10px 20px rgba(0,0,0,0.2);
-            text-align: center;
-            position: relative;
-            overflow: hidden;
-        }
 
-        .main-header::before {
-            content: '';
-            position: absolute;
-            top: 0;
-            left: 0;
-            width: 100%;
-            height: 100%;
-            background: linear-gradient(45deg, transparent 0%, rgba(255,255,255,0.1) 100%);
-            z-index: 1;
-        }
+def render_video_gallery(videos_by_category):
+    """Show each category's videos as one two-column grid of lazily loaded YouTube embeds"""
+    for category, videos in videos_by_category.items():
+        # Links are youtu.be/<id> share URLs
+        frames = "".join(
+            VIDEO_FRAME_TEMPLATE.format(video_id=url.rsplit('/', 1)[-1], title=title.replace('"', '&quot;'))
+            for title, url in videos
+        )
+        st.markdown(
+            f"### {category}\n\n"
+            f"<div style='display: grid; grid-template-columns: repeat(2, 1fr); gap: 1rem;'>{frames}</div>",
+            unsafe_allow_html=True)
 
-        .main-header h1 {
-            color: white;
-            font-size: 2.5rem;
-            font-weight: 600;
-            margin: 0;
-            position: relative;
-            z-index: 2;
-        }
 
-        /* Template Card Styles */
-        .template-container {
-            display: grid;
-            grid-template-columns: repeat(auto-fit, minmax(320px, 1fr));
-            gap: 2rem;
-            padding: 1rem;
-        }
+def render_learning_resources():
+    """Resume and interview tip videos in tabs"""
+    tab1, tab2 = st.tabs(["Resume Tips", "Interview Tips"])
 
-        .template-card {
-            background: rgba(45, 45, 45, 0.9);
-            border-radius: 20px;
-            padding: 2rem;
-            position: relative;
-            overflow: hidden;
-            backdrop-filter: blur(10px);
-            border: 1px solid rgba(255,255,255,0.1);
-            transition: all 0.4s cubic-bezier(0.4, 0, 0.2, 1);
-        }
+    with tab1:
+        render_video_gallery(RESUME_VIDEOS)
 
-        .template-card:hover {
-            transform: translateY(-10px);
-            box-shadow: 0 20px 40px rgba(0,0,0,0.3);
-            border-color: #4CAF50;
-        }
+    with tab2:
+        render_video_gallery(INTERVIEW_VIDEOS)
 
-        .template-card::before {
-            content: '';
-            position: absolute;
-            top: 0;
-            left: 0;
-            width: 100%;
-            height: 100%;
-            background: linear-gradient(45deg, transparent 0%, rgba(76,175,80,0.1) 100%);
-            z-index: 1;
-        }
 
-        .template-icon {
-            font-size: 3rem;
-            color: #4CAF50;
-            margin-bottom: 1.5rem;
-            position: relative;
-            z-index: 2;
-        }
+def _snow_once():
+    """Play the snow animation for the first analysis of the session only"""
+    if not st.session_state.get('_snowed'):
+        st.snow()
+        st.session_state['_snowed'] = True
 
-        .template-title {
-            font-size: 1.8rem;
-            font-weight: 600;
-            color: white;
-            margin-bottom: 1rem;
-            position: relative;
-            z-index: 2;
-        }
 
-        .template-description {
-            color: #aaa;
-            margin-bottom: 1.5rem;
-            position: relative;
-            z-index: 2;
-            line-height: 1.6;
-        }
+def _offer_resume_download(buffer, name_slug):
+    """Show the download button for a generated resume.
 
-        /* Feature List Styles */
-        .feature-list {
-            list-style: none;
-            padding: 0;
-            margin: 1.5rem 0;
-            position: relative;
-            z-index: 2;
-        }
+    The button gets buffer.getvalue itself, so the document bytes are only
+    copied out of the buffer when the user clicks download.
+    """
+    st.download_button(
+        label="Download Resume 📥",
+        data=buffer.getvalue,
+        file_name=f"{name_slug}_resume.docx",
+        mime="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
+        on_click=st.balloons
+    )
 
-        .feature-item {
-            display: flex;
-            align-items: center;
-            margin-bottom: 1rem;
-            color: #ddd;
-            font-size: 0.95rem;
-        }
 
-        .feature-icon {
-            color: #4CAF50;
-            margin-right: 0.8rem;
-            font-size: 1.1rem;
-        }
+@st.cache_data(show_spinner=False)
+def parse_lines(text):
+    """Split a one-item-per-line text area value into a tuple of clean entries"""
+    return tuple(filter(None, map(str.strip, text.splitlines())))
+
+
+def split_raw_fields(entry, fields):
+    """Copy of a builder entry with each `<field>_raw` text area split into its `field` list"""
+    split = {key: value for key, value in entry.items() if not key.endswith('_raw')}
+    for field in fields:
+        split[field] = list(parse_lines(entry.get(f'{field}_raw', '')))
+    return split
+
+
+@st.cache_data
+def _load_css(filename):
+    """Read a stylesheet from the style directory once and minify it"""
+    css_path = os.path.join(os.path.dirname(__file__), 'style', filename)
+    with open(css_path, 'r', encoding='utf-8') as f:
+        css = f.read()
+    css = re.sub(r'/\*.*?\*/', '', css, flags=re.S)
+    return re.sub(r'\s+', ' ', css).strip()
+
+
+@st.cache_resource
+def _get_services():
+    """Build the stateless analysis services once and share them across reruns"""
+    # Imported here so pages that never touch these services skip their start-up cost
+    from utils.ai_resume_analyzer import AIResumeAnalyzer
+    from resume_radar.resume_radar_service import ResumeRadarService
+    from resume_radar.jd_parser import JobDescriptionParser
+    from resume_radar.matching_engine import ResumeJDMatcher
+
+    return SimpleNamespace(
+        analyzer=ResumeAnalyzer(),
+        ai_analyzer=AIResumeAnalyzer(),
+        builder=ResumeBuilder(),
+        resume_radar=ResumeRadarService(),
+        jd_parser=JobDescriptionParser(),
+        matcher=ResumeJDMatcher()
+    )
 
-        /* Button Styles */
-        .action-button {
-            background: linear-gradient(135deg, #4CAF50 0%, #45a049 100%);
-            color: white;
-            padding: 1rem 2rem;
-            border-radius: 50px;
-            border: none;
-            font-weight: 500;
-            cursor: pointer;
-            width: 100%;
-            text-align: center;
-            position: relative;
-            overflow: hidden;
-            z-index: 2;
-            transition: all 0.4s cubic-bezier(0.4, 0, 0.2, 1);
-        }
 
-        .action-button:hover {
-            transform: translateY(-2px);
-            box-shadow: 0 10px 20px rgba(76,175,80,0.3);
-        }
+# Below this many AI analyses the statistics expander shows plain metrics instead of charts
+AI_STATS_CHART_THRESHOLD = 10
 
-        .action-button::before {
-            content: '';
-            position: absolute;
-            top: 0;
-            left: -100%;
-            width: 100%;
-            height: 100%;
-            background: linear-gradient(90deg, transparent 0%, rgba(255,255,255,0.2) 50%, transparent 100%);
-            transition: all 0.6s ease;
-        }
 
-        .action-button:hover::before {
-            left: 100%;
-        }
+def render_compact_ai_stats(ai_stats):
+    """Headline AI analysis numbers as native metrics, used instead of the cards and gauge for small datasets"""
+    col1, col2 = st.columns(2)
+    col1.metric("Total AI Analyses", ai_stats["total_analyses"])
+    col2.metric("Average Resume Score", f"{ai_stats['average_score']}/100")
 
-        /* Form Section Styles */
-        .form-section {
-            background: rgba(45, 45, 45, 0.9);
-            border-radius: 20px;
-            padding: 2rem;
-            margin: 2rem 0;
-            backdrop-filter: blur(10px);
-            border: 1px solid rgba(255,255,255,0.1);
-        }
 
-        .form-section-title {
-            font-size: 1.8rem;
-            font-weight: 600;
-            color: white;
-            margin-bottom: 1.5rem;
-            padding-bottom: 0.8rem;
-            border-bottom: 2px solid #4CAF50;
-        }
+# AI score bands, low / medium / high; every per-band lookup below is indexed by score_band
+SCORE_THRESHOLDS = (60, 80)
+SCORE_COLORS = ("#FF5252", "#FFEB3B", "#38ef7d")
+GAUGE_BAR_COLORS = ("#FF4444", "#FFA500", "#4CAF50")
+SCORE_STATUS = ("Needs Improvement", "Good", "Excellent")
+MATCH_STATUS = ("Low Match", "Good Match", "Excellent Match")
 
-        .form-group {
-            margin-bottom: 1.5rem;
-        }
 
-        .form-label {
-            color: #ddd;
-            font-weight: 500;
-            margin-bottom: 0.8rem;
-            display: block;
-        }
+def score_band(score):
+    """0, 1 or 2 for a low, medium or high AI score"""
+    return bisect.bisect_right(SCORE_THRESHOLDS, score)
 
-        .form-input {
-            width: 100%;
-            padding: 1rem;
-            border-radius: 10px;
-            border: 1px solid rgba(255,255,255,0.1);
-            background: rgba(30, 30, 30, 0.9);
-            color: white;
-            transition: all 0.3s ease;
-        }
 
-        .form-input:focus {
-            border-color: #4CAF50;
-            box-shadow: 0 0 0 2px rgba(76,175,80,0.2);
-            outline: none;
-        }
+def score_color(score):
+    """Accent color for an AI resume score: green, yellow or red"""
+    return SCORE_COLORS[score_band(score)]
 
-        /* Skill Tags */
-        .skill-tag-container {
-            display: flex;
-            flex-wrap: wrap;
-            gap: 0.8rem;
-            margin-top: 1rem;
-        }
 
-        .skill-tag {
-            background: rgba(76,175,80,0.1);
-            color: #4CAF50;
-            padding: 0.6rem 1.2rem;
-            border-radius: 50px;
-            border: 1px solid #4CAF50;
-            font-size: 0.9rem;
-            transition: all 0.3s ease;
-            cursor: pointer;
+@functools.lru_cache(maxsize=512)
+def _format_analysis_date(date_str):
+    """'2024-05-01 13:45:00' -> 'May 01, 2024'; recent rows share dates, so cache them"""
+    return datetime.datetime.strptime(date_str, "%Y-%m-%d %H:%M:%S").strftime("%b %d, %Y")
+
+
+def _analysis_date_label(date_str):
+    """Short date for the recent analyses table; anything not shaped like
+    "YYYY-MM-DD HH:MM:SS" is shown as stored"""
+    if (isinstance(date_str, str) and len(date_str) == 19 and date_str[4] == '-'
+            and date_str[7] == '-' and date_str[10] == ' '):
+        return _format_analysis_date(date_str)
+    return date_str
+
+
+def _score_cell_styles(scores):
+    """Styler callback: color each score cell like the average score card"""
+    return [f"background-color: {score_color(score)}; color: #1a1a2e; font-weight: bold"
+            for score in scores]
+
+
+def recent_analyses_frame(recent_analyses):
+    """Recent AI analyses as a styled DataFrame for st.dataframe"""
+    rows = [
+        {
+            "AI Model": analysis["model"],
+            "Score": analysis["score"],
+            "Job Role": analysis["job_role"],
+            "Date": _analysis_date_label(analysis["date"]),
         }
+        for analysis in recent_analyses
+    ]
+    if not PANDAS_AVAILABLE:
+        return rows
+    return pd.DataFrame(rows).style.apply(_score_cell_styles, subset=["Score"])
+
+
+# Plotly config for purely informational charts: no hover wiring or mode bar
+STATIC_CHART_CONFIG = {"staticPlot": True, "displayModeBar": False}
+
+
+@st.cache_resource(show_spinner=False)
+def _result_gauge_template():
+    """Gauge skeleton shared by the AI analysis score gauges"""
+    import plotly.graph_objects as go
+    fig = go.Figure(go.Indicator(
+        mode="gauge+number",
+        domain={'x': [0, 1], 'y': [0, 1]},
+        title={'font': {'size': 16}},
+        gauge={
+            'axis': {'range': [0, 100], 'tickwidth': 1},
+            'bgcolor': "white",
+            'borderwidth': 2,
+            'bordercolor': "gray",
+            'steps': [
+                {'range': [0, 40], 'color': 'rgba(255, 68, 68, 0.2)'},
+                {'range': [40, 60], 'color': 'rgba(255, 165, 0, 0.2)'},
+                {'range': [60, 80], 'color': 'rgba(255, 214, 0, 0.2)'},
+                {'range': [80, 100], 'color': 'rgba(76, 175, 80, 0.2)'}
+            ],
+            'threshold': {
+                'line': {'color': "red", 'width': 4},
+                'thickness': 0.75,
+                'value': 60
+            }
+        }
+    ))
+    fig.update_layout(
+        height=250,
+        margin=dict(l=20, r=20, t=50, b=20),
+    )
+    return fig
+
+
+@st.cache_data(show_spinner=False)
+def build_result_gauge(value, title):
+    """Copy the cached gauge skeleton and fill in one score; cached per (score, title)"""
+    import plotly.graph_objects as go
+    fig = go.Figure(_result_gauge_template())
+    fig.update_traces(
+        value=value,
+        title_text=title,
+        gauge_bar_color=GAUGE_BAR_COLORS[score_band(value)],
+        selector=dict(type="indicator"),
+    )
+    return fig
+
+
+# AI analyzer statistics charts. Built from plain tuples so the cache key is
+# cheap to hash, and reused across reruns until the stats change or the TTL expires.
+# A fixed uirevision lets Plotly keep the existing chart state when a figure is re-sent.
+@st.cache_data(ttl=300, show_spinner=False)
+def build_score_gauge(average_score, bar_color):
+    """Gauge chart for the average AI resume score"""
+    import plotly.graph_objects as go
+    fig = go.Figure(go.Indicator(
+        mode="gauge+number",
+        value=average_score,
+        domain={'x': [0, 1], 'y': [0, 1]},
+        title={'text': "Score", 'font': {'size': 14, 'color': 'white'}},
+        gauge={
+            'axis': {'range': [0, 100], 'tickwidth': 1, 'tickcolor': "white"},
+            'bar': {'color': bar_color},
+            'bgcolor': "rgba(0,0,0,0)",
+            'borderwidth': 2,
+            'bordercolor': "white",
+            'steps': [
+                {'range': [0, 40], 'color': 'rgba(255, 82, 82, 0.3)'},
+                {'range': [40, 70], 'color': 'rgba(255, 235, 59, 0.3)'},
+                {'range': [70, 100], 'color': 'rgba(56, 239, 125, 0.3)'}
+            ],
+        }
+    ))
+
+    fig.update_layout(
+        uirevision="stats",
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        font={'color': "white"},
+        height=150,
+        margin=dict(l=10, r=10, t=30, b=10)
+    )
+    return fig
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def build_model_usage_pie(model_usage):
+    """Donut chart of analyses per AI model, from (model, count) pairs"""
+    import plotly.express as px
+    fig = px.pie(
+        values=[count for _, count in model_usage],
+        names=[model for model, _ in model_usage],
+        color_discrete_sequence=px.colors.qualitative.Bold,
+        hole=0.4
+    )
+
+    fig.update_traces(
+        textposition='inside',
+        textinfo='percent+label',
+        marker=dict(line=dict(color='#000000', width=1.5))
+    )
 
-        .skill-tag:hover {
-            background: #4CAF50;
-            color: white;
-            transform: translateY(-2px);
-            box-shadow: 0 5px 15px rgba(76,175,80,0.2);
+    fig.update_layout(
+        margin=dict(l=20, r=20, t=30, b=20),
+        height=300,
+        uirevision="stats",
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        font=dict(color="#ffffff", size=14),
+        legend=dict(
+            orientation="h",
+            yanchor="bottom",
+            y=-0.1,
+            xanchor="center",
+            x=0.5
+        ),
+        title={
+            'text': 'AI Model Distribution',
+            'y': 0.95,
+            'x': 0.5,
+            'xanchor': 'center',
+            'yanchor': 'top',
+            'font': {'size': 18, 'color': 'white'}
         }
+    )
+    return fig
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def build_top_roles_bar(top_roles):
+    """Bar chart of the most analyzed job roles, from (role, count) pairs"""
+    import plotly.express as px
+    counts = [count for _, count in top_roles]
+    fig = px.bar(
+        x=[role for role, _ in top_roles],
+        y=counts,
+        color=counts,
+        color_continuous_scale=px.colors.sequential.Viridis,
+        labels={"x": "Job Role", "y": "Number of Analyses", "color": "Number of Analyses"}
+    )
+
+    fig.update_traces(
+        marker_line_width=1.5,
+        marker_line_color="white",
+        opacity=0.9
+    )
+
+    fig.update_layout(
+        margin=dict(l=20, r=20, t=50, b=30),
+        height=350,
+        uirevision="stats",
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        font=dict(color="#ffffff", size=14),
+        title={
+            'text': 'Most Analyzed Job Roles',
+            'y': 0.95,
+            'x': 0.5,
+            'xanchor': 'center',
+            'yanchor': 'top',
+            'font': {'size': 18, 'color': 'white'}
+        },
+        xaxis=dict(
+            title="",
+            tickangle=-45,
+            tickfont=dict(size=12)
+        ),
+        yaxis=dict(
+            title="Number of Analyses",
+            gridcolor="rgba(255, 255, 255, 0.1)"
+        ),
+        coloraxis_showscale=False
+    )
+    return fig
+
+
+@st.cache_data(show_spinner=False)
+def _mock_trend(total, seed=42):
+    """Spread `total` analyses over 7 days; seeded so the chart is stable between reruns"""
+    if total > 7:
+        import numpy as np
+        rng = np.random.default_rng(seed)
+        values = [round(v) for v in rng.dirichlet(np.ones(7)) * total]
+        # Adjust to make sure sum equals total
+        values[-1] += total - sum(values)
+    else:
+        values = [0] * 7
+        for i in range(total):
+            values[-(i % 7) - 1] += 1
+    return values
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def build_trend_line(total):
+    """Conceptual 7-day activity chart spreading `total` analyses over the last week"""
+    import plotly.express as px
+
+    # Dates move on with the day because the cache entry expires after the TTL
+    today = datetime.date.today()
+    dates = [(today - datetime.timedelta(days=i)).strftime('%Y-%m-%d') for i in range(7)]
+    dates.reverse()
+    values = _mock_trend(total)
+
+    fig = px.line(
+        x=dates,
+        y=values,
+        labels={'x': 'Date', 'y': 'Analyses'},
+        markers=True,
+        line_shape='spline',
+        color_discrete_sequence=["#38ef7d"]
+    )
+
+    fig.update_traces(
+        line=dict(width=3),
+        marker=dict(size=8, line=dict(width=2, color='white'))
+    )
+
+    fig.update_layout(
+        margin=dict(l=20, r=20, t=50, b=30),
+        height=300,
+        uirevision="stats",
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        font=dict(color="#ffffff", size=14),
+        title={
+            'text': 'Analysis Activity (Last 7 Days)',
+            'y': 0.95,
+            'x': 0.5,
+            'xanchor': 'center',
+            'yanchor': 'top',
+            'font': {'size': 18, 'color': 'white'}
+        },
+        xaxis=dict(
+            title="",
+            gridcolor="rgba(255, 255, 255, 0.1)"
+        ),
+        yaxis=dict(
+            title="Number of Analyses",
+            gridcolor="rgba(255, 255, 255, 0.1)"
+        )
+    )
+    return fig
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def build_score_distribution_bar(score_distribution):
+    """Bar chart of resume scores per range, from (range, count) pairs"""
+    import plotly.express as px
+    ranges = [score_range for score_range, _ in score_distribution]
+    counts = [count for _, count in score_distribution]
+
+    fig = px.bar(
+        x=ranges,
+        y=counts,
+        color=ranges,
+        color_discrete_map={
+            "0-20": "#FF5252",
+            "21-40": "#FF7043",
+            "41-60": "#FFEB3B",
+            "61-80": "#8BC34A",
+            "81-100": "#38ef7d"
+        },
+        labels={"x": "Score Range", "y": "Number of Resumes", "color": "Score Range"},
+        text=counts  # Display count values on bars
+    )
+
+    fig.update_traces(
+        marker_line_width=2,
+        marker_line_color="white",
+        opacity=0.9,
+        textposition='outside',
+        textfont=dict(color="white", size=14, family="Arial, sans-serif"),
+        hovertemplate="<b>Score Range:</b> %{x}<br><b>Number of Resumes:</b> %{y}<extra></extra>"
+    )
+
+    # Add a gradient background to the chart
+    fig.update_layout(
+        margin=dict(l=20, r=20, t=50, b=30),
+        height=400,  # Increase height for better visibility
+        uirevision="stats",
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        font=dict(color="#ffffff", size=14, family="Arial, sans-serif"),
+        xaxis=dict(
+            title=dict(text="Score Range", font=dict(size=16, color="white")),
+            categoryorder="array",
+            categoryarray=["0-20", "21-40", "41-60", "61-80", "81-100"],
+            tickfont=dict(size=14, color="white"),
+            gridcolor="rgba(255, 255, 255, 0.1)"
+        ),
+        yaxis=dict(
+            title=dict(text="Number of Resumes", font=dict(size=16, color="white")),
+            tickfont=dict(size=14, color="white"),
+            gridcolor="rgba(255, 255, 255, 0.1)",
+            zeroline=False
+        ),
+        showlegend=False,
+        bargap=0.2,  # Adjust gap between bars
+        shapes=[
+            # Add gradient background
+            dict(
+                type="rect",
+                xref="paper",
+                yref="paper",
+                x0=0,
+                y0=0,
+                x1=1,
+                y1=1,
+                fillcolor="rgba(26, 26, 44, 0.5)",
+                layer="below",
+                line_width=0,
+            )
+        ]
+    )
+
+    # Add annotations for insights
+    if counts:
+        max_range = ranges[counts.index(max(counts))]
+
+        fig.add_annotation(
+            x=0.5,
+            y=1.12,
+            xref="paper",
+            yref="paper",
+            text=f"Most resumes fall in the {max_range} score range",
+            showarrow=False,
+            font=dict(size=14, color="#FFEB3B"),
+            bgcolor="rgba(0,0,0,0.5)",
+            bordercolor="#FFEB3B",
+            borderwidth=1,
+            borderpad=4,
+            opacity=0.8
+        )
+    return fig
+
+
+@st.cache_data(ttl=300, show_spinner=False)
+def build_rating_distribution_bar(rating_distribution):
+    """Resume Radar bar chart of analyses per rating category, from (rating, count) pairs"""
+    import plotly.express as px
+    ratings = [rating for rating, _ in rating_distribution]
+    counts = [count for _, count in rating_distribution]
+
+    fig = px.bar(
+        x=ratings, y=counts,
+        title="Resume Rating Distribution",
+        color=counts,
+        color_continuous_scale='Viridis',
+        labels={"x": "Rating", "y": "Count", "color": "Count"}
+    )
+    fig.update_layout(
+        uirevision="stats",
+        paper_bgcolor='rgba(0,0,0,0)',
+        plot_bgcolor='rgba(0,0,0,0)',
+        font=dict(color="white")
+    )
+    return fig
+
+
+@st.fragment
+def render_ai_stats_panel():
+    """AI analyzer statistics expander. As a fragment, opening it or resetting
+    the stats reruns only this panel, not the analyzer page around it"""
+    # The expander tracks its open state, so the stats queries and charts
+    # are skipped entirely while it is collapsed
+    with st.expander("📊 AI Analyzer Statistics", expanded=False,
+                     key="ai_stats_expander", on_change="rerun") as stats_expander:
+        if stats_expander.open:
+            try:
+                # Add a reset button for admin users
+                if st.session_state.get('is_admin', False):
+                    if st.button("🔄 Reset AI Analysis Statistics", type="secondary",
+                                 key="reset_ai_stats_button_2"):
+                        # Clears the cached stats too, so the query below in this
+                        # same run already shows the reset numbers
+                        result = reset_ai_analysis_stats()
+                        if result["success"]:
+                            st.toast(result["message"])
+                        else:
+                            st.error(result["message"])
+
+                # Get detailed AI analysis statistics
+                ai_stats = get_detailed_ai_analysis_stats()
+
+                if ai_stats["total_analyses"] > 0:
+                    # Small datasets get the cheaper rendering: native metrics instead of
+                    # the cards and gauge, and static charts throughout
+                    compact = ai_stats["total_analyses"] < AI_STATS_CHART_THRESHOLD
+                    chart_config = STATIC_CHART_CONFIG if compact else None
+
+                    if compact:
+                        render_compact_ai_stats(ai_stats)
+                    else:
+                        # Card styles (.stats-card etc.) come from style/style.css
+                        avg_color = score_color(ai_stats["average_score"])
+                        col1, col2, col3 = st.columns(3)
+
+                        with col1:
+                            st.markdown(f"""
+                            <div class="stats-card">
+                                <div class="stats-label">Total AI Analyses</div>
+                                <div class="stats-value">{ai_stats["total_analyses"]}</div>
+                            </div>
+                            """, unsafe_allow_html=True)
+
+                        with col2:
+                            st.markdown(f"""
+                            <div class="stats-card" style="background: linear-gradient(135deg, #2c3e50, {avg_color});">
+                                <div class="stats-label">Average Resume Score</div>
+                                <div class="stats-value">{ai_stats["average_score"]}/100</div>
+                            </div>
+                            """, unsafe_allow_html=True)
+
+                        with col3:
+                            # Create a gauge chart for average score
+                            st.plotly_chart(build_score_gauge(ai_stats["average_score"], avg_color),
+                                            use_container_width=True,
+                                            config=STATIC_CHART_CONFIG)
+
+                    # Display model usage with enhanced visualization
+                    if ai_stats["model_usage"]:
+                        st.markdown("### 🤖 Model Usage")
+                        # Create a more colorful pie chart
+                        model_usage = tuple((m["model"], m["count"]) for m in ai_stats["model_usage"])
+                        st.plotly_chart(build_model_usage_pie(model_usage), use_container_width=True,
+                                        config=STATIC_CHART_CONFIG)
+
+                    # Display top job roles with enhanced visualization
+                    if ai_stats["top_job_roles"]:
+                        st.markdown("### 🎯 Top Job Roles")
+                        # Create a more colorful bar chart
+                        top_roles = tuple((r["role"], r["count"]) for r in ai_stats["top_job_roles"])
+                        st.plotly_chart(build_top_roles_bar(top_roles), use_container_width=True,
+                                        config=chart_config)
+
+                        # Add a timeline chart for analysis over time (mock
+                        # data for now)
+                        st.markdown("### 📈 Analysis Trend")
+                        st.info(
+                            "This is a conceptual visualization. To implement actual time-based analysis, additional data collection would be needed.")
+
+                        # Mock data for the timeline, cached so it doesn't change on every rerun
+                        st.plotly_chart(build_trend_line(ai_stats["total_analyses"]), use_container_width=True,
+                                        config=chart_config)
+
+                    # Display score distribution if available
+                    if ai_stats["score_distribution"]:
+                        st.markdown("""
+                        <h3 style='text-align: center; margin-bottom: 20px; background: linear-gradient(90deg, #4b6cb7, #182848); padding: 15px; border-radius: 10px; color: white; box-shadow: 0 4px 10px rgba(0,0,0,0.2);'>
+                            📊 Score Distribution Analysis
+                        </h3>
+                        """, unsafe_allow_html=True)
+
+                        # Create a more visually appealing bar chart for
+                        # score distribution
+                        score_distribution = tuple(
+                            (d["range"], d["count"]) for d in ai_stats["score_distribution"])
+                        fig = build_score_distribution_bar(score_distribution)
+
+                        # Display the chart in a styled container
+                        st.markdown("""
+                        <div style='background: linear-gradient(135deg, #1e3c72, #2a5298); padding: 20px; border-radius: 15px; margin: 10px 0; box-shadow: 0 5px 15px rgba(0,0,0,0.2);'>
+                        """, unsafe_allow_html=True)
+
+                        st.plotly_chart(fig, use_container_width=True, config=STATIC_CHART_CONFIG)
+
+                        # Add descriptive text below the chart
+                        st.markdown("""
+                        <p style='color: white; text-align: center; font-style: italic; margin-top: 10px;'>
+                            This chart shows the distribution of resume scores across different ranges, helping identify common performance levels.
+                        </p>
+                        </div>
+                        """, unsafe_allow_html=True)
+
+                    # Display recent analyses if available
+                    if ai_stats["recent_analyses"]:
+                        st.markdown("""
+                        <h3 style='text-align: center; margin-bottom: 20px; background: linear-gradient(90deg, #4b6cb7, #182848); padding: 15px; border-radius: 10px; color: white; box-shadow: 0 4px 10px rgba(0,0,0,0.2);'>
+                            🕒 Recent Resume Analyses
+                        </h3>
+                        """, unsafe_allow_html=True)
+
+                        st.dataframe(recent_analyses_frame(ai_stats["recent_analyses"]),
+                                     use_container_width=True, hide_index=True)
+                        st.caption("These are the most recent resume analyses performed by our AI models.")
+                else:
+                    st.info(
+                        "No AI analysis data available yet. Upload and analyze resumes to see statistics here.")
+            except Exception as e:
+                st.error(f"Error loading AI analysis statistics: {str(e)}")
+
+
+# How to read the job match gauge, shown next to it in the AI report
+JOB_MATCH_EXPLAINER_HTML = """
+<div style="background-color: #262730; padding: 20px; border-radius: 10px; height: 100%;">
+    <h4 style="color: #ffffff; margin-bottom: 15px;">What This Means</h4>
+    <p style="color: #ffffff;">This score represents how well your resume matches the specific job description you provided.</p>
+    <ul style="color: #ffffff; padding-left: 20px;">
+        <li><strong>80-100:</strong> Excellent match - your resume is highly aligned with this job</li>
+        <li><strong>60-79:</strong> Good match - your resume matches many requirements</li>
+        <li><strong>Below 60:</strong> Consider tailoring your resume more specifically to this job</li>
+    </ul>
+</div>
+"""
+
+
+# Resume Radar intro and upload prompt
+RADAR_INTRO_HTML = """
+<div style='background-color: #1e1e1e; padding: 20px; border-radius: 10px; margin: 20px 0; border-left: 4px solid #4CAF50;'>
+    <h3>🎯 Three-Pass CV Review System</h3>
+    <p>Resume Radar uses a sophisticated three-pass analysis approach inspired by how humans review CVs:</p>
+    <ol>
+        <li><strong>Global Pass</strong> → Read the entire CV for overall impression with summary of strengths and weaknesses</li>
+        <li><strong>Section Pass</strong> → Review each section (Experience, Education, Skills) in context</li>
+        <li><strong>Granular Pass</strong> → Detailed critique of individual lines/chunks with contextual feedback</li>
+    </ol>
+    <p>📄 Your original PDF will be returned with <span style='color: #4CAF50;'>green highlights</span> for strengths, 
+    <span style='color: #FFA500;'>yellow for areas needing attention</span>, and <span style='color: #FF4444;'>red for critical issues</span>. 
+    Each highlight includes detailed hover tooltips with improvement suggestions!</p>
+</div>
+"""
+
+RADAR_UPLOAD_HTML = """
+<div style='background-color: #2d2d2d; padding: 20px; border-radius: 10px; margin: 20px 0;'>
+    <h3>📤 Upload Your Resume (PDF Only)</h3>
+    <p>Upload your resume in PDF format to get comprehensive AI-powered analysis with annotated feedback.</p>
+</div>
+"""
+
+
+# Placement dashboard look for .metric-card, overriding the shared card style on that page only
+PLACEMENT_CSS = (
+    "<style>.metric-card{background-color:#f0f2f6;padding:1rem;"
+    "border-radius:0.5rem;border-left:4px solid #1f77b4;}</style>"
+)
+
+
+ABOUT_CSS = """
+            <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.0.0/css/all.min.css">
+            <style>
+                .profile-section, .vision-section, .feature-card {
+                    text-align: center;
+                    padding: 2rem;
+                    background: rgba(45, 45, 45, 0.9);
+                    border-radius: 20px;
+                    margin: 2rem auto;
+                    max-width: 800px;
+                }
+
+                .profile-image {
+                    width: 200px;
+                    height: 200px;
+                    border-radius: 50%;
+                    margin: 0 auto 1.5rem;
+                    display: block;
+                    object-fit: cover;
+                    border: 4px solid #4CAF50;
+                }
+
+                .profile-name {
+                    font-size: 2.5rem;
+                    color: white;
+                    margin-bottom: 0.5rem;
+                }
+
+                .profile-title {
+                    font-size: 1.2rem;
+                    color: #4CAF50;
+                    margin-bottom: 1.5rem;
+                }
+
+                .social-links {
+                    display: flex;
+                    justify-content: center;
+                    gap: 1.5rem;
+                    margin: 2rem 0;
+                }
+
+                .social-link {
+                    font-size: 2rem;
+                    color: #4CAF50;
+                    transition: all 0.3s ease;
+                    padding: 0.5rem;
+                    border-radius: 50%;
+                    background: rgba(76, 175, 80, 0.1);
+                    width: 60px;
+                    height: 60px;
+                    display: flex;
+                    align-items: center;
+                    justify-content: center;
+                    text-decoration: none;
+                }
+
+                .social-link:hover {
+                    transform: translateY(-5px);
+                    background: #4CAF50;
+                    color: white;
+                    box-shadow: 0 5px 15px rgba(76, 175, 80, 0.3);
+                }
+
+                .bio-text {
+                    color: #ddd;
+                    line-height: 1.8;
+                    font-size: 1.1rem;
+                    margin-top: 2rem;
+                    text-align: left;
+                }
+
+                .vision-text {
+                    color: #ddd;
+                    line-height: 1.8;
+                    font-size: 1.1rem;
+                    font-style: italic;
+                    margin: 1.5rem 0;
+                    text-align: left;
+                }
+
+                .vision-icon {
+                    font-size: 2.5rem;
+                    color: #4CAF50;
+                    margin-bottom: 1rem;
+                }
 
-        /* Progress Circle */
-        .progress-container {
-            position: relative;
+                .vision-title {
+                    font-size: 2rem;
+                    color: white;
+                    margin-bottom: 1rem;
+                }
+
+                .features-grid {
+                    display: grid;
+                    grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
+                    gap: 2rem;
+                    margin: 2rem auto;
+                    max-width: 1200px;
+                }
+
+                .feature-card {
+                    padding: 2rem;
+                    margin: 0;
+                }
+
+                .feature-icon {
+                    font-size: 2.5rem;
+                    color: #4CAF50;
+                    margin-bottom: 1rem;
+                }
+
+                .feature-title {
+                    font-size: 1.5rem;
+                    color: white;
+                    margin: 1rem 0;
+                }
+
+                .feature-description {
+                    color: #ddd;
+                    line-height: 1.6;
+                }
+            </style>
+        """
+
+ABOUT_HERO_HTML = """
+            <div class="hero-section">
+                <h1 class="hero-title">About Smart Resume AI</h1>
+                <p class="hero-subtitle">A powerful AI-driven platform for optimizing your resume</p>
+            </div>
+        """
+
+ABOUT_VISION_HTML = """
+            <div class="vision-section">
+                <i class="fas fa-lightbulb vision-icon"></i>
+                <h2 class="vision-title">Our Vision</h2>
+                <p class="vision-text">
+                    "Smart Resume AI represents my vision of democratizing career advancement through technology.
+                    By combining cutting-edge AI with intuitive design, this platform empowers job seekers at
+                    every career stage to showcase their true potential and stand out in today's competitive job market."
+                </p>
+            </div>
+        """
+
+ABOUT_FEATURES_HTML = """
+            <div class="features-grid">
+                <div class="feature-card">
+                    <i class="fas fa-robot feature-icon"></i>
+                    <h3 class="feature-title">AI-Powered Analysis</h3>
+                    <p class="feature-description">
+                        Advanced AI algorithms provide detailed insights and suggestions to optimize your resume for maximum impact.
+                    </p>
+                </div>
+                <div class="feature-card">
+                    <i class="fas fa-chart-line feature-icon"></i>
+                    <h3 class="feature-title">Data-Driven Insights</h3>
+                    <p class="feature-description">
+                        Make informed decisions with our analytics-based recommendations and industry insights.
+                    </p>
+                </div>
+                <div class="feature-card">
+                    <i class="fas fa-shield-alt feature-icon"></i>
+                    <h3 class="feature-title">Privacy First</h3>
+                    <p class="feature-description">
+                        Your data security is our priority. We ensure your information is always protected and private.
+                    </p>
+                </div>
+            </div>
+            <div style="text-align: center; margin: 3rem 0;">
+                <a href="?page=analyzer" class="cta-button">
+                    Start Your Journey
+                    <i class="fas fa-arrow-right" style="margin-left: 10px;"></i>
+                </a>
+            </div>
+        """
+
+
+@st.cache_data(show_spinner=False)
+def _profile_html(image_base64):
+    """Render the About page profile card for the given image data URL"""
+    return f"""
+            <div class="profile-section">
+                <img src="{image_base64 if image_base64 else 'https://avatars.githubusercontent.com/Harsh067899'}"
+                     alt="Harsh Sahu"
+                     class="profile-image"
+                     onerror="this.onerror=null; this.src='https://avatars.githubusercontent.com/Harsh067899';">
+                <h2 class="profile-name">Harsh Sahu</h2>
+                <p class="profile-title">Full Stack Developer & AI/ML Enthusiast</p>
+                <div class="social-links">
+                    <a href="https://github.com/Harsh067899" class="social-link" target="_blank">
+                        <i class="fab fa-github"></i>
+                    </a>
+                    <a href="https://www.linkedin.com/in/zharsh-sahu/" class="social-link" target="_blank">
+                        <i class="fab fa-linkedin"></i>
+                    </a>
+                    <a href="mailto:harsh@example.com" class="social-link" target="_blank">
+                        <i class="fas fa-envelope"></i>
+                    </a>
+                </div>
+                <p class="bio-text">
+                    Hello! I'm a passionate Full Stack Developer with expertise in AI and Machine Learning.
+                    I created Smart Resume AI to revolutionize how job seekers approach their career journey.
+                    With my background in both software development and AI, I've designed this platform to
+                    provide intelligent, data-driven insights for resume optimization.
+                </p>
+            </div>
+        """
+
+
+# Role summary card shown above the upload box in both analyzer tabs
+ROLE_INFO_TEMPLATE = """
+<div style='background-color: #1e1e1e; padding: 20px; border-radius: 10px; margin: 10px 0;'>
+    <h3>{role}</h3>
+    <p>{description}</p>
+    <h4>Required Skills:</h4>
+    <p>{skills}</p>
+</div>
+"""
+
+# ATS score card shown on the analyzer page; filled in with score, color and status
+ATS_CARD_TEMPLATE = """
+<div class="feature-card">
+    <h2>ATS Score</h2>
+    <div style="position: relative; width: 150px; height: 150px; margin: 0 auto;">
+        <div style="
+            position: absolute;
             width: 150px;
             height: 150px;
-            margin: 2rem auto;
-        }
+            border-radius: 50%;
+            background: conic-gradient(
+                #4CAF50 0% {score}%,
+                #2c2c2c {score}% 100%
+            );
+            display: flex;
+            align-items: center;
+            justify-content: center;
+        ">
+            <div style="
+                width: 120px;
+                height: 120px;
+                background: #1a1a1a;
+                border-radius: 50%;
+                display: flex;
+                align-items: center;
+                justify-content: center;
+                font-size: 24px;
+                font-weight: bold;
+                color: {color};
+            ">
+                {score}
+            </div>
+        </div>
+    </div>
+    <div style="text-align: center; margin-top: 10px;">
+        <span style="
+            font-size: 1.2em;
+            color: {color};
+            font-weight: bold;
+        ">
+            {status}
+        </span>
+    </div>
+"""
+
+
+# Styled opening for each "## Section" heading of the AI analysis report;
+# the report code closes each section with "</div></div>"
+REPORT_SECTION_TEMPLATE = """<div class="report-section">
+    <h3 style="background: linear-gradient(90deg, {start}, {end}); color: white; padding: 10px; border-radius: 5px;">
+        <i class="fas {icon}"></i> {title}
+    </h3>
+    <div class="section-content">"""
+REPORT_SECTION_STYLES = {
+    f"## {title}": REPORT_SECTION_TEMPLATE.format(title=title, icon=icon, start=start, end=end)
+    for title, icon, start, end in (
+        ("Overall Assessment", "fa-chart-line", "#1e3a8a", "#3b82f6"),
+        ("Professional Profile Analysis", "fa-user-tie", "#047857", "#10b981"),
+        ("Skills Analysis", "fa-tools", "#4f46e5", "#818cf8"),
+        ("Experience Analysis", "fa-briefcase", "#9f1239", "#e11d48"),
+        ("Education Analysis", "fa-graduation-cap", "#854d0e", "#eab308"),
+        ("Key Strengths", "fa-check-circle", "#166534", "#22c55e"),
+        ("Areas for Improvement", "fa-exclamation-circle", "#9f1239", "#fb7185"),
+        ("ATS Optimization Assessment", "fa-robot", "#0e7490", "#06b6d4"),
+        ("Recommended Courses", "fa-book", "#5b21b6", "#8b5cf6"),
+        ("Resume Score", "fa-star", "#0369a1", "#0ea5e9"),
+        ("Role Alignment Analysis", "fa-bullseye", "#7c2d12", "#ea580c"),
+        ("Job Match Analysis", "fa-handshake", "#4d7c0f", "#84cc16"),
+    )
+}
+# Captures the header so REPORT_SECTION_RE.split returns it between the section bodies
+REPORT_SECTION_RE = re.compile(
+    r"^(" + "|".join(map(re.escape, REPORT_SECTION_STYLES)) + r")", re.M)
+# HTML-escaped <div>/</div> the model sometimes writes into its text
+ESCAPED_DIV_RE = re.compile(r"&lt;/?div&gt;")
+
+
+def style_report_sections(text):
+    """Wrap each known "## Section" of the AI report in its styled block, in one pass"""
+    # [preamble, header, body, header, body, ...]
+    parts = REPORT_SECTION_RE.split(text)
+    out = [parts[0]]
+    for header, body in zip(parts[1::2], parts[2::2]):
+        out += (REPORT_SECTION_STYLES[header], body, "</div></div>")
+    return "".join(out)
+
+
+# Selectbox options for the analyzer, built once from JOB_ROLES
+JOB_CATEGORIES = tuple(JOB_ROLES.keys())
+ROLES_BY_CATEGORY = {category: tuple(roles.keys()) for category, roles in JOB_ROLES.items()}
+
+
+class ResumeApp:
+    # Footer-navigation slugs mapped to render method names;
+    # built once with the class instead of on every script run
+    PAGE_ROUTES = {
+        "home": "render_home",
+        "analyzer": "render_analyzer",
+        "radar": "render_resume_radar",
+        "placement": "render_placement_dashboard",
+        "builder": "render_builder",
+        "dashboard": "render_dashboard",
+        "job-search": "render_job_search",
+        "about": "render_about"
+    }
+
+    def __init__(self):
+        """Initialize the application"""
+        if 'form_data' not in st.session_state:
+            st.session_state.form_data = {
+                'personal_info': {
+                    'full_name': '',
+                    'email': '',
+                    'phone': '',
+                    'location': '',
+                    'linkedin': '',
+                    'portfolio': ''
+                },
+                'summary': '',
+                'experiences': [],
+                'education': [],
+                'projects': [],
+                'skills_categories': {
+                    'technical': [],
+                    'soft': [],
+                    'languages': [],
+                    'tools': []
+                }
+            }
+
+        # Initialize navigation state
+        if 'page' not in st.session_state:
+            st.session_state.page = 'home'
 
-        .progress-circle {
-            transform: rotate(-90deg);
-            width: 100%;
-            height: 100%;
-        }
+        # Initialize admin state
+        if 'is_admin' not in st.session_state:
+            st.session_state.is_admin = False
 
-        .progress-circle circle {
-            fill: none;
-            stroke-width: 8;
-            stroke-linecap: round;
-            stroke: #4CAF50;
-            transform-origin: 50% 50%;
-            transition: all 0.3s ease;
-        }
+        # Initialize dashboard manager (its queries go through the shared, locked DB connection)
+        self.dashboard_manager = DashboardManager()
+        
+        # Initialize footer navigation
+        self.footer_nav = FooterNavigation()
 
-        .progress-text {
-            position: absolute;
-            top: 50%;
-            left: 50%;
-            transform: translate(-50%, -50%);
-            font-size: 1.5rem;
-            font-weight: 600;
-            color: white;
-        }
-        .main .block-container {
-            padding-top: 2rem;
-            padding-bottom: 2rem;
-        }
-        .feature-card {
-            background-color: #1e1e1e;
-            border-radius: 10px;
-            padding: 20px;
-            margin-bottom: 20px;
-            box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
-        }
+        # Analysis services are cached across reruns
+        services = _get_services()
+        self.analyzer = services.analyzer
+        self.ai_analyzer = services.ai_analyzer
+        self.builder = services.builder
+        self.resume_radar = services.resume_radar
+        self.jd_parser = services.jd_parser
+        self.matcher = services.matcher
+        self.job_roles = JOB_ROLES  # already a dict, no copy
+        self._categories = JOB_CATEGORIES
+        self._roles_by_cat = ROLES_BY_CATEGORY
         
-        /* Animations */
-        @keyframes slideIn {
-            from {
-                opacity: 0;
-                transform: translateY(30px);
-            }
-            to {
-                opacity: 1;
-                transform: translateY(0);
-            }
-        }
+        # Initialize placement dashboard database
+        self._initialize_placement_database()
 
-        .animate-slide-in {
-            animation: slideIn 0.6s cubic-bezier(0.4, 0, 0.2, 1) forwards;
-        }
+    def _initialize_placement_database(self):
+        """Initialize SQLite database for placement dashboard"""
+        # Connection and schema are shared across reruns and sessions
+        self.placement_conn = _get_placement_conn()
+
+        # Session defaults and resume DB schema only need setting up once per session;
+        # the styling below is re-emitted on every run or Streamlit would drop it
+        if not st.session_state.get('_placement_db_ready'):
+            # Initialize session state
+            if 'user_id' not in st.session_state:
+                st.session_state.user_id = 'default_user'
+            if 'selected_role' not in st.session_state:
+                st.session_state.selected_role = None
+            if 'resume_data' not in st.session_state:
+                st.session_state.resume_data = []
+            if 'ai_analysis_stats' not in st.session_state:
+                st.session_state.ai_analysis_stats = {
+                    'score_distribution': {},
+                    'total_analyses': 0,
+                    'average_score': 0
+                }
 
-        /* Responsive Design */
-        @media (max-width: 768px) {
-            .template-container {
-                grid-template-columns: 1fr;
-            }
+            # Initialize database
+            init_database()
+            st.session_state._placement_db_ready = True
 
-            .main-header {
-                padding: 1.5rem;
-            }
+        # Load external CSS (file read is cached across reruns)
+        try:
+            st.markdown(f'<style>{_load_css("style.css")}</style>', unsafe_allow_html=True)
+        except FileNotFoundError:
+            # Fallback: use inline basic styling
+            st.markdown("""
+            <style>
+            .main { padding: 1rem; }
+            .stApp { background-color: #f0f2f6; }
+            </style>
+            """, unsafe_allow_html=True)
+        except Exception as e:
+            st.warning(f"CSS loading failed, using default styling: {e}")
 
-            .main-header h1 {
-                font-size: 2rem;
-            }
+        # Load Google Fonts
+        st.markdown("""
+            <link href="https://fonts.googleapis.com/css2?family=Roboto:wght@400;500;700&family=Poppins:wght@400;500;600&display=swap" rel="stylesheet">
+            <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/5.15.4/css/all.min.css">
+        """, unsafe_allow_html=True)
 
-            .template-card {
-                padding: 1.5rem;
-            }
+    def load_lottie_url(self, url: str):
+        """Load Lottie animation from URL"""
+        return load_lottie_url(url)
 
-            .action-button {
-                padding: 0.8rem 1.6rem;
-            }
-        }
-        </style>
-        """, unsafe_allow_html=True)
+    def apply_global_styles(self):
+        """Apply global styles from style/global.css"""
+        st.markdown(f'<style>{_load_css("global.css")}</style>', unsafe_allow_html=True)
         
     def load_image(self, image_name):
         """Load image from static directory"""
-        try:
-            # Try multiple possible paths for deployment compatibility
-            possible_paths = [
-                f"assets/{image_name}",
-                f"static/{image_name}",
-                f"images/{image_name}",
-                f"./{image_name}"
-            ]
-            
-            for image_path in possible_paths:
-                try:
-                    if os.path.exists(image_path):
-                        with open(image_path, "rb") as f:
-                            image_bytes = f.read()
-                        encoded = base64.b64encode(image_bytes).decode()
-                        return f"data:image/png;base64,{encoded}"
-                except Exception:
-                    continue
-            
-            # If no local image found, return None (will use GitHub avatar as fallback)
-            return None
-            
-        except Exception as e:
-            print(f"Error loading image {image_name}: {e}")
-            return None
+        return _load_image_data_url(image_name)
 
     def export_to_excel(self):
         """Export resume data to Excel"""
-        conn = get_database_connection()
-
-        # Get resume data with analysis
-        query = """
-            SELECT
-                rd.name, rd.email, rd.phone, rd.linkedin, rd.github, rd.portfolio,
-                rd.summary, rd.target_role, rd.target_category,
-                rd.education, rd.experience, rd.projects, rd.skills,
-                ra.ats_score, ra.keyword_match_score, ra.format_score, ra.section_score,
-                ra.missing_skills, ra.recommendations,
-                rd.created_at
-            FROM resume_data rd
-            LEFT JOIN resume_analysis ra ON rd.id = ra.resume_id
-        """
-
         try:
-            # Read data into DataFrame
-            df = pd.read_sql_query(query, conn)
-
-            # Create Excel writer object
-            output = io.BytesIO()
-            with pd.ExcelWriter(output, engine='openpyxl') as writer:
-                df.to_excel(writer, index=False, sheet_name='Resume Data')
-
-            return output.getvalue()
+            # Rebuild only when the tables have changed since the last export
+            return _build_export_workbook(_export_fingerprint())
         except Exception as e:
             print(f"Error exporting to Excel: {str(e)}")
             return None
-        finally:
-            conn.close()
 
     def render_dashboard(self):
         """Render the dashboard page"""
@@ -667,7 +1636,7 @@ class ResumeApp:
                 st.session_state.resume_data = {
                     'filename': uploaded_file.name,
                     'content': resume_text,
-                    'upload_time': datetime.now().isoformat()
+                    'upload_time': time.time_ns()  # epoch ns; format only where displayed
                 }
 
                 # Analyze resume
@@ -689,15 +1658,19 @@ class ResumeApp:
     "Select Resume Template", template_options)
         st.success(f"🎨 Currently using: {selected_template} Template")
 
+        # Bind form sections once; widgets below mutate them in place
+        fd = st.session_state.form_data
+        pi = fd['personal_info']
+
         # Personal Information
         st.subheader("Personal Information")
 
         col1, col2 = st.columns(2)
         with col1:
             # Get existing values from session state
-            existing_name = st.session_state.form_data['personal_info']['full_name']
-            existing_email = st.session_state.form_data['personal_info']['email']
-            existing_phone = st.session_state.form_data['personal_info']['phone']
+            existing_name = pi['full_name']
+            existing_email = pi['email']
+            existing_phone = pi['phone']
 
             # Input fields with existing values
             full_name = st.text_input("Full Name", value=existing_name)
@@ -709,13 +1682,13 @@ class ResumeApp:
 
             # Immediately update session state after email input
             if 'email_input' in st.session_state:
-                st.session_state.form_data['personal_info']['email'] = st.session_state.email_input
+                pi['email'] = st.session_state.email_input
 
         with col2:
             # Get existing values from session state
-            existing_location = st.session_state.form_data['personal_info']['location']
-            existing_linkedin = st.session_state.form_data['personal_info']['linkedin']
-            existing_portfolio = st.session_state.form_data['personal_info']['portfolio']
+            existing_location = pi['location']
+            existing_linkedin = pi['linkedin']
+            existing_portfolio = pi['portfolio']
 
             # Input fields with existing values
             location = st.text_input("Location", value=existing_location)
@@ -724,27 +1697,24 @@ class ResumeApp:
     "Portfolio Website", value=existing_portfolio)
 
         # Update personal info in session state
-        st.session_state.form_data['personal_info'] = {
-            'full_name': full_name,
-            'email': email,
-            'phone': phone,
-            'location': location,
-            'linkedin': linkedin,
-            'portfolio': portfolio
-        }
+        pi['full_name'] = full_name
+        pi['email'] = email
+        pi['phone'] = phone
+        pi['location'] = location
+        pi['linkedin'] = linkedin
+        pi['portfolio'] = portfolio
 
         # Professional Summary
         st.subheader("Professional Summary")
-        summary = st.text_area("Professional Summary", value=st.session_state.form_data.get('summary', ''), height=150,
+        summary = st.text_area("Professional Summary", value=fd.get('summary', ''), height=150,
                              help="Write a brief summary highlighting your key skills and experience")
 
         # Experience Section
         st.subheader("Work Experience")
-        if 'experiences' not in st.session_state.form_data:
-            st.session_state.form_data['experiences'] = []
+        experiences = fd.setdefault('experiences', [])
 
         if st.button("Add Experience"):
-            st.session_state.form_data['experiences'].append({
+            experiences.append({
                 'company': '',
                 'position': '',
                 'start_date': '',
@@ -754,7 +1724,7 @@ class ResumeApp:
                 'achievements': []
             })
 
-        for idx, exp in enumerate(st.session_state.form_data['experiences']):
+        for idx, exp in enumerate(experiences):
             with st.expander(f"Experience {idx + 1}", expanded=True):
                 col1, col2 = st.columns(2)
                 with col1:
@@ -782,37 +1752,34 @@ class ResumeApp:
 
                 # Responsibilities
                 st.markdown("##### Key Responsibilities")
-                resp_text = st.text_area("Enter responsibilities (one per line)",
-                                       key=f"resp_{idx}",
-                                       value='\n'.join(
-                                           exp.get('responsibilities', [])),
-                                       height=100,
-                                       help="List your main responsibilities, one per line")
-                exp['responsibilities'] = [r.strip()
-                                                   for r in resp_text.split('\n') if r.strip()]
+                if 'responsibilities_raw' not in exp:
+                    exp['responsibilities_raw'] = '\n'.join(exp.get('responsibilities', []))
+                exp['responsibilities_raw'] = st.text_area("Enter responsibilities (one per line)",
+                                                           key=f"resp_{idx}",
+                                                           value=exp['responsibilities_raw'],
+                                                           height=100,
+                                                           help="List your main responsibilities, one per line")
 
                 # Achievements
                 st.markdown("##### Key Achievements")
-                achv_text = st.text_area("Enter achievements (one per line)",
-                                       key=f"achv_{idx}",
-                                       value='\n'.join(
-                                           exp.get('achievements', [])),
-                                       height=100,
-                                       help="List your notable achievements, one per line")
-                exp['achievements'] = [a.strip()
-                                               for a in achv_text.split('\n') if a.strip()]
+                if 'achievements_raw' not in exp:
+                    exp['achievements_raw'] = '\n'.join(exp.get('achievements', []))
+                exp['achievements_raw'] = st.text_area("Enter achievements (one per line)",
+                                                       key=f"achv_{idx}",
+                                                       value=exp['achievements_raw'],
+                                                       height=100,
+                                                       help="List your notable achievements, one per line")
 
                 if st.button("Remove Experience", key=f"remove_exp_{idx}"):
-                    st.session_state.form_data['experiences'].pop(idx)
+                    experiences.pop(idx)
                     st.rerun()
 
         # Projects Section
         st.subheader("Projects")
-        if 'projects' not in st.session_state.form_data:
-            st.session_state.form_data['projects'] = []
+        projects = fd.setdefault('projects', [])
 
         if st.button("Add Project"):
-            st.session_state.form_data['projects'].append({
+            projects.append({
                 'name': '',
                 'technologies': '',
                 'description': '',
@@ -821,7 +1788,7 @@ class ResumeApp:
                 'link': ''
             })
 
-        for idx, proj in enumerate(st.session_state.form_data['projects']):
+        for idx, proj in enumerate(projects):
             with st.expander(f"Project {idx + 1}", expanded=True):
                 proj['name'] = st.text_input(
     "Project Name",
@@ -841,41 +1808,38 @@ class ResumeApp:
 
                 # Project Responsibilities
                 st.markdown("##### Key Responsibilities")
-                proj_resp_text = st.text_area("Enter responsibilities (one per line)",
-                                            key=f"proj_resp_{idx}",
-                                            value='\n'.join(
-                                                proj.get('responsibilities', [])),
-                                            height=100,
-                                            help="List your main responsibilities in the project")
-                proj['responsibilities'] = [r.strip()
-                                                    for r in proj_resp_text.split('\n') if r.strip()]
+                if 'responsibilities_raw' not in proj:
+                    proj['responsibilities_raw'] = '\n'.join(proj.get('responsibilities', []))
+                proj['responsibilities_raw'] = st.text_area("Enter responsibilities (one per line)",
+                                                            key=f"proj_resp_{idx}",
+                                                            value=proj['responsibilities_raw'],
+                                                            height=100,
+                                                            help="List your main responsibilities in the project")
 
                 # Project Achievements
                 st.markdown("##### Key Achievements")
-                proj_achv_text = st.text_area("Enter achievements (one per line)",
-                                            key=f"proj_achv_{idx}",
-                                            value='\n'.join(
-                                                proj.get('achievements', [])),
-                                            height=100,
-                                            help="List the project's key achievements and your contributions")
-                proj['achievements'] = [a.strip()
-                                                for a in proj_achv_text.split('\n') if a.strip()]
+                if 'achievements_raw' not in proj:
+                    proj['achievements_raw'] = '\n'.join(proj.get('achievements', []))
+                proj['achievements_raw'] = st.text_area("Enter achievements (one per line)",
+                                                        key=f"proj_achv_{idx}",
+                                                        value=proj['achievements_raw'],
+                                                        height=100,
+                                                        help="List the project's key achievements and your contributions")
 
                 proj['link'] = st.text_input("Project Link (optional)", key=f"proj_link_{idx}",
                                            value=proj.get('link', ''),
                                            help="Link to the project repository, demo, or documentation")
 
                 if st.button("Remove Project", key=f"remove_proj_{idx}"):
-                    st.session_state.form_data['projects'].pop(idx)
+                    projects.pop(idx)
                     st.rerun()
 
         # Education Section
         st.subheader("Education")
-        if 'education' not in st.session_state.form_data:
-            st.session_state.form_data['education'] = []
+        education = fd.setdefault('education', [])
 
         if st.button("Add Education"):
-            st.session_state.form_data['education'].append({
+            education.append({
                 'school': '',
                 'degree': '',
                 'field': '',
@@ -884,7 +1848,7 @@ class ResumeApp:
                 'achievements': []
             })
 
-        for idx, edu in enumerate(st.session_state.form_data['education']):
+        for idx, edu in enumerate(education):
             with st.expander(f"Education {idx + 1}", expanded=True):
                 col1, col2 = st.columns(2)
                 with col1:
@@ -916,403 +1880,174 @@ class ResumeApp:
 
                 # Educational Achievements
                 st.markdown("##### Achievements & Activities")
-                edu_achv_text = st.text_area("Enter achievements (one per line)",
-                                           key=f"edu_achv_{idx}",
-                                           value='\n'.join(
-                                               edu.get('achievements', [])),
-                                           height=100,
-                                           help="List academic achievements, relevant coursework, or activities")
-                edu['achievements'] = [a.strip()
-                                               for a in edu_achv_text.split('\n') if a.strip()]
+                if 'achievements_raw' not in edu:
+                    edu['achievements_raw'] = '\n'.join(edu.get('achievements', []))
+                edu['achievements_raw'] = st.text_area("Enter achievements (one per line)",
+                                                       key=f"edu_achv_{idx}",
+                                                       value=edu['achievements_raw'],
+                                                       height=100,
+                                                       help="List academic achievements, relevant coursework, or activities")
 
                 if st.button("Remove Education", key=f"remove_edu_{idx}"):
-                    st.session_state.form_data['education'].pop(idx)
+                    education.pop(idx)
                     st.rerun()
 
         # Skills Section
         st.subheader("Skills")
-        if 'skills_categories' not in st.session_state.form_data:
-            st.session_state.form_data['skills_categories'] = {
-                'technical': [],
-                'soft': [],
-                'languages': [],
-                'tools': []
-            }
-
-        col1, col2 = st.columns(2)
-        with col1:
-            tech_skills = st.text_area("Technical Skills (one per line)",
-                                     value='\n'.join(
-    st.session_state.form_data['skills_categories']['technical']),
-                                     height=150,
-                                     help="Programming languages, frameworks, databases, etc.")
-            st.session_state.form_data['skills_categories']['technical'] = [
-                s.strip() for s in tech_skills.split('\n') if s.strip()]
-
-            soft_skills = st.text_area("Soft Skills (one per line)",
-                                     value='\n'.join(
-    st.session_state.form_data['skills_categories']['soft']),
-                                     height=150,
-                                     help="Leadership, communication, problem-solving, etc.")
-            st.session_state.form_data['skills_categories']['soft'] = [
-                s.strip() for s in soft_skills.split('\n') if s.strip()]
-
-        with col2:
-            languages = st.text_area("Languages (one per line)",
-                                   value='\n'.join(
-    st.session_state.form_data['skills_categories']['languages']),
-                                   height=150,
-                                   help="Programming or human languages with proficiency level")
-            st.session_state.form_data['skills_categories']['languages'] = [
-                l.strip() for l in languages.split('\n') if l.strip()]
-
-            tools = st.text_area("Tools & Technologies (one per line)",
-                               value='\n'.join(
-    st.session_state.form_data['skills_categories']['tools']),
-                               height=150,
-                               help="Development tools, software, platforms, etc.")
-            st.session_state.form_data['skills_categories']['tools'] = [
-                t.strip() for t in tools.split('\n') if t.strip()]
-
-        # Update form data in session state
-        st.session_state.form_data.update({
-            'summary': summary
+        skills = fd.setdefault('skills_categories', {
+            'technical': [],
+            'soft': [],
+            'languages': [],
+            'tools': []
         })
+        # Text area contents are kept as-is so lists are only joined once per category,
+        # and only re-parsed when the text actually changes
+        skills_joined = fd.setdefault('skills_joined', {})
+        for category, items in skills.items():
+            if category not in skills_joined:
+                skills_joined[category] = '\n'.join(items)
+
+        # Skill text areas and the Generate button share a form, so typing in
+        # them doesn't rerun the whole builder until the form is submitted
+        with st.form("resume_form", clear_on_submit=False):
+            col1, col2 = st.columns(2)
+            with col1:
+                tech_skills = st.text_area("Technical Skills (one per line)",
+                                         value=skills_joined['technical'],
+                                         height=150,
+                                         help="Programming languages, frameworks, databases, etc.")
+                if tech_skills != skills_joined['technical']:
+                    skills_joined['technical'] = tech_skills
+                    skills['technical'] = list(parse_lines(tech_skills))
+
+                soft_skills = st.text_area("Soft Skills (one per line)",
+                                         value=skills_joined['soft'],
+                                         height=150,
+                                         help="Leadership, communication, problem-solving, etc.")
+                if soft_skills != skills_joined['soft']:
+                    skills_joined['soft'] = soft_skills
+                    skills['soft'] = list(parse_lines(soft_skills))
 
-        # Generate Resume button
-        if st.button("Generate Resume 📄", type="primary"):
-            print("Validating form data...")
-            print(f"Session state form data: {st.session_state.form_data}")
-            print(f"Email input value: {st.session_state.get('email_input', '')}")
+            with col2:
+                languages = st.text_area("Languages (one per line)",
+                                       value=skills_joined['languages'],
+                                       height=150,
+                                       help="Programming or human languages with proficiency level")
+                if languages != skills_joined['languages']:
+                    skills_joined['languages'] = languages
+                    skills['languages'] = list(parse_lines(languages))
+
+                tools = st.text_area("Tools & Technologies (one per line)",
+                                   value=skills_joined['tools'],
+                                   height=150,
+                                   help="Development tools, software, platforms, etc.")
+                if tools != skills_joined['tools']:
+                    skills_joined['tools'] = tools
+                    skills['tools'] = list(parse_lines(tools))
 
-            # Get the current values from form
-            current_name = st.session_state.form_data['personal_info']['full_name'].strip(
-            )
-            current_email = st.session_state.email_input if 'email_input' in st.session_state else ''
+            submitted = st.form_submit_button("Generate Resume 📄", type="primary")
 
-            print(f"Current name: {current_name}")
-            print(f"Current email: {current_email}")
+        # Update form data in session state
+        fd['summary'] = summary
 
-            # Validate required fields
+        # Generate Resume once the form is submitted
+        if submitted:
+            # Validate required fields before doing any other work
+            current_name = pi['full_name'].strip()
             if not current_name:
                 st.error("⚠️ Please enter your full name.")
                 return
 
+            current_email = st.session_state.get('email_input', '')
             if not current_email:
                 st.error("⚠️ Please enter your email address.")
                 return
 
+            logger.debug("Session state form data: %r", fd)
+            logger.debug("Current name: %s, email: %s", current_name, current_email)
+            filename_slug = current_name.replace(' ', '_')
+
             # Update email in form data one final time
-            st.session_state.form_data['personal_info']['email'] = current_email
+            pi['email'] = current_email
+
+            # Text areas keep their raw strings while editing; split them only now, into
+            # copies so the raw strings are neither saved nor passed to the generator
+            experience_entries = [split_raw_fields(exp, ('responsibilities', 'achievements'))
+                                  for exp in experiences]
+            project_entries = [split_raw_fields(proj, ('responsibilities', 'achievements'))
+                               for proj in projects]
+            education_entries = [split_raw_fields(edu, ('achievements',)) for edu in education]
 
             try:
-                print("Preparing resume data...")
+                logger.debug("Preparing resume data...")
                 # Prepare resume data with current form values
                 resume_data = {
-                    "personal_info": st.session_state.form_data['personal_info'],
-                    "summary": st.session_state.form_data.get('summary', '').strip(),
-                    "experience": st.session_state.form_data.get('experiences', []),
-                    "education": st.session_state.form_data.get('education', []),
-                    "projects": st.session_state.form_data.get('projects', []),
-                    "skills": st.session_state.form_data.get('skills_categories', {
-                        'technical': [],
-                        'soft': [],
-                        'languages': [],
-                        'tools': []
-                    }),
+                    "personal_info": pi,
+                    "summary": fd.get('summary', '').strip(),
+                    "experience": experience_entries,
+                    "education": education_entries,
+                    "projects": project_entries,
+                    "skills": skills,
                     "template": selected_template
                 }
 
-                print(f"Resume data prepared: {resume_data}")
+                logger.debug("Resume data prepared: %r", resume_data)
 
                 try:
                     # Generate resume
                     resume_buffer = self.builder.generate_resume(resume_data)
                     if resume_buffer:
-                        try:
-                            # Save resume data to database
-                            save_resume_data(resume_data)
+                        # Save resume data to database in the background; a failed
+                        # save is reported on a later run
+                        _submit_db_write(save_resume_data, resume_data)
 
-                            # Offer the resume for download
-                            st.success("✅ Resume generated successfully!")
+                        # Offer the resume for download
+                        st.success("✅ Resume generated successfully!")
 
-                            # Show snowflake effect
-                            st.snow()
+                        # Show snowflake effect
+                        st.snow()
 
-                            st.download_button(
-                                label="Download Resume 📥",
-                                data=resume_buffer,
-                                file_name=f"{current_name.replace(' ', '_')}_resume.docx",
-                                mime="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-                                on_click=lambda: st.balloons()
-                            )
-                        except Exception as db_error:
-                            print(f"Warning: Failed to save to database: {str(db_error)}")
-                            # Still allow download even if database save fails
-                            st.warning(
-                                "⚠️ Resume generated but couldn't be saved to database")
-                            
-                            # Show balloons effect
-                            st.balloons()
-
-                            st.download_button(
-                                label="Download Resume 📥",
-                                data=resume_buffer,
-                                file_name=f"{current_name.replace(' ', '_')}_resume.docx",
-                                mime="application/vnd.openxmlformats-officedocument.wordprocessingml.document",
-                                on_click=lambda: st.balloons()
-                            )
+                        _offer_resume_download(resume_buffer, filename_slug)
+                        del resume_buffer
                     else:
                         st.error(
                             "❌ Failed to generate resume. Please try again.")
-                        print("Resume buffer was None")
+                        logger.debug("Resume buffer was None")
                 except Exception as gen_error:
-                    print(f"Error during resume generation: {str(gen_error)}")
-                    print(f"Full traceback: {traceback.format_exc()}")
+                    logger.exception("Error during resume generation")
                     st.error(f"❌ Error generating resume: {str(gen_error)}")
 
             except Exception as e:
-                print(f"Error preparing resume data: {str(e)}")
-                print(f"Full traceback: {traceback.format_exc()}")
+                logger.exception("Error preparing resume data")
                 st.error(f"❌ Error preparing resume data: {str(e)}")
 
         st.toast("Check out these repositories: [30-Days-Of-Rust](https://github.com/Hunterdii/30-Days-Of-Rust)", icon="ℹ️")
 
-    def render_about(self):
-        """Render the about page"""
-        # Apply modern styles
-        from ui_components import apply_modern_styles
-        import base64
-        import os
-
-        # Function to load image as base64
-        def get_image_as_base64(file_path):
-            try:
-                with open(file_path, "rb") as image_file:
-                    encoded = base64.b64encode(image_file.read()).decode()
-                    return f"data:image/jpeg;base64,{encoded}"
-            except:
-                return None
-
-        # Get image path and convert to base64
-        image_path = os.path.join(
-    os.path.dirname(__file__),
-    "assets",
-     "124852522.jpeg")
-        image_base64 = get_image_as_base64(image_path)
-
-        apply_modern_styles()
-
-        # Add Font Awesome icons and custom CSS
-        st.markdown("""
-            <link rel="stylesheet" href="https://cdnjs.cloudflare.com/ajax/libs/font-awesome/6.0.0/css/all.min.css">
-            <style>
-                .profile-section, .vision-section, .feature-card {
-                    text-align: center;
-                    padding: 2rem;
-                    background: rgba(45, 45, 45, 0.9);
-                    border-radius: 20px;
-                    margin: 2rem auto;
-                    max-width: 800px;
-                }
-
-                .profile-image {
-                    width: 200px;
-                    height: 200px;
-                    border-radius: 50%;
-                    margin: 0 auto 1.5rem;
-                    display: block;
-                    object-fit: cover;
-                    border: 4px solid #4CAF50;
-                }
-
-                .profile-name {
-                    font-size: 2.5rem;
-                    color: white;
-                    margin-bottom: 0.5rem;
-                }
-
-                .profile-title {
-                    font-size: 1.2rem;
-                    color: #4CAF50;
-                    margin-bottom: 1.5rem;
-                }
-
-                .social-links {
-                    display: flex;
-                    justify-content: center;
-                    gap: 1.5rem;
-                    margin: 2rem 0;
-                }
-
-                .social-link {
-                    font-size: 2rem;
-                    color: #4CAF50;
-                    transition: all 0.3s ease;
-                    padding: 0.5rem;
-                    border-radius: 50%;
-                    background: rgba(76, 175, 80, 0.1);
-                    width: 60px;
-                    height: 60px;
-                    display: flex;
-                    align-items: center;
-                    justify-content: center;
-                    text-decoration: none;
-                }
-
-                .social-link:hover {
-                    transform: translateY(-5px);
-                    background: #4CAF50;
-                    color: white;
-                    box-shadow: 0 5px 15px rgba(76, 175, 80, 0.3);
-                }
-
-                .bio-text {
-                    color: #ddd;
-                    line-height: 1.8;
-                    font-size: 1.1rem;
-                    margin-top: 2rem;
-                    text-align: left;
-                }
-
-                .vision-text {
-                    color: #ddd;
-                    line-height: 1.8;
-                    font-size: 1.1rem;
-                    font-style: italic;
-                    margin: 1.5rem 0;
-                    text-align: left;
-                }
-
-                .vision-icon {
-                    font-size: 2.5rem;
-                    color: #4CAF50;
-                    margin-bottom: 1rem;
-                }
-
-                .vision-title {
-                    font-size: 2rem;
-                    color: white;
-                    margin-bottom: 1rem;
-                }
-
-                .features-grid {
-                    display: grid;
-                    grid-template-columns: repeat(auto-fit, minmax(250px, 1fr));
-                    gap: 2rem;
-                    margin: 2rem auto;
-                    max-width: 1200px;
-                }
-
-                .feature-card {
-                    padding: 2rem;
-                    margin: 0;
-                }
-
-                .feature-icon {
-                    font-size: 2.5rem;
-                    color: #4CAF50;
-                    margin-bottom: 1rem;
-                }
-
-                .feature-title {
-                    font-size: 1.5rem;
-                    color: white;
-                    margin: 1rem 0;
-                }
-
-                .feature-description {
-                    color: #ddd;
-                    line-height: 1.6;
-                }
-            </style>
-        """, unsafe_allow_html=True)
-
-        # Hero Section
-        st.markdown("""
-            <div class="hero-section">
-                <h1 class="hero-title">About Smart Resume AI</h1>
-                <p class="hero-subtitle">A powerful AI-driven platform for optimizing your resume</p>
-            </div>
-        """, unsafe_allow_html=True)
-
-        # Profile Section
-        st.markdown(f"""
-            <div class="profile-section">
-                <img src="{image_base64 if image_base64 else 'https://avatars.githubusercontent.com/Harsh067899'}"
-                     alt="Harsh Sahu"
-                     class="profile-image"
-                     onerror="this.onerror=null; this.src='https://avatars.githubusercontent.com/Harsh067899';">
-                <h2 class="profile-name">Harsh Sahu</h2>
-                <p class="profile-title">Full Stack Developer & AI/ML Enthusiast</p>
-                <div class="social-links">
-                    <a href="https://github.com/Harsh067899" class="social-link" target="_blank">
-                        <i class="fab fa-github"></i>
-                    </a>
-                    <a href="https://www.linkedin.com/in/zharsh-sahu/" class="social-link" target="_blank">
-                        <i class="fab fa-linkedin"></i>
-                    </a>
-                    <a href="mailto:harsh@example.com" class="social-link" target="_blank">
-                        <i class="fas fa-envelope"></i>
-                    </a>
-                </div>
-                <p class="bio-text">
-                    Hello! I'm a passionate Full Stack Developer with expertise in AI and Machine Learning.
-                    I created Smart Resume AI to revolutionize how job seekers approach their career journey.
-                    With my background in both software development and AI, I've designed this platform to
-                    provide intelligent, data-driven insights for resume optimization.
-                </p>
-            </div>
-        """, unsafe_allow_html=True)
+    def render_about(self):
+        """Render the about page"""
+        # Get image path and convert to base64 (cached across reruns)
+        image_path = os.path.join(
+    os.path.dirname(__file__),
+    "assets",
+     "124852522.jpeg")
+        image_base64 = get_image_as_base64(image_path)
+
+        apply_modern_styles()
 
+        # Add Font Awesome icons and custom CSS
+        st.markdown(ABOUT_CSS, unsafe_allow_html=True)
 
+        # Hero Section
+        st.markdown(ABOUT_HERO_HTML, unsafe_allow_html=True)
 
+        # Profile Section
+        st.markdown(_profile_html(image_base64), unsafe_allow_html=True)
 
         # Vision Section
-        st.markdown("""
-            <div class="vision-section">
-                <i class="fas fa-lightbulb vision-icon"></i>
-                <h2 class="vision-title">Our Vision</h2>
-                <p class="vision-text">
-                    "Smart Resume AI represents my vision of democratizing career advancement through technology.
-                    By combining cutting-edge AI with intuitive design, this platform empowers job seekers at
-                    every career stage to showcase their true potential and stand out in today's competitive job market."
-                </p>
-            </div>
-        """, unsafe_allow_html=True)
+        st.markdown(ABOUT_VISION_HTML, unsafe_allow_html=True)
 
         # Features Section
-        st.markdown("""
-            <div class="features-grid">
-                <div class="feature-card">
-                    <i class="fas fa-robot feature-icon"></i>
-                    <h3 class="feature-title">AI-Powered Analysis</h3>
-                    <p class="feature-description">
-                        Advanced AI algorithms provide detailed insights and suggestions to optimize your resume for maximum impact.
-                    </p>
-                </div>
-                <div class="feature-card">
-                    <i class="fas fa-chart-line feature-icon"></i>
-                    <h3 class="feature-title">Data-Driven Insights</h3>
-                    <p class="feature-description">
-                        Make informed decisions with our analytics-based recommendations and industry insights.
-                    </p>
-                </div>
-                <div class="feature-card">
-                    <i class="fas fa-shield-alt feature-icon"></i>
-                    <h3 class="feature-title">Privacy First</h3>
-                    <p class="feature-description">
-                        Your data security is our priority. We ensure your information is always protected and private.
-                    </p>
-                </div>
-            </div>
-            <div style="text-align: center; margin: 3rem 0;">
-                <a href="?page=analyzer" class="cta-button">
-                    Start Your Journey
-                    <i class="fas fa-arrow-right" style="margin-left: 10px;"></i>
-                </a>
-            </div>
-        """, unsafe_allow_html=True)
+        st.markdown(ABOUT_FEATURES_HTML, unsafe_allow_html=True)
 
         st.toast("Check out these repositories: [Iriswise](https://github.com/Hunterdii/Iriswise)", icon="ℹ️")
 
@@ -1331,25 +2066,22 @@ class ResumeApp:
 
         with analyzer_tabs[0]:
             # Job Role Selection
-            categories = list(self.job_roles.keys())
+            categories = self._categories
             selected_category = st.selectbox(
     "Job Category", categories, key="standard_category")
 
-            roles = list(self.job_roles[selected_category].keys())
+            roles = self._roles_by_cat[selected_category]
             selected_role = st.selectbox(
     "Specific Role", roles, key="standard_role")
 
             role_info = self.job_roles[selected_category][selected_role]
 
             # Display role information
-            st.markdown(f"""
-            <div style='background-color: #1e1e1e; padding: 20px; border-radius: 10px; margin: 10px 0;'>
-                <h3>{selected_role}</h3>
-                <p>{role_info['description']}</p>
-                <h4>Required Skills:</h4>
-                <p>{', '.join(role_info['required_skills'])}</p>
-            </div>
-            """, unsafe_allow_html=True)
+            st.markdown(ROLE_INFO_TEMPLATE.format(
+                role=selected_role,
+                description=role_info['description'],
+                skills=', '.join(role_info['required_skills'])
+            ), unsafe_allow_html=True)
 
             # File Upload
             uploaded_file = st.file_uploader(
@@ -1365,32 +2097,6 @@ class ResumeApp:
                     ),
                     unsafe_allow_html=True
                 )
-                # Add a prominent upload button
-                col1, col2, col3 = st.columns([1, 2, 1])
-                with col2:
-                    st.markdown("""
-                    <style>
-                    .upload-button {
-                        background: linear-gradient(90deg, #4b6cb7, #182848);
-                        color: white;
-                        border: none;
-                        border-radius: 10px;
-                        padding: 15px 25px;
-                        font-size: 18px;
-                        font-weight: bold;
-                        cursor: pointer;
-                        width: 100%;
-                        text-align: center;
-                        margin: 20px 0;
-                        box-shadow: 0 4px 10px rgba(0,0,0,0.2);
-                        transition: all 0.3s ease;
-                    }
-                    .upload-button:hover {
-                        transform: translateY(-3px);
-                        box-shadow: 0 6px 15px rgba(0,0,0,0.3);
-                    }
-
-                    """, unsafe_allow_html=True)
 
             if uploaded_file:
                 # Add a prominent analyze button
@@ -1403,10 +2109,12 @@ class ResumeApp:
                     with st.spinner("Analyzing your document..."):
                         # Get file content
                         text = ""
+                        file_buffer = uploaded_file.getbuffer()
+                        file_key = _upload_key(file_buffer)
                         try:
                             if uploaded_file.type == "application/pdf":
                                 try:
-                                    text = self.analyzer.extract_text_from_pdf(uploaded_file)
+                                    text = _extract_text(file_key, uploaded_file.type, file_buffer)
                                 except Exception as pdf_error:
                                     st.error(f"PDF extraction failed: {str(pdf_error)}")
                                     st.info("Trying alternative PDF extraction method...")
@@ -1418,7 +2126,7 @@ class ResumeApp:
                                         return
                             elif uploaded_file.type == "application/vnd.openxmlformats-officedocument.wordprocessingml.document":
                                 try:
-                                    text = self.analyzer.extract_text_from_docx(uploaded_file)
+                                    text = _extract_text(file_key, uploaded_file.type, file_buffer)
                                 except Exception as docx_error:
                                     st.error(f"DOCX extraction failed: {str(docx_error)}")
                                     # Try AI analyzer as backup
@@ -1428,7 +2136,7 @@ class ResumeApp:
                                         st.error(f"All DOCX extraction methods failed: {str(backup_error)}")
                                         return
                             else:
-                                text = uploaded_file.getvalue().decode()
+                                text = _extract_text(file_key, uploaded_file.type, file_buffer)
                                 
                             if not text or text.strip() == "":
                                 st.error("Could not extract any text from the uploaded file. Please try a different file.")
@@ -1438,7 +2146,7 @@ class ResumeApp:
                             return
 
                         # Analyze the document
-                        analysis = self.analyzer.analyze_resume({'raw_text': text}, role_info)
+                        analysis = _analyze_resume(text, selected_category, selected_role)
                         
                         # Check if analysis returned an error
                         if 'error' in analysis:
@@ -1468,25 +2176,19 @@ class ResumeApp:
                             'template': ''
                         }
 
-                        # Save to database
-                        try:
-                            resume_id = save_resume_data(resume_data)
-
-                            # Save analysis data
-                            analysis_data = {
-                                'resume_id': resume_id,
-                                'ats_score': analysis['ats_score'],
-                                'keyword_match_score': analysis['keyword_match']['score'],
-                                'format_score': analysis['format_score'],
-                                'section_score': analysis['section_score'],
-                                'missing_skills': ','.join(analysis['keyword_match']['missing_skills']),
-                                'recommendations': ','.join(analysis['suggestions'])
-                            }
-                            save_analysis_data(resume_id, analysis_data)
-                            st.success("Resume data saved successfully!")
-                        except Exception as e:
-                            st.error(f"Error saving to database: {str(e)}")
-                            print(f"Database error: {e}")
+                        # Save to database in the background; the resume ID is filled in
+                        # once the resume row exists
+                        analysis_data = {
+                            'resume_id': None,
+                            'ats_score': analysis['ats_score'],
+                            'keyword_match_score': analysis['keyword_match']['score'],
+                            'format_score': analysis['format_score'],
+                            'section_score': analysis['section_score'],
+                            'missing_skills': ','.join(analysis['keyword_match']['missing_skills']),
+                            'recommendations': ','.join(analysis['suggestions'])
+                        }
+                        _submit_db_write(_save_resume_with_analysis, resume_data, analysis_data)
+                        st.info("Resume data queued for saving; a failed save is reported on your next action.")
 
                         # Show results based on document type
                         if analysis.get('document_type') != 'resume':
@@ -1499,55 +2201,15 @@ class ResumeApp:
 
                     with col1:
                         # ATS Score Card with circular progress
-                        st.markdown("""
-                        <div class="feature-card">
-                            <h2>ATS Score</h2>
-                            <div style="position: relative; width: 150px; height: 150px; margin: 0 auto;">
-                                <div style="
-                                    position: absolute;
-                                    width: 150px;
-                                    height: 150px;
-                                    border-radius: 50%;
-                                    background: conic-gradient(
-                                        #4CAF50 0% {score}%,
-                                        #2c2c2c {score}% 100%
-                                    );
-                                    display: flex;
-                                    align-items: center;
-                                    justify-content: center;
-                                ">
-                                    <div style="
-                                        width: 120px;
-                                        height: 120px;
-                                        background: #1a1a1a;
-                                        border-radius: 50%;
-                                        display: flex;
-                                        align-items: center;
-                                        justify-content: center;
-                                        font-size: 24px;
-                                        font-weight: bold;
-                                        color: {color};
-                                    ">
-                                        {score}
-                                    </div>
-                                </div>
-                            </div>
-                            <div style="text-align: center; margin-top: 10px;">
-                                <span style="
-                                    font-size: 1.2em;
-                                    color: {color};
-                                    font-weight: bold;
-                                ">
-                                    {status}
-                                </span>
-                            </div>
-                        """.format(
-                            score=analysis['ats_score'],
-                            color='#4CAF50' if analysis['ats_score'] >= 80 else '#FFA500' if analysis[
-                                'ats_score'] >= 60 else '#FF4444',
-                            status='Excellent' if analysis['ats_score'] >= 80 else 'Good' if analysis[
-                                'ats_score'] >= 60 else 'Needs Improvement'
-                        ), unsafe_allow_html=True)
+                        ats_score = analysis['ats_score']
+                        if ats_score >= 80:
+                            color, status = '#4CAF50', 'Excellent'
+                        elif ats_score >= 60:
+                            color, status = '#FFA500', 'Good'
+                        else:
+                            color, status = '#FF4444', 'Needs Improvement'
+                        st.markdown(ATS_CARD_TEMPLATE.format(score=ats_score, color=color, status=status),
+                                    unsafe_allow_html=True)
 
                         st.markdown("</div>", unsafe_allow_html=True)
 
@@ -1562,10 +2224,10 @@ class ResumeApp:
                         st.metric(
                             "Keyword Match", f"{int(analysis.get('keyword_match', {}).get('score', 0))}%")
 
-                        if analysis['keyword_match']['missing_skills']:
-                            st.markdown("#### Missing Skills:")
-                            for skill in analysis['keyword_match']['missing_skills']:
-                                st.markdown(f"- {skill}")
+                        missing_skills = analysis['keyword_match']['missing_skills']
+                        if missing_skills:
+                            st.markdown("#### Missing Skills:\n" +
+                                        "\n".join(f"- {skill}" for skill in missing_skills))
 
                         st.markdown("</div>", unsafe_allow_html=True)
 
@@ -1589,104 +2251,11 @@ class ResumeApp:
                             <h2>📋 Resume Improvement Suggestions</h2>
                         """, unsafe_allow_html=True)
 
-                            # Contact Section
-                        if analysis.get('contact_suggestions'):
-                                st.markdown("""
-                                <div style='background-color: #1e1e1e; padding: 15px; border-radius: 10px; margin: 10px 0;'>
-                                    <h3 style='color: #4CAF50; margin-bottom: 10px;'>📞 Contact Information</h3>
-                                    <ul style='list-style-type: none; padding-left: 0;'>
-                                """, unsafe_allow_html=True)
-                                for suggestion in analysis.get(
-                                    'contact_suggestions', []):
-                                    st.markdown(
-    f"<li style='margin-bottom: 8px;'>✓ {suggestion}</li>",
-     unsafe_allow_html=True)
-                                st.markdown(
-    "</ul></div>", unsafe_allow_html=True)
-
-                            # Summary Section
-                        if analysis.get('summary_suggestions'):
-                                st.markdown("""
-                                <div style='background-color: #1e1e1e; padding: 15px; border-radius: 10px; margin: 10px 0;'>
-                                    <h3 style='color: #4CAF50; margin-bottom: 10px;'>📝 Professional Summary</h3>
-                                    <ul style='list-style-type: none; padding-left: 0;'>
-                                """, unsafe_allow_html=True)
-                                for suggestion in analysis.get(
-                                    'summary_suggestions', []):
-                                    st.markdown(
-    f"<li style='margin-bottom: 8px;'>✓ {suggestion}</li>",
-     unsafe_allow_html=True)
-                                st.markdown(
-    "</ul></div>", unsafe_allow_html=True)
-
-                            # Skills Section
-                        if analysis.get(
-                            'skills_suggestions') or analysis['keyword_match']['missing_skills']:
-                                st.markdown("""
-                                <div style='background-color: #1e1e1e; padding: 15px; border-radius: 10px; margin: 10px 0;'>
-                                    <h3 style='color: #4CAF50; margin-bottom: 10px;'>🎯 Skills</h3>
-                                    <ul style='list-style-type: none; padding-left: 0;'>
-                                """, unsafe_allow_html=True)
-                                for suggestion in analysis.get(
-                                    'skills_suggestions', []):
-                                    st.markdown(
-    f"<li style='margin-bottom: 8px;'>✓ {suggestion}</li>",
-     unsafe_allow_html=True)
-                                if analysis['keyword_match']['missing_skills']:
-                                    st.markdown(
-    "<li style='margin-bottom: 8px;'>✓ Consider adding these relevant skills:</li>",
-     unsafe_allow_html=True)
-                                    for skill in analysis['keyword_match']['missing_skills']:
-                                        st.markdown(
-    f"<li style='margin-left: 20px; margin-bottom: 4px;'>• {skill}</li>",
-     unsafe_allow_html=True)
-                                st.markdown(
-    "</ul></div>", unsafe_allow_html=True)
-
-                            # Experience Section
-                        if analysis.get('experience_suggestions'):
-                                st.markdown("""
-                                <div style='background-color: #1e1e1e; padding: 15px; border-radius: 10px; margin: 10px 0;'>
-                                    <h3 style='color: #4CAF50; margin-bottom: 10px;'>💼 Work Experience</h3>
-                                    <ul style='list-style-type: none; padding-left: 0;'>
-                                """, unsafe_allow_html=True)
-                                for suggestion in analysis.get(
-                                    'experience_suggestions', []):
-                                    st.markdown(
-    f"<li style='margin-bottom: 8px;'>✓ {suggestion}</li>",
-     unsafe_allow_html=True)
-                                st.markdown(
-    "</ul></div>", unsafe_allow_html=True)
-
-                            # Education Section
-                        if analysis.get('education_suggestions'):
-                                st.markdown("""
-                                <div style='background-color: #1e1e1e; padding: 15px; border-radius: 10px; margin: 10px 0;'>
-                                    <h3 style='color: #4CAF50; margin-bottom: 10px;'>🎓 Education</h3>
-                                    <ul style='list-style-type: none; padding-left: 0;'>
-                                """, unsafe_allow_html=True)
-                                for suggestion in analysis.get(
-                                    'education_suggestions', []):
-                                    st.markdown(
-    f"<li style='margin-bottom: 8px;'>✓ {suggestion}</li>",
-     unsafe_allow_html=True)
-                                st.markdown(
-    "</ul></div>", unsafe_allow_html=True)
-
-                            # General Formatting Suggestions
-                        if analysis.get('format_suggestions'):
-                                st.markdown("""
-                                <div style='background-color: #1e1e1e; padding: 15px; border-radius: 10px; margin: 10px 0;'>
-                                    <h3 style='color: #4CAF50; margin-bottom: 10px;'>📄 Formatting</h3>
-                                    <ul style='list-style-type: none; padding-left: 0;'>
-                                """, unsafe_allow_html=True)
-                                for suggestion in analysis.get(
-                                    'format_suggestions', []):
-                                    st.markdown(
-    f"<li style='margin-bottom: 8px;'>✓ {suggestion}</li>",
-     unsafe_allow_html=True)
-                                st.markdown(
-    "</ul></div>", unsafe_allow_html=True)
+                        for key, emoji, title in SUGGESTION_SECTIONS:
+                            items = analysis.get(key) or ()
+                            extra = missing_skills if key == 'skills_suggestions' else ()
+                            if items or extra:
+                                render_suggestion_block(title, emoji, items, extra)
 
                         st.markdown("</div>", unsafe_allow_html=True)
 
@@ -1696,24 +2265,14 @@ class ResumeApp:
                             <h2>📚 Recommended Courses</h2>
                         """, unsafe_allow_html=True)
 
-                        # Get courses based on role and category
-                    courses = get_courses_for_role(selected_role)
-                    if not courses:
-                            category = get_category_for_role(selected_role)
-                            courses = COURSES_BY_CATEGORY.get(
-                                category, {}).get(selected_role, [])
-
-                        # Display courses in a grid
-                    cols = st.columns(2)
-                    for i, course in enumerate(
-                        courses[:6]):  # Show top 6 courses
-                            with cols[i % 2]:
-                                st.markdown(f"""
-                                <div style='background-color: #1e1e1e; padding: 15px; border-radius: 10px; margin: 10px 0;'>
-                                    <h4>{course[0]}</h4>
-                                    <a href='{course[1]}' target='_blank'>View Course</a>
-                                </div>
-                                """, unsafe_allow_html=True)
+                        # Get courses for the role from the flat role -> courses table
+                    top_courses = COURSES_BY_ROLE.get(selected_role, [])[:6]
+
+                        # Display the top 6 courses in a grid
+                    if top_courses:
+                        st.markdown(course_grid_html(top_courses), unsafe_allow_html=True)
+                    else:
+                        st.info("No course recommendations are available for this role yet.")
 
                     st.markdown("</div>", unsafe_allow_html=True)
 
@@ -1723,25 +2282,7 @@ class ResumeApp:
                             <h2>📺 Helpful Videos</h2>
                         """, unsafe_allow_html=True)
 
-                    tab1, tab2 = st.tabs(["Resume Tips", "Interview Tips"])
-
-                    with tab1:
-                            # Resume Videos
-                            for category, videos in RESUME_VIDEOS.items():
-                                st.subheader(category)
-                                cols = st.columns(2)
-                                for i, video in enumerate(videos):
-                                    with cols[i % 2]:
-                                        st.video(video[1])
-
-                    with tab2:
-                            # Interview Videos
-                            for category, videos in INTERVIEW_VIDEOS.items():
-                                st.subheader(category)
-                                cols = st.columns(2)
-                                for i, video in enumerate(videos):
-                                    with cols[i % 2]:
-                                        st.video(video[1])
+                    render_learning_resources()
 
                     st.markdown("</div>", unsafe_allow_html=True)
 
@@ -1780,1098 +2321,248 @@ class ResumeApp:
                 </div>
                 """, unsafe_allow_html=True)
              
-                        # Add AI Analyzer Stats in an expander
-            with st.expander("📊 AI Analyzer Statistics", expanded=False):
-                try:
-                    # Add a reset button for admin users
-                    if st.session_state.get('is_admin', False):
-                        if st.button(
-    "🔄 Reset AI Analysis Statistics",
-    type="secondary",
-     key="reset_ai_stats_button_2"):
-                            from config.database import reset_ai_analysis_stats
-                            result = reset_ai_analysis_stats()
-                            if result["success"]:
-                                st.success(result["message"])
-                            else:
-                                st.error(result["message"])
-                            # Refresh the page to show updated stats
-                            st.experimental_rerun()
-
-                    # Get detailed AI analysis statistics
-                    from config.database import get_detailed_ai_analysis_stats
-                    ai_stats = get_detailed_ai_analysis_stats()
-
-                    if ai_stats["total_analyses"] > 0:
-                        # Create a more visually appealing layout
-                        st.markdown("""
-                        <style>
-                        .stats-card {
-                            background: linear-gradient(135deg, #1e3c72, #2a5298);
-                            border-radius: 10px;
-                            padding: 15px;
-                            margin-bottom: 15px;
-                            box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
-                            text-align: center;
-                        }
-                        .stats-value {
-                            font-size: 28px;
-                            font-weight: bold;
-                            color: white;
-                            margin: 10px 0;
-                        }
-                        .stats-label {
-                            font-size: 14px;
-                            color: rgba(255, 255, 255, 0.8);
-                            text-transform: uppercase;
-                            letter-spacing: 1px;
-                        }
-                        .score-card {
-                            background: linear-gradient(135deg, #11998e, #38ef7d);
-                            border-radius: 10px;
-                            padding: 15px;
-                            margin-bottom: 15px;
-                            box-shadow: 0 4px 6px rgba(0, 0, 0, 0.1);
-                            text-align: center;
-                        }
-                        </style>
-                        """, unsafe_allow_html=True)
-
-                        col1, col2, col3 = st.columns(3)
-
-                        with col1:
-                            st.markdown(f"""
-                            <div class="stats-card">
-                                <div class="stats-label">Total AI Analyses</div>
-                                <div class="stats-value">{ai_stats["total_analyses"]}</div>
-                            </div>
-                            """, unsafe_allow_html=True)
+            # Add AI Analyzer Stats in an expander
+            render_ai_stats_panel()
 
-                        with col2:
-                            # Determine color based on score
-                            score_color = "#38ef7d" if ai_stats["average_score"] >= 80 else "#FFEB3B" if ai_stats[
-                                "average_score"] >= 60 else "#FF5252"
-                            st.markdown(f"""
-                            <div class="stats-card" style="background: linear-gradient(135deg, #2c3e50, {score_color});">
-                                <div class="stats-label">Average Resume Score</div>
-                                <div class="stats-value">{ai_stats["average_score"]}/100</div>
-                            </div>
-                            """, unsafe_allow_html=True)
+            # Job Role Selection for AI Analysis
+            categories = self._categories
+            selected_category = st.selectbox(
+    "Job Category", categories, key="ai_category")
 
-                        with col3:
-                            # Create a gauge chart for average score
-                            import plotly.graph_objects as go
-                            fig = go.Figure(go.Indicator(
-                                mode="gauge+number",
-                                value=ai_stats["average_score"],
-                                domain={'x': [0, 1], 'y': [0, 1]},
-                                title={
-    'text': "Score", 'font': {
-        'size': 14, 'color': 'white'}},
-                                gauge={
-                                    'axis': {'range': [0, 100], 'tickwidth': 1, 'tickcolor': "white"},
-                                    'bar': {'color': "#38ef7d" if ai_stats["average_score"] >= 80 else "#FFEB3B" if ai_stats["average_score"] >= 60 else "#FF5252"},
-                                    'bgcolor': "rgba(0,0,0,0)",
-                                    'borderwidth': 2,
-                                    'bordercolor': "white",
-                                    'steps': [
-                                        {'range': [
-                                            0, 40], 'color': 'rgba(255, 82, 82, 0.3)'},
-                                        {'range': [
-                                            40, 70], 'color': 'rgba(255, 235, 59, 0.3)'},
-                                        {'range': [
-                                            70, 100], 'color': 'rgba(56, 239, 125, 0.3)'}
-                                    ],
-                                }
-                            ))
-
-                            fig.update_layout(
-                                paper_bgcolor='rgba(0,0,0,0)',
-                                plot_bgcolor='rgba(0,0,0,0)',
-                                font={'color': "white"},
-                                height=150,
-                                margin=dict(l=10, r=10, t=30, b=10)
-                            )
+            roles = self._roles_by_cat[selected_category]
+            selected_role = st.selectbox("Specific Role", roles, key="ai_role")
 
-                            st.plotly_chart(fig, use_container_width=True)
-
-                        # Display model usage with enhanced visualization
-                        if ai_stats["model_usage"]:
-                            st.markdown("### 🤖 Model Usage")
-                            model_data = pd.DataFrame(ai_stats["model_usage"])
-
-                            # Create a more colorful pie chart
-                            import plotly.express as px
-                            fig = px.pie(
-                                model_data,
-                                values="count",
-                                names="model",
-                                color_discrete_sequence=px.colors.qualitative.Bold,
-                                hole=0.4
-                            )
+            role_info = self.job_roles[selected_category][selected_role]
 
-                            fig.update_traces(
-                                textposition='inside',
-                                textinfo='percent+label',
-                                marker=dict(
-    line=dict(
-        color='#000000',
-         width=1.5))
-                            )
+            # Display role information
+            st.markdown(ROLE_INFO_TEMPLATE.format(
+                role=selected_role,
+                description=role_info['description'],
+                skills=', '.join(role_info['required_skills'])
+            ), unsafe_allow_html=True)
 
-                            fig.update_layout(
-                                margin=dict(l=20, r=20, t=30, b=20),
-                                height=300,
-                                paper_bgcolor='rgba(0,0,0,0)',
-                                plot_bgcolor='rgba(0,0,0,0)',
-                                font=dict(color="#ffffff", size=14),
-                                legend=dict(
-                                    orientation="h",
-                                    yanchor="bottom",
-                                    y=-0.1,
-                                    xanchor="center",
-                                    x=0.5
-                                ),
-                                title={
-                                    'text': 'AI Model Distribution',
-                                    'y': 0.95,
-                                    'x': 0.5,
-                                    'xanchor': 'center',
-                                    'yanchor': 'top',
-                                    'font': {'size': 18, 'color': 'white'}
-                                }
-                            )
+            # Upload and analysis run as a fragment so the Analyze click
+            # doesn't rerun the role pickers and stats panel above it
+            self._render_ai_analysis(ai_model, selected_role,
+                                     use_custom_job_desc, custom_job_description)
 
-                            st.plotly_chart(fig, use_container_width=True)
-
-                        # Display top job roles with enhanced visualization
-                        if ai_stats["top_job_roles"]:
-                            st.markdown("### 🎯 Top Job Roles")
-                            roles_data = pd.DataFrame(
-                                ai_stats["top_job_roles"])
-
-                            # Create a more colorful bar chart
-                            fig = px.bar(
-                                roles_data,
-                                x="role",
-                                y="count",
-                                color="count",
-                                color_continuous_scale=px.colors.sequential.Viridis,
-                                labels={
-    "role": "Job Role", "count": "Number of Analyses"}
-                            )
+        st.toast("Check out these repositories: [Awesome Java](https://github.com/Hunterdii/Awesome-Java)", icon="ℹ️")
 
-                            fig.update_traces(
-                                marker_line_width=1.5,
-                                marker_line_color="white",
-                                opacity=0.9
-                            )
+    @st.fragment
+    def _render_ai_analysis(self, ai_model, selected_role, use_custom_job_desc, custom_job_description):
+        """Upload, Analyze with AI button and the AI report for the selected role"""
+        # File Upload for AI Analysis
+        uploaded_file = st.file_uploader(
+            "Upload your resume", type=['pdf', 'docx'], key="ai_file")
 
-                            fig.update_layout(
-                                margin=dict(l=20, r=20, t=50, b=30),
-                                height=350,
-                                paper_bgcolor='rgba(0,0,0,0)',
-                                plot_bgcolor='rgba(0,0,0,0)',
-                                font=dict(color="#ffffff", size=14),
-                                title={
-                                    'text': 'Most Analyzed Job Roles',
-                                    'y': 0.95,
-                                    'x': 0.5,
-                                    'xanchor': 'center',
-                                    'yanchor': 'top',
-                                    'font': {'size': 18, 'color': 'white'}
-                                },
-                                xaxis=dict(
-                                    title="",
-                                    tickangle=-45,
-                                    tickfont=dict(size=12)
-                                ),
-                                yaxis=dict(
-                                    title="Number of Analyses",
-                                    gridcolor="rgba(255, 255, 255, 0.1)"
-                                ),
-                                coloraxis_showscale=False
-                            )
+        if not uploaded_file:
+            # Display empty state with a prominent upload button
+            st.markdown(
+                self.render_empty_state(
+                    "fas fa-robot",
+                    "Upload your resume to get AI-powered analysis and recommendations"
+                ),
+                unsafe_allow_html=True
+            )
+        else:
+            # Add a prominent analyze button
+            analyze_ai = st.button("🤖 Analyze with AI",
+                            type="primary",
+                            use_container_width=True,
+                            key="analyze_ai_button")
+
+            if analyze_ai:
+                with st.spinner(f"Analyzing your resume with {ai_model}..."):
+                    # Extract the resume text once; re-clicks with the same file hit the cache
+                    try:
+                        file_buffer = uploaded_file.getbuffer()
+                        resume_text = _extract_ai_text(_upload_key(file_buffer), uploaded_file.type, file_buffer)
+                    except Exception as e:
+                        st.error(f"Error reading file: {str(e)}")
+                        st.stop()
 
-                            st.plotly_chart(fig, use_container_width=True)
-
-                            # Add a timeline chart for analysis over time (mock
-                            # data for now)
-                            st.markdown("### 📈 Analysis Trend")
-                            st.info(
-                                "This is a conceptual visualization. To implement actual time-based analysis, additional data collection would be needed.")
-
-                            # Create mock data for timeline
-                            import datetime
-                            import numpy as np
-
-                            today = datetime.datetime.now()
-                            dates = [
-    (today -
-    datetime.timedelta(
-        days=i)).strftime('%Y-%m-%d') for i in range(7)]
-                            dates.reverse()
-
-                            # Generate some random data that sums to
-                            # total_analyses
-                            total = ai_stats["total_analyses"]
-                            if total > 7:
-                                values = np.random.dirichlet(
-                                    np.ones(7)) * total
-                                values = [round(v) for v in values]
-                                # Adjust to make sure sum equals total
-                                diff = total - sum(values)
-                                values[-1] += diff
+                    # Analyze with AI
+                    try:
+                        # Show a loading animation
+                        with st.spinner("🧠 AI is analyzing your resume..."):
+                            # Get the selected model
+                            selected_model = "Google Gemini"
+
+                            # Get the job role
+                            job_role = selected_role if selected_role else "Not specified"
+
+                            # The Gemini call is the only slow step, so the bar moves
+                            # just before it and once everything is saved
+                            progress_bar = st.progress(30)
+
+                            # Analyze the resume with Google Gemini
+                            if use_custom_job_desc and custom_job_description:
+                                # Use custom job description for analysis
+                                analysis_result = _ai_analyze_resume(
+                                    resume_text, job_role, custom_job_description)
+                                # Show that custom job description was used
+                                st.session_state['used_custom_job_desc'] = True
                             else:
-                                values = [0] * 7
-                                for i in range(total):
-                                    values[-(i % 7) - 1] += 1
-
-                            trend_data = pd.DataFrame({
-                                'Date': dates,
-                                'Analyses': values
-                            })
-
-                            fig = px.line(
-                                trend_data,
-                                x='Date',
-                                y='Analyses',
-                                markers=True,
-                                line_shape='spline',
-                                color_discrete_sequence=["#38ef7d"]
-                            )
+                                # Use standard role-based analysis
+                                analysis_result = _ai_analyze_resume(resume_text, job_role)
+                                st.session_state['used_custom_job_desc'] = False
 
-                            fig.update_traces(
-                                line=dict(width=3),
-                                marker=dict(
-    size=8, line=dict(
-        width=2, color='white'))
-                            )
+                            if not analysis_result or "error" in analysis_result:
+                                progress_bar.empty()
+                                st.error(f"Analysis failed: {(analysis_result or {}).get('error', 'Unknown error')}")
+                                return
 
-                            fig.update_layout(
-                                margin=dict(l=20, r=20, t=50, b=30),
-                                height=300,
-                                paper_bgcolor='rgba(0,0,0,0)',
-                                plot_bgcolor='rgba(0,0,0,0)',
-                                font=dict(color="#ffffff", size=14),
-                                title={
-                                    'text': 'Analysis Activity (Last 7 Days)',
-                                    'y': 0.95,
-                                    'x': 0.5,
-                                    'xanchor': 'center',
-                                    'yanchor': 'top',
-                                    'font': {'size': 18, 'color': 'white'}
-                                },
-                                xaxis=dict(
-                                    title="",
-                                    gridcolor="rgba(255, 255, 255, 0.1)"
-                                ),
-                                yaxis=dict(
-                                    title="Number of Analyses",
-                                    gridcolor="rgba(255, 255, 255, 0.1)"
+                            resume_score = analysis_result.get("resume_score", 0)
+
+                            # Saved in the script thread rather than the background writer,
+                            # because saving also clears the cached AI statistics
+                            try:
+                                save_ai_analysis_data(
+                                    None,  # No user_id needed
+                                    {
+                                        "model_used": selected_model,
+                                        "resume_score": resume_score,
+                                        "job_role": job_role
+                                    }
                                 )
-                            )
+                            except Exception as e:
+                                logger.warning("Failed to save AI analysis: %s", e)
+                                st.warning(f"⚠️ Analysis complete, but it could not be saved to the database: {e}")
+                            # show snowflake effect (first analysis only)
+                            _snow_once()
 
-                            st.plotly_chart(fig, use_container_width=True)
+                            # Complete the progress
+                            progress_bar.progress(100)
 
-                        # Display score distribution if available
-                        if ai_stats["score_distribution"]:
-                            st.markdown("""
-                            <h3 style='text-align: center; margin-bottom: 20px; background: linear-gradient(90deg, #4b6cb7, #182848); padding: 15px; border-radius: 10px; color: white; box-shadow: 0 4px 10px rgba(0,0,0,0.2);'>
-                                📊 Score Distribution Analysis
-                            </h3>
-                            """, unsafe_allow_html=True)
+                            # Display the analysis result
+                            st.success("✅ Analysis complete!")
 
-                            score_data = pd.DataFrame(
-                                ai_stats["score_distribution"])
-
-                            # Create a more visually appealing bar chart for
-                            # score distribution
-                            fig = px.bar(
-                                score_data,
-                                x="range",
-                                y="count",
-                                color="range",
-                                color_discrete_map={
-                                    "0-20": "#FF5252",
-                                    "21-40": "#FF7043",
-                                    "41-60": "#FFEB3B",
-                                    "61-80": "#8BC34A",
-                                    "81-100": "#38ef7d"
-                                },
-                                labels={
-    "range": "Score Range",
-     "count": "Number of Resumes"},
-                                text="count"  # Display count values on bars
-                            )
+                            # Extract data from the analysis
+                            full_response = analysis_result.get(
+                                "analysis", "")
+                            ats_score = analysis_result.get(
+                                "ats_score", 0)
+                            model_used = analysis_result.get(
+                                "model_used", selected_model)
 
-                            fig.update_traces(
-                                marker_line_width=2,
-                                marker_line_color="white",
-                                opacity=0.9,
-                                textposition='outside',
-                                textfont=dict(
-    color="white", size=14, family="Arial, sans-serif"),
-                                hovertemplate="<b>Score Range:</b> %{x}<br><b>Number of Resumes:</b> %{y}<extra></extra>"
-                            )
+                            # Store the full response in session state for download
+                            st.session_state['full_analysis'] = full_response
 
-                            # Add a gradient background to the chart
-                            fig.update_layout(
-                                margin=dict(l=20, r=20, t=50, b=30),
-                                height=400,  # Increase height for better visibility
-                                paper_bgcolor='rgba(0,0,0,0)',
-                                plot_bgcolor='rgba(0,0,0,0)',
-                                font=dict(
-    color="#ffffff", size=14, family="Arial, sans-serif"),
-                                # title={
-                                #     # 'text': 'Resume Score Distribution',
-                                #     'y': 0.95,
-                                #     'x': 0.5,
-                                #     'xanchor': 'center',
-                                #     'yanchor': 'top',
-                                #     'font': {'size': 22, 'color': 'white', 'family': 'Arial, sans-serif', 'weight': 'bold'}
-                                # },
-                                xaxis=dict(
-                                    title=dict(
-    text="Score Range", font=dict(
-        size=16, color="white")),
-                                    categoryorder="array",
-                                    categoryarray=[
-    "0-20", "21-40", "41-60", "61-80", "81-100"],
-                                    tickfont=dict(size=14, color="white"),
-                                    gridcolor="rgba(255, 255, 255, 0.1)"
-                                ),
-                                yaxis=dict(
-                                    title=dict(
-    text="Number of Resumes", font=dict(
-        size=16, color="white")),
-                                    tickfont=dict(size=14, color="white"),
-                                    gridcolor="rgba(255, 255, 255, 0.1)",
-                                    zeroline=False
-                                ),
-                                showlegend=False,
-                                bargap=0.2,  # Adjust gap between bars
-                                shapes=[
-                                    # Add gradient background
-                                    dict(
-                                        type="rect",
-                                        xref="paper",
-                                        yref="paper",
-                                        x0=0,
-                                        y0=0,
-                                        x1=1,
-                                        y1=1,
-                                        fillcolor="rgba(26, 26, 44, 0.5)",
-                                        layer="below",
-                                        line_width=0,
-                                    )
-                                ]
-                            )
+                            # Display the analysis in a nice format
+                            st.markdown("## Full Analysis Report")
 
-                            # Add annotations for insights
-                            if len(score_data) > 0:
-                                max_count_idx = score_data["count"].idxmax()
-                                max_range = score_data.iloc[max_count_idx]["range"]
-                                max_count = score_data.iloc[max_count_idx]["count"]
-
-                                fig.add_annotation(
-                                    x=0.5,
-                                    y=1.12,
-                                    xref="paper",
-                                    yref="paper",
-                                    text=f"Most resumes fall in the {max_range} score range",
-                                    showarrow=False,
-                                    font=dict(size=14, color="#FFEB3B"),
-                                    bgcolor="rgba(0,0,0,0.5)",
-                                    bordercolor="#FFEB3B",
-                                    borderwidth=1,
-                                    borderpad=4,
-                                    opacity=0.8
-                                )
+                            # Get current date
+                            current_date = datetime.datetime.now().strftime("%B %d, %Y")
 
-                            # Display the chart in a styled container
-                            st.markdown("""
-                            <div style='background: linear-gradient(135deg, #1e3c72, #2a5298); padding: 20px; border-radius: 15px; margin: 10px 0; box-shadow: 0 5px 15px rgba(0,0,0,0.2);'>
+                            # Create a modern styled header for the report
+                            st.markdown(f"""
+                            <div style="background-color: #262730; padding: 20px; border-radius: 10px; margin-bottom: 20px;">
+                                <h2 style="color: #ffffff; margin-bottom: 10px;">AI Resume Analysis Report</h2>
+                                <div style="display: flex; flex-wrap: wrap; gap: 20px;">
+                                    <div style="flex: 1; min-width: 200px;">
+                                        <p style="color: #ffffff;"><strong>Job Role:</strong> {job_role if job_role else "Not specified"}</p>
+                                        <p style="color: #ffffff;"><strong>Analysis Date:</strong> {current_date}</p>                                                                                                                                        </div>
+                                    <div style="flex: 1; min-width: 200px;">
+                                        <p style="color: #ffffff;"><strong>AI Model:</strong> {model_used}</p>
+                                        <p style="color: #ffffff;"><strong>Overall Score:</strong> {resume_score}/100 - {SCORE_STATUS[score_band(resume_score)]}</p>
+                                        {f'<p style="color: #4CAF50;"><strong>✓ Custom Job Description Used</strong></p>' if st.session_state.get('used_custom_job_desc', False) else ''}
+                            </div>
                             """, unsafe_allow_html=True)
 
-                            st.plotly_chart(fig, use_container_width=True)
+                            # Add gauge charts for scores
+                            col1, col2 = st.columns(2)
 
-                            # Add descriptive text below the chart
-                            st.markdown("""
-                            <p style='color: white; text-align: center; font-style: italic; margin-top: 10px;'>
-                                This chart shows the distribution of resume scores across different ranges, helping identify common performance levels.
-                            </p>
-                            </div>
-                            """, unsafe_allow_html=True)
+                            with col1:
+                                st.plotly_chart(build_result_gauge(resume_score, "Resume Score"), use_container_width=True,
+                                                config=STATIC_CHART_CONFIG)
 
-                        # Display recent analyses if available
-                        if ai_stats["recent_analyses"]:
-                            st.markdown("""
-                            <h3 style='text-align: center; margin-bottom: 20px; background: linear-gradient(90deg, #4b6cb7, #182848); padding: 15px; border-radius: 10px; color: white; box-shadow: 0 4px 10px rgba(0,0,0,0.2);'>
-                                🕒 Recent Resume Analyses
-                            </h3>
-                            """, unsafe_allow_html=True)
+                                status = SCORE_STATUS[score_band(resume_score)]
+                                st.markdown(f"<div style='text-align: center; font-weight: bold;'>{status}</div>", unsafe_allow_html=True)
 
-                            # Create a more modern styled table for recent
-                            # analyses
-                            st.markdown("""
-                            <style>
-                            .modern-analyses-table {
-                                width: 100%;
-                                border-collapse: separate;
-                                border-spacing: 0 8px;
-                                margin-bottom: 20px;
-                                font-family: 'Arial', sans-serif;
-                            }
-                            .modern-analyses-table th {
-                                background: linear-gradient(135deg, #1e3c72, #2a5298);
-                                color: white;
-                                padding: 15px;
-                                text-align: left;
-                                font-weight: bold;
-                                font-size: 14px;
-                                text-transform: uppercase;
-                                letter-spacing: 1px;
-                                border-radius: 8px;
-                            }
-                            .modern-analyses-table td {
-                                padding: 15px;
-                                background-color: rgba(30, 30, 30, 0.7);
-                                border-top: 1px solid rgba(255, 255, 255, 0.05);
-                                border-bottom: 1px solid rgba(0, 0, 0, 0.2);
-                                color: white;
-                            }
-                            .modern-analyses-table tr td:first-child {
-                                border-top-left-radius: 8px;
-                                border-bottom-left-radius: 8px;
-                            }
-                            .modern-analyses-table tr td:last-child {
-                                border-top-right-radius: 8px;
-                                border-bottom-right-radius: 8px;
-                            }
-                            .modern-analyses-table tr:hover td {
-                                background-color: rgba(60, 60, 60, 0.7);
-                                transform: translateY(-2px);
-                                transition: all 0.2s ease;
-                                box-shadow: 0 5px 15px rgba(0, 0, 0, 0.1);
-                            }
-                            .model-badge {
-                                display: inline-block;
-                                padding: 6px 12px;
-                                border-radius: 20px;
-                                font-weight: bold;
-                                text-align: center;
-                                font-size: 12px;
-                                letter-spacing: 0.5px;
-                                box-shadow: 0 2px 5px rgba(0, 0, 0, 0.1);
-                            }
-                            .model-gemini {
-                                background: linear-gradient(135deg, #4e54c8, #8f94fb);
-                                color: white;
-                            }
-                            .model-claude {
-                                background: linear-gradient(135deg, #834d9b, #d04ed6);
-                                color: white;
-                            }
-                            .score-pill {
-                                display: inline-block;
-                                padding: 8px 15px;
-                                border-radius: 20px;
-                                font-weight: bold;
-                                text-align: center;
-                                min-width: 70px;
-                                box-shadow: 0 2px 5px rgba(0, 0, 0, 0.1);
-                            }
-                            .score-high {
-                                background: linear-gradient(135deg, #11998e, #38ef7d);
-                                color: white;
-                            }
-                            .score-medium {
-                                background: linear-gradient(135deg, #f2994a, #f2c94c);
-                                color: white;
-                            }
-                            .score-low {
-                                background: linear-gradient(135deg, #cb2d3e, #ef473a);
-                                color: white;
-                            }
-                            .date-badge {
-                                display: inline-block;
-                                padding: 6px 12px;
-                                border-radius: 20px;
-                                background-color: rgba(255, 255, 255, 0.1);
-                                color: #e0e0e0;
-                                font-size: 12px;
-                            }
-                            .role-badge {
-                                display: inline-block;
-                                padding: 6px 12px;
-                                border-radius: 8px;
-                                background-color: rgba(33, 150, 243, 0.2);
-                                color: #90caf9;
-                                font-size: 13px;
-                                max-width: 200px;
-                                white-space: nowrap;
-                                overflow: hidden;
-                                text-overflow: ellipsis;
-                            }
-                            </style>
-
-                            <div style='background: linear-gradient(135deg, #1e3c72, #2a5298); padding: 20px; border-radius: 15px; margin: 10px 0; box-shadow: 0 5px 15px rgba(0,0,0,0.2);'>
-                            <table class="modern-analyses-table">
-                                <tr>
-                                    <th>AI Model</th>
-                                    <th>Score</th>
-                                    <th>Job Role</th>
-                                    <th>Date</th>
-                                </tr>
-                            """, unsafe_allow_html=True)
+                            with col2:
+                                st.plotly_chart(build_result_gauge(ats_score, "ATS Optimization Score"), use_container_width=True,
+                                                config=STATIC_CHART_CONFIG)
 
-                            for analysis in ai_stats["recent_analyses"]:
-                                score = analysis["score"]
-                                score_class = "score-high" if score >= 80 else "score-medium" if score >= 60 else "score-low"
+                                status = SCORE_STATUS[score_band(ats_score)]
+                                st.markdown(f"<div style='text-align: center; font-weight: bold;'>{status}</div>", unsafe_allow_html=True)
 
-                                # Determine model class
-                                model_name = analysis["model"]
-                                model_class = "model-gemini" if "Gemini" in model_name else "model-claude" if "Claude" in model_name else ""
+                            # Add Job Description Match Score if custom job description was used
+                            if st.session_state.get('used_custom_job_desc', False) and custom_job_description:
+                                # Extract job match score from analysis result or calculate it
+                                job_match_score = analysis_result.get("job_match_score", 0)
+                                if not job_match_score and "job_match" in analysis_result:
+                                    job_match_score = analysis_result["job_match"].get("score", 0)
 
-                                # Format the date
-                                try:
-                                    from datetime import datetime
-                                    date_obj = datetime.strptime(
-                                        analysis["date"], "%Y-%m-%d %H:%M:%S")
-                                    formatted_date = date_obj.strftime(
-                                        "%b %d, %Y")
-                                except:
-                                    formatted_date = analysis["date"]
-
-                                st.markdown(f"""
-                                <tr>
-                                    <td><div class="model-badge {model_class}">{model_name}</div></td>
-                                    <td><div class="score-pill {score_class}">{score}/100</div></td>
-                                    <td><div class="role-badge">{analysis["job_role"]}</div></td>
-                                    <td><div class="date-badge">{formatted_date}</div></td>
-                                </tr>
-                                """, unsafe_allow_html=True)
-
-                            st.markdown("""
-                            </table>
-
-                            <p style='color: white; text-align: center; font-style: italic; margin-top: 15px;'>
-                                These are the most recent resume analyses performed by our AI models.
-                            </p>
-                            </div>
-                            """, unsafe_allow_html=True)
-                    else:
-                        st.info(
-                            "No AI analysis data available yet. Upload and analyze resumes to see statistics here.")
-                except Exception as e:
-                    st.error(f"Error loading AI analysis statistics: {str(e)}")
+                                # If we have a job match score, display it
+                                if job_match_score:
+                                    st.markdown("""
+                                    <h3 style="background: linear-gradient(90deg, #4d7c0f, #84cc16); color: white; padding: 10px; border-radius: 5px; margin-top: 20px;">
+                                        <i class="fas fa-handshake"></i> Job Description Match Analysis
+                                    </h3>
+                                    """, unsafe_allow_html=True)
 
-            # Job Role Selection for AI Analysis
-            categories = list(self.job_roles.keys())
-            selected_category = st.selectbox(
-    "Job Category", categories, key="ai_category")
+                                    col1, col2 = st.columns(2)
 
-            roles = list(self.job_roles[selected_category].keys())
-            selected_role = st.selectbox("Specific Role", roles, key="ai_role")
+                                    with col1:
+                                        st.plotly_chart(build_result_gauge(job_match_score, "Job Match Score"), use_container_width=True,
+                                                        config=STATIC_CHART_CONFIG)
 
-            role_info = self.job_roles[selected_category][selected_role]
+                                        match_status = MATCH_STATUS[score_band(job_match_score)]
+                                        st.markdown(f"<div style='text-align: center; font-weight: bold;'>{match_status}</div>", unsafe_allow_html=True)
 
-            # Display role information
-            st.markdown(f"""
-            <div style='background-color: #1e1e1e; padding: 20px; border-radius: 10px; margin: 10px 0;'>
-                <h3>{selected_role}</h3>
-                <p>{role_info['description']}</p>
-                <h4>Required Skills:</h4>
-                <p>{', '.join(role_info['required_skills'])}</p>
-            </div>
-            """, unsafe_allow_html=True)
+                                    with col2:
+                                        st.markdown(JOB_MATCH_EXPLAINER_HTML, unsafe_allow_html=True)
 
-            # File Upload for AI Analysis
-            uploaded_file = st.file_uploader(
-    "Upload your resume", type=[
-        'pdf', 'docx'], key="ai_file")
 
-            if not uploaded_file:
-            # Display empty state with a prominent upload button
-                st.markdown(
-                self.render_empty_state(
-            "fas fa-robot",
-                        "Upload your resume to get AI-powered analysis and recommendations"
-        ),
-        unsafe_allow_html=True
-    )
-            else:
-                # Add a prominent analyze button
-                analyze_ai = st.button("🤖 Analyze with AI",
-                                type="primary",
-                                use_container_width=True,
-                                key="analyze_ai_button")
+                            # Format the full response with better styling: each section
+                            # header opens a styled block that closes at the next header
+                            formatted_analysis = style_report_sections(full_response)
 
-                if analyze_ai:
-                    with st.spinner(f"Analyzing your resume with {ai_model}..."):
-                        # Get file content
-                        text = ""
-                        try:
-                            if uploaded_file.type == "application/pdf":
-                                text = self.analyzer.extract_text_from_pdf(
-                                    uploaded_file)
-                            elif uploaded_file.type == "application/vnd.openxmlformats-officedocument.wordprocessingml.document":
-                                text = self.analyzer.extract_text_from_docx(
-                                    uploaded_file)
-                            else:
-                                text = uploaded_file.getvalue().decode()
-                        except Exception as e:
-                            st.error(f"Error reading file: {str(e)}")
-                            st.stop()
+                            # Clean up any visible HTML tags that might appear in the text
+                            formatted_analysis = ESCAPED_DIV_RE.sub("", formatted_analysis)
 
-                        # Analyze with AI
-                        try:
-                            # Show a loading animation
-                            with st.spinner("🧠 AI is analyzing your resume..."):
-                                progress_bar = st.progress(0)
-                                
-                                # Get the selected model
-                                selected_model = "Google Gemini"
-                                
-                                # Update progress
-                                progress_bar.progress(10)
-                                
-                                # Extract text from the resume
-                                analyzer = AIResumeAnalyzer()
-                                if uploaded_file.type == "application/pdf":
-                                    resume_text = analyzer.extract_text_from_pdf(
-                                        uploaded_file)
-                                elif uploaded_file.type == "application/vnd.openxmlformats-officedocument.wordprocessingml.document":
-                                    resume_text = analyzer.extract_text_from_docx(
-                                        uploaded_file)
-                                else:
-                                    # For text files or other formats
-                                    resume_text = uploaded_file.getvalue().decode('utf-8')
-                                
-                                # Initialize the AI analyzer (moved after text extraction)
-                                progress_bar.progress(30)
-                                
-                                # Get the job role
-                                job_role = selected_role if selected_role else "Not specified"
-                                
-                                # Update progress
-                                progress_bar.progress(50)
-                                
-                                # Analyze the resume with Google Gemini
-                                if use_custom_job_desc and custom_job_description:
-                                    # Use custom job description for analysis
-                                    analysis_result = analyzer.analyze_resume_with_gemini(
-                                        resume_text, job_role=job_role, job_description=custom_job_description)
-                                    # Show that custom job description was used
-                                    st.session_state['used_custom_job_desc'] = True
-                                else:
-                                    # Use standard role-based analysis
-                                    analysis_result = analyzer.analyze_resume_with_gemini(
-                                        resume_text, job_role=job_role)
-                                    st.session_state['used_custom_job_desc'] = False
+                            # Report styles (.report-section, .section-content) come from style/style.css
 
-                                
-                                # Update progress
-                                progress_bar.progress(80)
-                                
-                                # Save the analysis to the database
-                                if analysis_result and "error" not in analysis_result:
-                                    # Extract the resume score
-                                    resume_score = analysis_result.get(
-                                        "resume_score", 0)
-                                    
-                                    # Save to database
-                                    save_ai_analysis_data(
-                                        None,  # No user_id needed
-                                        {
-                                            "model_used": selected_model,
-                                            "resume_score": resume_score,
-                                            "job_role": job_role
-                                        }
-                                    )
-                                # show snowflake effect
-                                st.snow()
-
-                                # Complete the progress
-                                progress_bar.progress(100)
-                                
-                                # Display the analysis result
-                                if analysis_result and "error" not in analysis_result:
-                                    st.success("✅ Analysis complete!")
-                                    
-                                    # Extract data from the analysis
-                                    full_response = analysis_result.get(
-                                        "analysis", "")
-                                    resume_score = analysis_result.get(
-                                        "resume_score", 0)
-                                    ats_score = analysis_result.get(
-                                        "ats_score", 0)
-                                    model_used = analysis_result.get(
-                                        "model_used", selected_model)
-                                    
-                                    # Store the full response in session state for download
-                                    st.session_state['full_analysis'] = full_response
-                                    
-                                    # Display the analysis in a nice format
-                                    st.markdown("## Full Analysis Report")
-                                    
-                                    # Get current date
-                                    from datetime import datetime
-                                    current_date = datetime.now().strftime("%B %d, %Y")
-                                    
-                                    # Create a modern styled header for the report
-                                    st.markdown(f"""
-                                    <div style="background-color: #262730; padding: 20px; border-radius: 10px; margin-bottom: 20px;">
-                                        <h2 style="color: #ffffff; margin-bottom: 10px;">AI Resume Analysis Report</h2>
-                                        <div style="display: flex; flex-wrap: wrap; gap: 20px;">
-                                            <div style="flex: 1; min-width: 200px;">
-                                                <p style="color: #ffffff;"><strong>Job Role:</strong> {job_role if job_role else "Not specified"}</p>
-                                                <p style="color: #ffffff;"><strong>Analysis Date:</strong> {current_date}</p>                                                                                                                                        </div>
-                                            <div style="flex: 1; min-width: 200px;">
-                                                <p style="color: #ffffff;"><strong>AI Model:</strong> {model_used}</p>
-                                                <p style="color: #ffffff;"><strong>Overall Score:</strong> {resume_score}/100 - {"Excellent" if resume_score >= 80 else "Good" if resume_score >= 60 else "Needs Improvement"}</p>
-                                                {f'<p style="color: #4CAF50;"><strong>✓ Custom Job Description Used</strong></p>' if st.session_state.get('used_custom_job_desc', False) else ''}
-                                    </div>
-                                    """, unsafe_allow_html=True)
-                                    
-                                    # Add gauge charts for scores
-                                    import plotly.graph_objects as go
-                                    
-                                    col1, col2 = st.columns(2)
-                                    
-                                    with col1:
-                                        # Resume Score Gauge
-                                        fig1 = go.Figure(go.Indicator(
-                                            mode="gauge+number",
-                                            value=resume_score,
-                                            domain={'x': [0, 1], 'y': [0, 1]},
-                                            title={'text': "Resume Score", 'font': {'size': 16}},
-                                            gauge={
-                                                'axis': {'range': [0, 100], 'tickwidth': 1},
-                                                'bar': {'color': "#4CAF50" if resume_score >= 80 else "#FFA500" if resume_score >= 60 else "#FF4444"},
-                                                'bgcolor': "white",
-                                                'borderwidth': 2,
-                                                'bordercolor': "gray",
-                                                'steps': [
-                                                    {'range': [0, 40], 'color': 'rgba(255, 68, 68, 0.2)'},
-                                                    {'range': [40, 60], 'color': 'rgba(255, 165, 0, 0.2)'},
-                                                    {'range': [60, 80], 'color': 'rgba(255, 214, 0, 0.2)'},
-                                                    {'range': [80, 100], 'color': 'rgba(76, 175, 80, 0.2)'}
-                                                ],
-                                                'threshold': {
-                                                    'line': {'color': "red", 'width': 4},
-                                                    'thickness': 0.75,
-                                                    'value': 60
-                                                }
-                                            }
-                                        ))
-                                        
-                                        fig1.update_layout(
-                                            height=250,
-                                            margin=dict(l=20, r=20, t=50, b=20),
-                                        )
-                                        
-                                        st.plotly_chart(fig1, use_container_width=True)
-                                        
-                                        status = "Excellent" if resume_score >= 80 else "Good" if resume_score >= 60 else "Needs Improvement"
-                                        st.markdown(f"<div style='text-align: center; font-weight: bold;'>{status}</div>", unsafe_allow_html=True)
-                                    
-                                    with col2:
-                                        # ATS Score Gauge
-                                        fig2 = go.Figure(go.Indicator(
-                                            mode="gauge+number",
-                                            value=ats_score,
-                                            domain={'x': [0, 1], 'y': [0, 1]},
-                                            title={'text': "ATS Optimization Score", 'font': {'size': 16}},
-                                            gauge={
-                                                'axis': {'range': [0, 100], 'tickwidth': 1},
-                                                'bar': {'color': "#4CAF50" if ats_score >= 80 else "#FFA500" if ats_score >= 60 else "#FF4444"},
-                                                'bgcolor': "white",
-                                                'borderwidth': 2,
-                                                'bordercolor': "gray",
-                                                'steps': [
-                                                    {'range': [0, 40], 'color': 'rgba(255, 68, 68, 0.2)'},
-                                                    {'range': [40, 60], 'color': 'rgba(255, 165, 0, 0.2)'},
-                                                    {'range': [60, 80], 'color': 'rgba(255, 214, 0, 0.2)'},
-                                                    {'range': [80, 100], 'color': 'rgba(76, 175, 80, 0.2)'}
-                                                ],
-                                                'threshold': {
-                                                    'line': {'color': "red", 'width': 4},
-                                                    'thickness': 0.75,
-                                                    'value': 60
-                                                }
-                                            }
-                                        ))
-                                        
-                                        fig2.update_layout(
-                                            height=250,
-                                            margin=dict(l=20, r=20, t=50, b=20),
-                                        )
-                                        
-                                        st.plotly_chart(fig2, use_container_width=True)
-                                        
-                                        status = "Excellent" if ats_score >= 80 else "Good" if ats_score >= 60 else "Needs Improvement"
-                                        st.markdown(f"<div style='text-align: center; font-weight: bold;'>{status}</div>", unsafe_allow_html=True)
-
-                                    # Add Job Description Match Score if custom job description was used
-                                    if st.session_state.get('used_custom_job_desc', False) and custom_job_description:
-                                        # Extract job match score from analysis result or calculate it
-                                        job_match_score = analysis_result.get("job_match_score", 0)
-                                        if not job_match_score and "job_match" in analysis_result:
-                                            job_match_score = analysis_result["job_match"].get("score", 0)
-                                        
-                                        # If we have a job match score, display it
-                                        if job_match_score:
-                                            st.markdown("""
-                                            <h3 style="background: linear-gradient(90deg, #4d7c0f, #84cc16); color: white; padding: 10px; border-radius: 5px; margin-top: 20px;">
-                                                <i class="fas fa-handshake"></i> Job Description Match Analysis
-                                            </h3>
-                                            """, unsafe_allow_html=True)
-                                            
-                                            col1, col2 = st.columns(2)
-                                            
-                                            with col1:
-                                                # Job Match Score Gauge
-                                                fig3 = go.Figure(go.Indicator(
-                                                    mode="gauge+number",
-                                                    value=job_match_score,
-                                                    domain={'x': [0, 1], 'y': [0, 1]},
-                                                    title={'text': "Job Match Score", 'font': {'size': 16}},
-                                                    gauge={
-                                                        'axis': {'range': [0, 100], 'tickwidth': 1},
-                                                        'bar': {'color': "#4CAF50" if job_match_score >= 80 else "#FFA500" if job_match_score >= 60 else "#FF4444"},
-                                                        'bgcolor': "white",
-                                                        'borderwidth': 2,
-                                                        'bordercolor': "gray",
-                                                        'steps': [
-                                                            {'range': [0, 40], 'color': 'rgba(255, 68, 68, 0.2)'},
-                                                            {'range': [40, 60], 'color': 'rgba(255, 165, 0, 0.2)'},
-                                                            {'range': [60, 80], 'color': 'rgba(255, 214, 0, 0.2)'},
-                                                            {'range': [80, 100], 'color': 'rgba(76, 175, 80, 0.2)'}
-                                                        ],
-                                                        'threshold': {
-                                                            'line': {'color': "red", 'width': 4},
-                                                            'thickness': 0.75,
-                                                            'value': 60
-                                                        }
-                                                    }
-                                                ))
-                                                
-                                                fig3.update_layout(
-                                                    height=250,
-                                                    margin=dict(l=20, r=20, t=50, b=20),
-                                                )
-                                                
-                                                st.plotly_chart(fig3, use_container_width=True)
-                                                
-                                                match_status = "Excellent Match" if job_match_score >= 80 else "Good Match" if job_match_score >= 60 else "Low Match"
-                                                st.markdown(f"<div style='text-align: center; font-weight: bold;'>{match_status}</div>", unsafe_allow_html=True)
-                                            
-                                            with col2:
-                                                st.markdown("""
-                                                <div style="background-color: #262730; padding: 20px; border-radius: 10px; height: 100%;">
-                                                    <h4 style="color: #ffffff; margin-bottom: 15px;">What This Means</h4>
-                                                    <p style="color: #ffffff;">This score represents how well your resume matches the specific job description you provided.</p>
-                                                    <ul style="color: #ffffff; padding-left: 20px;">
-                                                        <li><strong>80-100:</strong> Excellent match - your resume is highly aligned with this job</li>
-                                                        <li><strong>60-79:</strong> Good match - your resume matches many requirements</li>
-                                                        <li><strong>Below 60:</strong> Consider tailoring your resume more specifically to this job</li>
-                                                    </ul>
-                                                </div>
-                                                """, unsafe_allow_html=True)
-                                    
-
-                                    # Format the full response with better styling
-                                    formatted_analysis = full_response
-                                    
-                                    # Replace section headers with styled headers
-                                    section_styles = {
-                                        "## Overall Assessment": """<div class="report-section">
-                                            <h3 style="background: linear-gradient(90deg, #1e3a8a, #3b82f6); color: white; padding: 10px; border-radius: 5px;">
-                                                <i class="fas fa-chart-line"></i> Overall Assessment
-                                            </h3>
-                                            <div class="section-content">""",
-                                            
-                                        "## Professional Profile Analysis": """<div class="report-section">
-                                            <h3 style="background: linear-gradient(90deg, #047857, #10b981); color: white; padding: 10px; border-radius: 5px;">
-                                                <i class="fas fa-user-tie"></i> Professional Profile Analysis
-                                            </h3>
-                                            <div class="section-content">""",
-                                            
-                                        "## Skills Analysis": """<div class="report-section">
-                                            <h3 style="background: linear-gradient(90deg, #4f46e5, #818cf8); color: white; padding: 10px; border-radius: 5px;">
-                                                <i class="fas fa-tools"></i> Skills Analysis
-                                            </h3>
-                                            <div class="section-content">""",
-                                            
-                                        "## Experience Analysis": """<div class="report-section">
-                                            <h3 style="background: linear-gradient(90deg, #9f1239, #e11d48); color: white; padding: 10px; border-radius: 5px;">
-                                                <i class="fas fa-briefcase"></i> Experience Analysis
-                                            </h3>
-                                            <div class="section-content">""",
-                                            
-                                        "## Education Analysis": """<div class="report-section">
-                                            <h3 style="background: linear-gradient(90deg, #854d0e, #eab308); color: white; padding: 10px; border-radius: 5px;">
-                                                <i class="fas fa-graduation-cap"></i> Education Analysis
-                                            </h3>
-                                            <div class="section-content">""",
-                                            
-                                        "## Key Strengths": """<div class="report-section">
-                                            <h3 style="background: linear-gradient(90deg, #166534, #22c55e); color: white; padding: 10px; border-radius: 5px;">
-                                                <i class="fas fa-check-circle"></i> Key Strengths
-                                            </h3>
-                                            <div class="section-content">""",
-                                            
-                                        "## Areas for Improvement": """<div class="report-section">
-                                            <h3 style="background: linear-gradient(90deg, #9f1239, #fb7185); color: white; padding: 10px; border-radius: 5px;">
-                                                <i class="fas fa-exclamation-circle"></i> Areas for Improvement
-                                            </h3>
-                                            <div class="section-content">""",
-                                            
-                                        "## ATS Optimization Assessment": """<div class="report-section">
-                                            <h3 style="background: linear-gradient(90deg, #0e7490, #06b6d4); color: white; padding: 10px; border-radius: 5px;">
-                                                <i class="fas fa-robot"></i> ATS Optimization Assessment
-                                            </h3>
-                                            <div class="section-content">""",
-                                            
-                                        "## Recommended Courses": """<div class="report-section">
-                                            <h3 style="background: linear-gradient(90deg, #5b21b6, #8b5cf6); color: white; padding: 10px; border-radius: 5px;">
-                                                <i class="fas fa-book"></i> Recommended Courses
-                                            </h3>
-                                            <div class="section-content">""",
-                                            
-                                        "## Resume Score": """<div class="report-section">
-                                            <h3 style="background: linear-gradient(90deg, #0369a1, #0ea5e9); color: white; padding: 10px; border-radius: 5px;">
-                                                <i class="fas fa-star"></i> Resume Score
-                                            </h3>
-                                            <div class="section-content">""",
-                                            
-                                        "## Role Alignment Analysis": """<div class="report-section">
-                                            <h3 style="background: linear-gradient(90deg, #7c2d12, #ea580c); color: white; padding: 10px; border-radius: 5px;">
-                                                <i class="fas fa-bullseye"></i> Role Alignment Analysis
-                                            </h3>
-                                            <div class="section-content">""",
-                                            
-                                        "## Job Match Analysis": """<div class="report-section">
-                                            <h3 style="background: linear-gradient(90deg, #4d7c0f, #84cc16); color: white; padding: 10px; border-radius: 5px;">
-                                                <i class="fas fa-handshake"></i> Job Match Analysis
-                                            </h3>
-                                            <div class="section-content">""",
-                                    }
-                                    
-                                    # Apply the styling to each section
-                                    for section, style in section_styles.items():
-                                        if section in formatted_analysis:
-                                            formatted_analysis = formatted_analysis.replace(
-                                                section, style)
-                                            # Add closing div tags
-                                            next_section = False
-                                            for next_sec in section_styles.keys():
-                                                if next_sec != section and next_sec in formatted_analysis.split(style)[1]:
-                                                    split_text = formatted_analysis.split(style)[1].split(next_sec)
-                                                    formatted_analysis = formatted_analysis.split(style)[0] + style + split_text[0] + "</div></div>" + next_sec + "".join(split_text[1:])
-                                                    next_section = True
-                                                    break
-                                            if not next_section:
-                                                formatted_analysis = formatted_analysis + "</div></div>"
-                                    
-                                    # Remove any extra closing div tags that might have been added
-                                    formatted_analysis = formatted_analysis.replace("</div></div></div></div>", "</div></div>")
-                                    
-                                    # Ensure we don't have any orphaned closing tags at the end
-                                    if formatted_analysis.endswith("</div>"):
-                                        # Count opening and closing div tags
-                                        open_tags = formatted_analysis.count("<div")
-                                        close_tags = formatted_analysis.count("</div>")
-                                        
-                                        # If we have more closing than opening tags, remove the extras
-                                        if close_tags > open_tags:
-                                            excess = close_tags - open_tags
-                                            formatted_analysis = formatted_analysis[:-6 * excess]
-                                    
-                                    # Clean up any visible HTML tags that might appear in the text
-                                    formatted_analysis = formatted_analysis.replace("&lt;/div&gt;", "")
-                                    formatted_analysis = formatted_analysis.replace("&lt;div&gt;", "")
-                                    formatted_analysis = formatted_analysis.replace("<div>", "<div>")  # Ensure proper opening
-                                    formatted_analysis = formatted_analysis.replace("</div>", "</div>")  # Ensure proper closing
-                                    
-                                    # Add CSS for the report
-                                    st.markdown("""
-                                    <style>
-                                        .report-section {
-                                            margin-bottom: 25px;
-                                            border: 1px solid #4B4B4B;
-                                            border-radius: 8px;
-                                            overflow: hidden;
-                                        }
-                                        .section-content {
-                                            padding: 15px;
-                                            background-color: #262730;
-                                            color: #ffffff;
-                                        }
-                                        .report-section h3 {
-                                            margin-top: 0;
-                                            font-weight: 600;
-                                        }
-                                        .report-section ul {
-                                            padding-left: 20px;
-                                        }
-                                        .report-section p {
-                                            color: #ffffff;
-                                            margin-bottom: 10px;
-                                        }
-                                        .report-section li {
-                                            color: #ffffff;
-                                            margin-bottom: 5px;
-                                        }
-                                    </style>
-                                    """, unsafe_allow_html=True)
+                            # Display the formatted analysis
+                            st.markdown(f"""
+                            <div style="background-color: #262730; padding: 20px; border-radius: 10px; border: 1px solid #4B4B4B; color: #ffffff;">
+                                {formatted_analysis}
+                            </div>
+                            """, unsafe_allow_html=True)
 
-                                    # Display the formatted analysis
-                                    st.markdown(f"""
-                                    <div style="background-color: #262730; padding: 20px; border-radius: 10px; border: 1px solid #4B4B4B; color: #ffffff;">
-                                        {formatted_analysis}
-                                    </div>
-                                    """, unsafe_allow_html=True)
+                            # Create a PDF report
+                            pdf_buffer = self.ai_analyzer.generate_pdf_report(
+                                analysis_result={
+                                    "score": resume_score,
+                                    "ats_score": ats_score,
+                                    "model_used": model_used,
+                                    "full_response": full_response,
+                                    "strengths": analysis_result.get("strengths", []),
+                                    "weaknesses": analysis_result.get("weaknesses", []),
+                                    "used_custom_job_desc": st.session_state.get('used_custom_job_desc', False),
+                                    "custom_job_description": custom_job_description if st.session_state.get('used_custom_job_desc', False) else ""
+                                },
+                                candidate_name=st.session_state.get(
+                                    'candidate_name', 'Candidate'),
+                                job_role=selected_role
+                            )
 
-                                    # Create a PDF report
-                                    pdf_buffer = self.ai_analyzer.generate_pdf_report(
-                                        analysis_result={
-                                            "score": resume_score,
-                                            "ats_score": ats_score,
-                                            "model_used": model_used,
-                                            "full_response": full_response,
-                                            "strengths": analysis_result.get("strengths", []),
-                                            "weaknesses": analysis_result.get("weaknesses", []),
-                                            "used_custom_job_desc": st.session_state.get('used_custom_job_desc', False),
-                                            "custom_job_description": custom_job_description if st.session_state.get('used_custom_job_desc', False) else ""
-                                        },
-                                        candidate_name=st.session_state.get(
-                                            'candidate_name', 'Candidate'),
-                                        job_role=selected_role
-                                    )
-
-                                    # PDF download button
-                                    if pdf_buffer:
-                                        st.download_button(
-                                            label="📊 Download PDF Report",
-                                            data=pdf_buffer,
-                                            file_name=f"resume_analysis_{datetime.now().strftime('%Y%m%d_%H%M')}.pdf",
-                                            mime="application/pdf",
-                                            use_container_width=True,
-                                            on_click=lambda: st.balloons()
-                                        )
-                                    else:
-                                        st.error("PDF generation failed. Please try again later.")
-                                else:
-                                    st.error(f"Analysis failed: {analysis_result.get('error', 'Unknown error')}")
-                        except Exception as ai_error:
-                            st.error(f"Error during AI analysis: {str(ai_error)}")
-                            import traceback as tb
-                            st.code(tb.format_exc())
+                            # PDF download button
+                            if pdf_buffer:
+                                st.download_button(
+                                    label="📊 Download PDF Report",
+                                    data=pdf_buffer,
+                                    file_name=f"resume_analysis_{datetime.datetime.now().strftime('%Y%m%d_%H%M')}.pdf",
+                                    mime="application/pdf",
+                                    use_container_width=True,
+                                    on_click=lambda: st.balloons()
+                                )
+                            else:
+                                st.error("PDF generation failed. Please try again later.")
+                    except Exception as ai_error:
+                        st.error(f"Error during AI analysis: {str(ai_error)}")
+                        st.code(traceback.format_exc())
 
-        st.toast("Check out these repositories: [Awesome Java](https://github.com/Hunterdii/Awesome-Java)", icon="ℹ️")
 
     def render_resume_radar(self):
         """Render the Resume Radar page - AI-powered CV reviewer with annotated PDF output"""
@@ -2884,20 +2575,7 @@ class ResumeApp:
         )
         
         # Introduction
-        st.markdown("""
-        <div style='background-color: #1e1e1e; padding: 20px; border-radius: 10px; margin: 20px 0; border-left: 4px solid #4CAF50;'>
-            <h3>🎯 Three-Pass CV Review System</h3>
-            <p>Resume Radar uses a sophisticated three-pass analysis approach inspired by how humans review CVs:</p>
-            <ol>
-                <li><strong>Global Pass</strong> → Read the entire CV for overall impression with summary of strengths and weaknesses</li>
-                <li><strong>Section Pass</strong> → Review each section (Experience, Education, Skills) in context</li>
-                <li><strong>Granular Pass</strong> → Detailed critique of individual lines/chunks with contextual feedback</li>
-            </ol>
-            <p>📄 Your original PDF will be returned with <span style='color: #4CAF50;'>green highlights</span> for strengths, 
-            <span style='color: #FFA500;'>yellow for areas needing attention</span>, and <span style='color: #FF4444;'>red for critical issues</span>. 
-            Each highlight includes detailed hover tooltips with improvement suggestions!</p>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(RADAR_INTRO_HTML, unsafe_allow_html=True)
         
         # Resume Radar Statistics
         with st.expander("📊 Resume Radar Statistics", expanded=False):
@@ -2934,24 +2612,9 @@ class ResumeApp:
                     
                     # Rating distribution chart
                     if radar_stats['rating_distribution']:
-                        import plotly.express as px
-                        import pandas as pd
-                        
-                        df = pd.DataFrame(list(radar_stats['rating_distribution'].items()), 
-                                        columns=['Rating', 'Count'])
-                        
-                        fig = px.bar(
-                            df, x='Rating', y='Count',
-                            title="Resume Rating Distribution",
-                            color='Count',
-                            color_continuous_scale='Viridis'
-                        )
-                        fig.update_layout(
-                            paper_bgcolor='rgba(0,0,0,0)',
-                            plot_bgcolor='rgba(0,0,0,0)',
-                            font=dict(color="white")
-                        )
-                        st.plotly_chart(fig, use_container_width=True)
+                        st.plotly_chart(
+                            build_rating_distribution_bar(tuple(radar_stats['rating_distribution'].items())),
+                            use_container_width=True)
                         
                 else:
                     st.info("📈 No Resume Radar analyses yet. Upload a resume to see statistics here!")
@@ -2960,12 +2623,7 @@ class ResumeApp:
                 st.error(f"Error loading Resume Radar statistics: {str(e)}")
         
         # File Upload Section
-        st.markdown("""
-        <div style='background-color: #2d2d2d; padding: 20px; border-radius: 10px; margin: 20px 0;'>
-            <h3>📤 Upload Your Resume (PDF Only)</h3>
-            <p>Upload your resume in PDF format to get comprehensive AI-powered analysis with annotated feedback.</p>
-        </div>
-        """, unsafe_allow_html=True)
+        st.markdown(RADAR_UPLOAD_HTML, unsafe_allow_html=True)
         
         uploaded_file = st.file_uploader(
             "Choose your resume PDF file",
@@ -3058,7 +2716,6 @@ class ResumeApp:
                     
                     except Exception as e:
                         st.error(f"❌ Resume Radar analysis failed: {str(e)}")
-                        import traceback
                         st.error("Debug info:")
                         st.code(traceback.format_exc())
         
@@ -3296,41 +2953,9 @@ class ResumeApp:
         """Render the Placement Dashboard for Innomatics Research Labs"""
         apply_modern_styles()
         
-        # Custom CSS for placement dashboard
-        st.markdown("""
-        <style>
-            .placement-header {
-                font-size: 2.5rem;
-                color: #1f77b4;
-                text-align: center;
-                margin-bottom: 2rem;
-                border-bottom: 3px solid #1f77b4;
-                padding-bottom: 1rem;
-            }
-            
-            .metric-card {
-                background-color: #f0f2f6;
-                padding: 1rem;
-                border-radius: 0.5rem;
-                border-left: 4px solid #1f77b4;
-            }
-            
-            .high-score {
-                color: #28a745;
-                font-weight: bold;
-            }
-            
-            .medium-score {
-                color: #ffc107;
-                font-weight: bold;
-            }
-            
-            .low-score {
-                color: #dc3545;
-                font-weight: bold;
-            }
-        </style>
-        """, unsafe_allow_html=True)
+        # .placement-header comes from style/style.css; only the page's
+        # .metric-card override is sent from here
+        st.markdown(PLACEMENT_CSS, unsafe_allow_html=True)
         
         # Header
         st.markdown('<h1 class="placement-header">🎯 Innomatics Placement Dashboard</h1>', unsafe_allow_html=True)
@@ -3341,6 +2966,8 @@ class ResumeApp:
             st.session_state.placement_jd_parsed = None
         if 'placement_analysis_results' not in st.session_state:
             st.session_state.placement_analysis_results = []
+        if 'placement_job_id' not in st.session_state:
+            st.session_state.placement_job_id = None
         
         # Two-column layout
         col_jd, col_resume = st.columns([1, 1])
@@ -3366,8 +2993,6 @@ class ResumeApp:
                     with st.spinner("Parsing job description..."):
                         try:
                             # Save uploaded file temporarily
-                            import tempfile
-                            import os
                             with tempfile.NamedTemporaryFile(delete=False, suffix=f".{jd_file.name.split('.')[-1]}") as tmp_file:
                                 tmp_file.write(jd_file.read())
                                 tmp_path = tmp_file.name
@@ -3375,6 +3000,7 @@ class ResumeApp:
                             # Parse JD
                             parsed_jd = self.jd_parser.parse_job_description(tmp_path)
                             st.session_state.placement_jd_parsed = parsed_jd
+                            st.session_state.placement_job_id = self.save_placement_job_description(parsed_jd)
                             
                             # Cleanup
                             os.unlink(tmp_path)
@@ -3398,6 +3024,7 @@ class ResumeApp:
                         try:
                             parsed_jd = self.jd_parser.parse_job_description(text=jd_text)
                             st.session_state.placement_jd_parsed = parsed_jd
+                            st.session_state.placement_job_id = self.save_placement_job_description(parsed_jd)
                             st.success("✅ Job description parsed successfully!")
                             st.rerun()
                             
@@ -3435,6 +3062,7 @@ class ResumeApp:
             return
         
         results = []
+        db_rows = []
         progress_bar = st.progress(0)
         status_text = st.empty()
         
@@ -3457,16 +3085,65 @@ class ResumeApp:
                 analysis['analysis_date'] = datetime.datetime.now().strftime("%Y-%m-%d %H:%M:%S")
                 
                 results.append(analysis)
+                db_rows.append((
+                    st.session_state.placement_job_id,
+                    candidate_name,
+                    resume_file.name,
+                    analysis.get('relevance_score'),
+                    analysis.get('verdict'),
+                    json.dumps(analysis.get('matched_skills', [])),
+                    json.dumps(analysis.get('missing_skills', [])),
+                    analysis.get('semantic_score'),
+                    json.dumps(analysis, default=str)
+                ))
                 progress_bar.progress((i + 1) / len(resume_files))
                 
             except Exception as e:
                 st.error(f"Error analyzing {resume_file.name}: {e}")
         
+        # Save all analyses to database in one transaction
+        saved = True
+        try:
+            self.bulk_save_resume_analyses(db_rows)
+        except Exception as e:
+            logger.exception("Error saving placement analyses")
+            st.error(f"⚠️ The analyses could not be saved to the database: {e}")
+            saved = False
+        
         st.session_state.placement_analysis_results = results
         progress_bar.empty()
         status_text.empty()
         st.success(f"✅ Analyzed {len(results)} resumes successfully!")
-        st.rerun()
+        # Skip the rerun after a failed save so the error above stays visible;
+        # the results below render in this run either way
+        if saved:
+            st.rerun()
+    
+    def save_placement_job_description(self, parsed_jd):
+        """Save a parsed job description to the placement database and return its ID"""
+        try:
+            with _placement_lock(), self.placement_conn:
+                cursor = self.placement_conn.execute(INSERT_JOB_DESCRIPTION, (
+                    parsed_jd.get('role_title', ''),
+                    parsed_jd.get('company', ''),
+                    parsed_jd.get('location', ''),
+                    json.dumps(parsed_jd.get('must_have_skills', [])),
+                    json.dumps(parsed_jd.get('good_to_have_skills', [])),
+                    json.dumps(parsed_jd.get('qualifications', [])),
+                    parsed_jd.get('experience_years'),
+                    str(parsed_jd)
+                ))
+            return cursor.lastrowid
+        except Exception:
+            logger.exception("Error saving job description")
+            return None
+    
+    def bulk_save_resume_analyses(self, rows):
+        """Insert a batch of resume_analysis rows in a single transaction"""
+        if not rows:
+            return
+        with _placement_lock(), self.placement_conn:
+            self.placement_conn.executemany(INSERT_RESUME_ANALYSIS, rows)
     
     def _extract_candidate_name_from_resume(self, resume_text: str) -> str:
         """Extract candidate name from resume text using simple heuristics"""
@@ -3512,8 +3189,7 @@ class ResumeApp:
             st.subheader("🎯 Must-Have Skills")
             must_have = jd.get('must_have_skills', [])
             if must_have:
-                for skill in must_have:
-                    st.write(f"• {skill}")
+                st.write(bullet_list(must_have))
             else:
                 st.write("None specified")
         
@@ -3521,8 +3197,7 @@ class ResumeApp:
             st.subheader("⭐ Good-to-Have Skills")
             good_to_have = jd.get('good_to_have_skills', [])
             if good_to_have:
-                for skill in good_to_have:
-                    st.write(f"• {skill}")
+                st.write(bullet_list(good_to_have))
             else:
                 st.write("None specified")
         
@@ -3638,21 +3313,18 @@ class ResumeApp:
             
             st.markdown("**✅ Matched Skills:**")
             if result['matched_skills']:
-                for skill in result['matched_skills']:
-                    st.write(f"• {skill}")
+                st.write(bullet_list(result['matched_skills']))
             else:
                 st.write("None")
             
             if result.get('fuzzy_matched_skills'):
                 st.markdown("**⚡ Fuzzy Matched Skills:**")
-                for skill in result['fuzzy_matched_skills']:
-                    st.write(f"• {skill}")
+                st.write(bullet_list(result['fuzzy_matched_skills']))
         
         with col2:
             st.markdown("**❌ Missing Skills:**")
             if result['missing_skills']:
-                for skill in result['missing_skills']:
-                    st.write(f"• {skill}")
+                st.write(bullet_list(result['missing_skills']))
             else:
                 st.write("None")
             
@@ -3730,18 +3402,6 @@ class ResumeApp:
             st.error(f"Footer navigation error: {e}")
             current_page = 'home'
         
-        # Page routing with clean navigation
-        page_options = {
-            "home": self.render_home,
-            "analyzer": self.render_analyzer,
-            "radar": self.render_resume_radar,
-            "placement": self.render_placement_dashboard,
-            "builder": self.render_builder,
-            "dashboard": self.render_dashboard,
-            "job-search": self.render_job_search,
-            "about": self.render_about
-        }
-        
         # Main content area with proper spacing
         st.markdown('<div class="main-content">', unsafe_allow_html=True)
         
@@ -3783,13 +3443,13 @@ class ResumeApp:
             st.session_state.initial_load = True
             current_page = 'home'
         
+        # Report background database writes that failed since the last run
+        _report_db_writes()
+        
         # Render the selected page
         try:
-            if current_page in page_options:
-                page_options[current_page]()
-            else:
-                # Default to home page
-                page_options["home"]()
+            # Unknown pages default to home
+            getattr(self, self.PAGE_ROUTES.get(current_page, "render_home"))()
         except Exception as e:
             st.error(f"Error rendering page: {str(e)}")
             st.info("Please try refreshing the page.")
@@ -166,16 +166,18 @@ INTERVIEW_VIDEOS = {
     ]
 }
 
+# Role lookups flattened once at import; the first category listing a role wins
+_ROLE_TO_CATEGORY = {}
+COURSES_BY_ROLE = {}
+for _category, _roles in COURSES_BY_CATEGORY.items():
+    for _role, _courses in _roles.items():
+        _ROLE_TO_CATEGORY.setdefault(_role, _category)
+        COURSES_BY_ROLE.setdefault(_role, _courses)
+
 def get_courses_for_role(role_name):
     """Helper function to get courses for a specific role"""
-    for category, roles in COURSES_BY_CATEGORY.items():
-        if role_name in roles:
-            return roles[role_name]
-    return None
+    return COURSES_BY_ROLE.get(role_name)
 
 def get_category_for_role(role_name):
     """Helper function to get the category for a specific role"""
-    for category, roles in COURSES_BY_CATEGORY.items():
-        if role_name in roles:
-            return category
-    return None
\ No newline at end of file
+    return _ROLE_TO_CATEGORY.get(role_name)
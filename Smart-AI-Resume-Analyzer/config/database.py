@@ -1,11 +1,41 @@
+import functools
 import sqlite3
+import threading
+import streamlit as st
 from datetime import datetime
 
+DB_PATH = 'resume_data.db'
+
+@st.cache_resource
 def get_database_connection():
-    """Create and return a database connection"""
-    conn = sqlite3.connect('resume_data.db')
+    """Return the shared database connection, opened once per server process.
+
+    Every session and the background writer use it, so callers hold
+    get_database_lock() (see with_database_lock) while they use it.
+    """
+    conn = sqlite3.connect(DB_PATH, check_same_thread=False)
+    conn.executescript("""
+        PRAGMA journal_mode=WAL;
+        PRAGMA synchronous=NORMAL;
+        PRAGMA cache_size=-20000;
+        PRAGMA mmap_size=268435456;
+    """)
     return conn
 
+@st.cache_resource
+def get_database_lock():
+    """Lock serializing use of the shared database connection"""
+    return threading.RLock()
+
+def with_database_lock(func):
+    """Run func while holding the shared connection's lock"""
+    @functools.wraps(func)
+    def wrapper(*args, **kwargs):
+        with get_database_lock():
+            return func(*args, **kwargs)
+    return wrapper
+
+@with_database_lock
 def init_database():
     """Initialize database tables"""
     conn = get_database_connection()
@@ -101,8 +131,8 @@ def init_database():
     ''')
     
     conn.commit()
-    conn.close()
 
+@with_database_lock
 def save_resume_data(data):
     """Save resume data to database"""
     conn = get_database_connection()
@@ -140,9 +170,8 @@ def save_resume_data(data):
         print(f"Error saving resume data: {str(e)}")
         conn.rollback()
         return None
-    finally:
-        conn.close()
 
+@with_database_lock
 def save_analysis_data(resume_id, analysis):
     """Save resume analysis data"""
     conn = get_database_connection()
@@ -166,12 +195,13 @@ def save_analysis_data(resume_id, analysis):
         ))
         
         conn.commit()
+        return cursor.lastrowid
     except Exception as e:
         print(f"Error saving analysis data: {str(e)}")
         conn.rollback()
-    finally:
-        conn.close()
+        return None
 
+@with_database_lock
 def get_resume_stats():
     """Get statistics about resumes"""
     conn = get_database_connection()
@@ -203,9 +233,8 @@ def get_resume_stats():
     except Exception as e:
         print(f"Error getting resume stats: {str(e)}")
         return None
-    finally:
-        conn.close()
 
+@with_database_lock
 def log_admin_action(admin_email, action):
     """Log admin login/logout actions"""
     conn = get_database_connection()
@@ -219,9 +248,8 @@ def log_admin_action(admin_email, action):
         conn.commit()
     except Exception as e:
         print(f"Error logging admin action: {str(e)}")
-    finally:
-        conn.close()
 
+@with_database_lock
 def get_admin_logs():
     """Get all admin login/logout logs"""
     conn = get_database_connection()
@@ -237,9 +265,8 @@ def get_admin_logs():
     except Exception as e:
         print(f"Error getting admin logs: {str(e)}")
         return []
-    finally:
-        conn.close()
 
+@with_database_lock
 def get_all_resume_data():
     """Get all resume data for admin dashboard"""
     conn = get_database_connection()
@@ -271,9 +298,8 @@ def get_all_resume_data():
     except Exception as e:
         print(f"Error getting resume data: {str(e)}")
         return []
-    finally:
-        conn.close()
 
+@with_database_lock
 def verify_admin(email, password):
     """Verify admin credentials"""
     conn = get_database_connection()
@@ -286,9 +312,8 @@ def verify_admin(email, password):
     except Exception as e:
         print(f"Error verifying admin: {str(e)}")
         return False
-    finally:
-        conn.close()
 
+@with_database_lock
 def add_admin(email, password):
     """Add a new admin"""
     conn = get_database_connection()
@@ -301,9 +326,8 @@ def add_admin(email, password):
     except Exception as e:
         print(f"Error adding admin: {str(e)}")
         return False
-    finally:
-        conn.close()
 
+@with_database_lock
 def save_ai_analysis_data(resume_id, analysis_data):
     """Save AI analysis data to the database"""
     conn = get_database_connection()
@@ -336,14 +360,15 @@ def save_ai_analysis_data(resume_id, analysis_data):
         ))
         
         conn.commit()
+        # New row changes the stats; don't wait for the cache TTL
+        get_detailed_ai_analysis_stats.clear()
         return cursor.lastrowid
     except Exception as e:
         print(f"Error saving AI analysis data: {e}")
         conn.rollback()
         raise
-    finally:
-        conn.close()
 
+@with_database_lock
 def get_ai_analysis_stats():
     """Get statistics about AI analyzer usage"""
     conn = get_database_connection()
@@ -404,9 +429,8 @@ def get_ai_analysis_stats():
             "average_score": 0,
             "top_job_roles": []
         }
-    finally:
-        conn.close()
 
+@with_database_lock
 def save_resume_radar_analysis(resume_id, analysis_results):
     """Save Resume Radar analysis results to database"""
     conn = get_database_connection()
@@ -434,14 +458,16 @@ def save_resume_radar_analysis(resume_id, analysis_results):
         ))
         
         conn.commit()
+        # New row changes the stats; don't wait for the cache TTL
+        get_resume_radar_stats.clear()
         return cursor.lastrowid
     except Exception as e:
         print(f"Error saving Resume Radar analysis: {str(e)}")
         conn.rollback()
         return None
-    finally:
-        conn.close()
 
+@st.cache_data(ttl=60, show_spinner=False)
+@with_database_lock
 def get_resume_radar_stats():
     """Get Resume Radar analysis statistics"""
     conn = get_database_connection()
@@ -497,11 +523,15 @@ def get_resume_radar_stats():
             'rating_distribution': {},
             'recent_analyses': []
         }
-    finally:
-        conn.close()
 
+@st.cache_data(ttl=30, show_spinner=False)
+@with_database_lock
 def get_detailed_ai_analysis_stats():
-    """Get detailed statistics about AI analyzer usage including daily trends"""
+    """Get detailed statistics about AI analyzer usage including daily trends.
+
+    Cached for 30 seconds; save_ai_analysis_data and reset_ai_analysis_stats
+    clear the cache whenever they change the table.
+    """
     conn = get_database_connection()
     cursor = conn.cursor()
     
@@ -568,14 +598,17 @@ def get_detailed_ai_analysis_stats():
             {"min": 81, "max": 100, "range": "81-100"}
         ]
         
-        score_distribution = []
-        for range_info in score_ranges:
-            cursor.execute("""
-                SELECT COUNT(*) FROM ai_analysis 
-                WHERE resume_score >= ? AND resume_score <= ?
-            """, (range_info["min"], range_info["max"]))
-            count = cursor.fetchone()[0]
-            score_distribution.append({"range": range_info["range"], "count": count})
+        # Count every range in one scan of the table instead of one query per range
+        range_sums = ", ".join(
+            "SUM(resume_score >= ? AND resume_score <= ?)" for _ in score_ranges
+        )
+        range_params = [bound for r in score_ranges for bound in (r["min"], r["max"])]
+        cursor.execute(f"SELECT {range_sums} FROM ai_analysis", range_params)
+        range_counts = cursor.fetchone()
+        score_distribution = [
+            {"range": range_info["range"], "count": count or 0}
+            for range_info, count in zip(score_ranges, range_counts)
+        ]
         
         # Get recent analyses
         cursor.execute("""
@@ -613,9 +646,8 @@ def get_detailed_ai_analysis_stats():
             "score_distribution": [],
             "recent_analyses": []
         }
-    finally:
-        conn.close()
 
+@with_database_lock
 def reset_ai_analysis_stats():
     """Reset AI analysis statistics by truncating the ai_analysis table"""
     conn = get_database_connection()
@@ -633,11 +665,10 @@ def reset_ai_analysis_stats():
         # Delete all records from the ai_analysis table
         cursor.execute("DELETE FROM ai_analysis")
         conn.commit()
+        get_detailed_ai_analysis_stats.clear()
         
         return {"success": True, "message": "AI analysis statistics have been reset successfully"}
     except Exception as e:
         conn.rollback()
         print(f"Error resetting AI analysis stats: {e}")
         return {"success": False, "message": f"Error resetting AI analysis statistics: {str(e)}"}
-    finally:
-        conn.close()
\ No newline at end of file
@@ -3,7 +3,7 @@ import pandas as pd
 import plotly.express as px
 import plotly.graph_objects as go
 from datetime import datetime, timedelta
-from config.database import get_database_connection
+from config.database import get_database_connection, with_database_lock
 import io
 import uuid
 from plotly.subplots import make_subplots
@@ -109,6 +109,7 @@ class DashboardManager:
             </style>
         """, unsafe_allow_html=True)
 
+    @with_database_lock
     def get_resume_metrics(self):
         """Get resume-related metrics from database"""
         cursor = self.conn.cursor()
@@ -156,6 +157,7 @@ class DashboardManager:
         
         return metrics
 
+    @with_database_lock
     def get_skill_distribution(self):
         """Get skill distribution data"""
         cursor = self.conn.cursor()
@@ -201,6 +203,7 @@ class DashboardManager:
             
         return categories, counts
 
+    @with_database_lock
     def get_weekly_trends(self):
         """Get weekly submission trends"""
         cursor = self.conn.cursor()
@@ -218,6 +221,7 @@ class DashboardManager:
             
         return [d[-3:] for d in dates], submissions  # Return shortened date format (e.g., 'Mon', 'Tue')
 
+    @with_database_lock
     def get_job_category_stats(self):
         """Get statistics by job category"""
         cursor = self.conn.cursor()
@@ -296,6 +300,7 @@ class DashboardManager:
             - Storage Used: {stats['storage_size']}
         """)
 
+    @with_database_lock
     def get_resume_data(self):
         """Get all resume data"""
         cursor = self.conn.cursor()
@@ -474,6 +479,7 @@ class DashboardManager:
         else:
             st.info("No admin activity logs available")
 
+    @with_database_lock
     def export_to_excel(self):
         """Export data to Excel format"""
         query = """
@@ -529,6 +535,7 @@ class DashboardManager:
             st.error(f"Error exporting to Excel: {str(e)}")
             return None
 
+    @with_database_lock
     def export_to_csv(self):
         """Export data to CSV format"""
         query = """
@@ -549,6 +556,7 @@ class DashboardManager:
             st.error(f"Error exporting to CSV: {str(e)}")
             return None
 
+    @with_database_lock
     def export_to_json(self):
         """Export data to JSON format"""
         query = """
@@ -564,6 +572,7 @@ class DashboardManager:
             st.error(f"Error exporting to JSON: {str(e)}")
             return None
 
+    @with_database_lock
     def get_database_stats(self):
         """Get database statistics"""
         cursor = self.conn.cursor()
@@ -597,6 +606,7 @@ class DashboardManager:
         
         return stats
 
+    @with_database_lock
     def get_admin_logs(self):
         """Get admin logs"""
         cursor = self.conn.cursor()
@@ -842,6 +852,7 @@ class DashboardManager:
         if st.session_state.get('is_admin', False):
             self.render_admin_section()
 
+    @with_database_lock
     def get_trend_indicators(self):
         """Get trend indicators for stats"""
         cursor = self.conn.cursor()
@@ -896,6 +907,7 @@ class DashboardManager:
         
         return indicators
 
+    @with_database_lock
     def get_detailed_insights(self):
         """Get detailed insights from the database"""
         cursor = self.conn.cursor()
@@ -981,6 +993,7 @@ class DashboardManager:
         
         return insights
 
+    @with_database_lock
     def get_quick_stats(self):
         """Get quick statistics for the dashboard"""
         cursor = self.conn.cursor()
@@ -115,6 +115,15 @@ def initialize_database():
         )
     ''')
     
+    # Indexes for job, verdict and date lookups on the dashboard
+    conn.executescript('''
+        CREATE INDEX IF NOT EXISTS idx_ra_job_id ON resume_analysis(job_id);
+        CREATE INDEX IF NOT EXISTS idx_ra_verdict_score ON resume_analysis(verdict, relevance_score DESC);
+        CREATE INDEX IF NOT EXISTS idx_ra_date ON resume_analysis(analysis_date);
+        CREATE INDEX IF NOT EXISTS idx_jd_role ON job_descriptions(role_title);
+    ''')
+    conn.execute("ANALYZE")
+    
     conn.commit()
     conn.close()
     return db_path
@@ -145,17 +154,9 @@ def save_jd_to_db(parsed_jd: Dict) -> int:
     conn.close()
     return job_id
 
-def save_analysis_to_db(job_id: int, candidate_name: str, filename: str, analysis: Dict):
-    """Save resume analysis to database"""
-    conn = sqlite3.connect("placement_dashboard.db")
-    cursor = conn.cursor()
-    
-    cursor.execute('''
-        INSERT INTO resume_analysis 
-        (job_id, candidate_name, resume_filename, relevance_score, verdict, 
-         matched_skills, missing_skills, semantic_score, full_analysis)
-        VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-    ''', (
+def analysis_to_db_row(job_id: int, candidate_name: str, filename: str, analysis: Dict) -> Tuple:
+    """Build a resume_analysis row tuple for bulk insertion"""
+    return (
         job_id,
         candidate_name,
         filename,
@@ -165,10 +166,28 @@ def save_analysis_to_db(job_id: int, candidate_name: str, filename: str, analysi
         json.dumps(analysis['missing_skills']),
         analysis['semantic_score'],
         json.dumps(analysis)
-    ))
+    )
+
+def save_analyses_to_db(rows: List[Tuple]):
+    """Save a batch of resume analyses in a single transaction"""
+    if not rows:
+        return
     
-    conn.commit()
-    conn.close()
+    conn = sqlite3.connect("placement_dashboard.db")
+    try:
+        with conn:
+            conn.executemany('''
+                INSERT INTO resume_analysis 
+                (job_id, candidate_name, resume_filename, relevance_score, verdict, 
+                 matched_skills, missing_skills, semantic_score, full_analysis)
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ''', rows)
+    finally:
+        conn.close()
+
+def save_analysis_to_db(job_id: int, candidate_name: str, filename: str, analysis: Dict):
+    """Save resume analysis to database"""
+    save_analyses_to_db([analysis_to_db_row(job_id, candidate_name, filename, analysis)])
 
 def get_score_color_class(score: float) -> str:
     """Get CSS class for score coloring"""
@@ -305,6 +324,7 @@ def analyze_resumes(resume_files):
     matcher = ResumeJDMatcher()
     resume_service = ResumeRadarService()
     results = []
+    db_rows = []
     
     progress_bar = st.progress(0)
     status_text = st.empty()
@@ -329,19 +349,22 @@ def analyze_resumes(resume_files):
             
             results.append(analysis)
             
-            # Save to database
-            save_analysis_to_db(
+            # Queue for database; rows are flushed together after the loop
+            db_rows.append(analysis_to_db_row(
                 st.session_state.current_job_id,
                 candidate_name,
                 resume_file.name,
                 analysis
-            )
+            ))
             
             progress_bar.progress((i + 1) / len(resume_files))
             
         except Exception as e:
             st.error(f"Error analyzing {resume_file.name}: {e}")
     
+    # Save all analyses to database in one transaction
+    save_analyses_to_db(db_rows)
+    
     st.session_state.analysis_results = results
     progress_bar.empty()
     status_text.empty()
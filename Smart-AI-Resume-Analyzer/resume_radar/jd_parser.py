@@ -117,7 +117,7 @@ Return only the JSON object:"""
     def clean_jd_text(self, text: str) -> str:
         """Clean and normalize job description text"""
         # Remove excessive whitespace
-        text = re.sub(r'\s+', ' ', text)
+        text = ' '.join(text.split())
         # Remove special characters that might interfere with parsing
         text = re.sub(r'[^\w\s\-\.\,\:\;\(\)\[\]/&+#]', ' ', text)
         return text.strip()
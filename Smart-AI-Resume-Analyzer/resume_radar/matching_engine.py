@@ -17,6 +17,11 @@ import os
 # Load environment variables
 load_dotenv()
 
+# Patterns used by normalize_skill, compiled once
+SKILL_NOISE_PATTERN = re.compile(r'\b(programming|language|framework|library|tool|platform)\b')
+PARENTHESES_PATTERN = re.compile(r'\([^)]*\)')
+WHITESPACE_PATTERN = re.compile(r'\s+')
+
 class ResumeJDMatcher:
     def __init__(self):
         """Initialize the matching engine"""
@@ -53,6 +58,13 @@ class ResumeJDMatcher:
             'java': ['java8', 'java11', 'spring'],
         }
         
+        # Reverse index: skill or alias -> every term in its alias groups
+        self.alias_index = {}
+        for main_skill, alias_list in self.skill_aliases.items():
+            group = [main_skill] + alias_list
+            for term in group:
+                self.alias_index.setdefault(term, set()).update(group)
+        
         # Semantic similarity prompt
         self.similarity_prompt = """You are an expert HR recruiter analyzing resume-job fit.
 
@@ -88,23 +100,19 @@ Provide ONLY a number (0-100):"""
         """Normalize skill text for better matching"""
         skill = skill.lower().strip()
         # Remove common prefixes/suffixes
-        skill = re.sub(r'\b(programming|language|framework|library|tool|platform)\b', '', skill)
+        skill = SKILL_NOISE_PATTERN.sub('', skill)
         # Remove parentheses and their contents
-        skill = re.sub(r'\([^)]*\)', '', skill)
+        skill = PARENTHESES_PATTERN.sub('', skill)
         # Clean up whitespace
-        skill = re.sub(r'\s+', ' ', skill).strip()
+        skill = WHITESPACE_PATTERN.sub(' ', skill).strip()
         return skill
 
     def expand_skill_aliases(self, skill: str) -> List[str]:
         """Get all possible aliases for a skill"""
         normalized = self.normalize_skill(skill)
-        aliases = [normalized]
-        
-        for main_skill, alias_list in self.skill_aliases.items():
-            if normalized == main_skill or normalized in alias_list:
-                aliases.extend([main_skill] + alias_list)
-        
-        return list(set(aliases))
+        aliases = {normalized}
+        aliases.update(self.alias_index.get(normalized, ()))
+        return list(aliases)
 
     def fuzzy_match_score(self, text1: str, text2: str) -> float:
         """Calculate fuzzy matching score between two strings"""
@@ -158,13 +166,21 @@ Provide ONLY a number (0-100):"""
                     break
             
             if not found_exact:
-                # Check for fuzzy matches
+                # Check for fuzzy matches; the matcher caches each alias once and the
+                # cheap upper bounds skip pairs that cannot beat the current best
                 best_fuzzy_score = 0
-                for resume_skill in resume_skills:
-                    for alias in skill_aliases:
-                        fuzzy_score = self.fuzzy_match_score(resume_skill, alias)
-                        if fuzzy_score > best_fuzzy_score:
-                            best_fuzzy_score = fuzzy_score
+                matcher = SequenceMatcher(None)
+                for alias in skill_aliases:
+                    matcher.set_seq2(alias.lower())
+                    for resume_skill in resume_skills:
+                        matcher.set_seq1(resume_skill.lower())
+                        if (matcher.real_quick_ratio() > best_fuzzy_score
+                                and matcher.quick_ratio() > best_fuzzy_score):
+                            fuzzy_score = matcher.ratio()
+                            if fuzzy_score > best_fuzzy_score:
+                                best_fuzzy_score = fuzzy_score
+                    if best_fuzzy_score >= 1.0:
+                        break
                 
                 if best_fuzzy_score >= self.fuzzy_threshold:
                     fuzzy_matches.append({
@@ -0,0 +1,207 @@
+"""
+Equivalence tests for rewritten pure logic.
+
+Each test runs the current implementation next to a copy of the code it
+replaced and checks both give the same output on representative inputs.
+"""
+
+import os
+import sqlite3
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+# Add the app directory to path
+sys.path.insert(0, os.path.dirname(os.path.abspath(__file__)))
+
+from config import courses
+
+
+# --- Previous implementations, kept here as the reference ---------------------
+
+def old_get_courses_for_role(role_name):
+    for category, roles in courses.COURSES_BY_CATEGORY.items():
+        if role_name in roles:
+            return roles[role_name]
+    return None
+
+
+def old_get_category_for_role(role_name):
+    for category, roles in courses.COURSES_BY_CATEGORY.items():
+        if role_name in roles:
+            return category
+    return None
+
+
+def old_score_band(score):
+    return 2 if score >= 80 else 1 if score >= 60 else 0
+
+
+def old_style_report_sections(text, section_styles):
+    formatted_analysis = text
+    for section, style in section_styles.items():
+        if section in formatted_analysis:
+            formatted_analysis = formatted_analysis.replace(section, style)
+            # Add closing div tags
+            next_section = False
+            for next_sec in section_styles.keys():
+                if next_sec != section and next_sec in formatted_analysis.split(style)[1]:
+                    split_text = formatted_analysis.split(style)[1].split(next_sec)
+                    formatted_analysis = (formatted_analysis.split(style)[0] + style + split_text[0] +
+                                          "</div></div>" + next_sec + "".join(split_text[1:]))
+                    next_section = True
+                    break
+            if not next_section:
+                formatted_analysis = formatted_analysis + "</div></div>"
+    return formatted_analysis.replace("</div></div></div></div>", "</div></div>")
+
+
+def old_expand_skill_aliases(matcher, skill):
+    normalized = matcher.normalize_skill(skill)
+    aliases = [normalized]
+    for main_skill, alias_list in matcher.skill_aliases.items():
+        if normalized == main_skill or normalized in alias_list:
+            aliases.extend([main_skill] + alias_list)
+    return list(set(aliases))
+
+
+RESUME_ANALYSIS_COLUMNS = """job_id, candidate_name, resume_filename, relevance_score, verdict,
+    matched_skills, missing_skills, semantic_score, full_analysis"""
+
+
+def old_save_rows(conn, rows):
+    cursor = conn.cursor()
+    for row in rows:
+        cursor.execute(f"INSERT INTO resume_analysis ({RESUME_ANALYSIS_COLUMNS}) "
+                       "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)", row)
+        conn.commit()
+
+
+def saved_rows(conn):
+    return conn.execute(f"SELECT id, {RESUME_ANALYSIS_COLUMNS} FROM resume_analysis ORDER BY id").fetchall()
+
+
+# --- Fixtures -----------------------------------------------------------------
+
+SAMPLE_ANALYSES = [
+    {'relevance_score': 82.5, 'verdict': 'High', 'matched_skills': ['python', 'sql'],
+     'missing_skills': [], 'semantic_score': 78.0},
+    {'relevance_score': 55.0, 'verdict': 'Medium', 'matched_skills': ['excel'],
+     'missing_skills': ['tableau', 'power bi'], 'semantic_score': 60.5},
+    {'relevance_score': 12.0, 'verdict': 'Low', 'matched_skills': [],
+     'missing_skills': ['java'], 'semantic_score': 20.0},
+]
+
+SAMPLE_REPORT = """Here is the analysis of the resume.
+
+## Overall Assessment
+A solid resume with clear structure.
+
+## Professional Profile Analysis
+Five years in data roles.
+
+## Skills Analysis
+- Python
+- SQL
+
+## Key Strengths
+- Quantified achievements
+
+## Areas for Improvement
+- Add a summary
+
+## ATS Optimization Assessment
+Uses standard headings.
+
+## Resume Score
+78/100
+"""
+
+
+@pytest.fixture
+def app_module():
+    return pytest.importorskip("app")
+
+
+@pytest.fixture
+def placement_module(tmp_path, monkeypatch):
+    module = pytest.importorskip("placement_dashboard")
+    # The module writes placement_dashboard.db in the working directory
+    monkeypatch.chdir(tmp_path)
+    return module
+
+
+@pytest.fixture
+def matcher(monkeypatch):
+    pytest.importorskip("openai")
+    pytest.importorskip("dotenv")
+    monkeypatch.setenv("OPENROUTER_API_KEY", "test-key")
+    from resume_radar.matching_engine import ResumeJDMatcher
+    return ResumeJDMatcher()
+
+
+# --- Tests --------------------------------------------------------------------
+
+def test_course_lookups_match_category_scan():
+    roles = [role for roles in courses.COURSES_BY_CATEGORY.values() for role in roles]
+    for role in roles + ["Unknown Role", ""]:
+        assert courses.get_courses_for_role(role) == old_get_courses_for_role(role)
+        assert courses.get_category_for_role(role) == old_get_category_for_role(role)
+
+
+def test_score_band_matches_chained_comparisons(app_module):
+    for score in (-5, 0, 30, 59, 59.9, 60, 60.1, 75, 79.99, 80, 95, 100):
+        assert app_module.score_band(score) == old_score_band(score)
+    assert app_module.SCORE_STATUS[app_module.score_band(85)] == "Excellent"
+    assert app_module.SCORE_STATUS[app_module.score_band(65)] == "Good"
+    assert app_module.SCORE_STATUS[app_module.score_band(40)] == "Needs Improvement"
+
+
+@pytest.mark.parametrize("text", [
+    SAMPLE_REPORT,
+    "## Resume Score\n90/100",
+    "No recognised sections in this report.",
+])
+def test_style_report_sections_matches_replace_loop(app_module, text):
+    styles = app_module.REPORT_SECTION_STYLES
+    assert app_module.style_report_sections(text) == old_style_report_sections(text, styles)
+
+
+def test_bulk_save_resume_analyses_matches_row_by_row(app_module):
+    rows = [(1, f"Candidate {i}", f"resume_{i}.pdf", a['relevance_score'], a['verdict'],
+             str(a['matched_skills']), str(a['missing_skills']), a['semantic_score'], str(a))
+            for i, a in enumerate(SAMPLE_ANALYSES)]
+    batched, single = sqlite3.connect(":memory:"), sqlite3.connect(":memory:")
+    for conn in (batched, single):
+        conn.executescript(app_module.PLACEMENT_DB_SCHEMA)
+
+    app_module.ResumeApp.bulk_save_resume_analyses(SimpleNamespace(placement_conn=batched), rows)
+    old_save_rows(single, rows)
+
+    assert saved_rows(batched) == saved_rows(single)
+
+
+def test_save_analyses_to_db_matches_row_by_row(placement_module, tmp_path):
+    rows = [placement_module.analysis_to_db_row(7, f"Candidate {i}", f"resume_{i}.pdf", analysis)
+            for i, analysis in enumerate(SAMPLE_ANALYSES)]
+
+    placement_module.initialize_database()
+    placement_module.save_analyses_to_db(rows)
+    with sqlite3.connect("placement_dashboard.db") as conn:
+        batched = saved_rows(conn)
+
+    os.remove("placement_dashboard.db")
+    placement_module.initialize_database()
+    with sqlite3.connect("placement_dashboard.db") as conn:
+        old_save_rows(conn, rows)
+        single = saved_rows(conn)
+
+    assert batched == single
+
+
+def test_alias_index_matches_alias_scan(matcher):
+    skills = [term for main, aliases in matcher.skill_aliases.items() for term in [main] + aliases]
+    skills += ["Python (3.x)", "JavaScript Programming", "  Docker  ", "rust", "Spring Framework"]
+    for skill in skills:
+        assert sorted(matcher.expand_skill_aliases(skill)) == sorted(old_expand_skill_aliases(matcher, skill))
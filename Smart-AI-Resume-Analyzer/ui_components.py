@@ -154,11 +154,11 @@ def tooltip(content, tooltip_text):
 
 def data_table(data, headers):
     """Render a modern data table with hover effects"""
-    header_row = "".join([f"<th>{header}</th>" for header in headers])
-    rows = ""
-    for row in data:
-        cells = "".join([f"<td>{cell}</td>" for cell in row])
-        rows += f"<tr>{cells}</tr>"
+    header_row = "".join(map("<th>{}</th>".format, headers))
+    # One join over all rows instead of growing a string row by row
+    rows = "".join(
+        "<tr>" + "".join(map("<td>{}</td>".format, row)) + "</tr>" for row in data
+    )
     
     st.markdown(f"""
         <div class="table-container">
@@ -29,6 +29,9 @@ import json
 import math
 import re
 
+# Deletes list-bullet characters from a line in one pass
+BULLET_DELETE_TABLE = str.maketrans("", "", "-*•")
+
 
 class AIResumeAnalyzer:
     def __init__(self):
@@ -209,104 +212,134 @@ class AIResumeAnalyzer:
         os.unlink(temp_path)  # Clean up the temp file
         return text
     
-    def analyze_resume_with_gemini(self, resume_text, job_description=None, job_role=None):
-        """Analyze resume using Google Gemini AI"""
+    def _gemini_unavailable(self, resume_text):
+        """Error message if a Gemini analysis can't run, otherwise None"""
         if not resume_text:
-            return {"error": "Resume text is required for analysis."}
+            return "Resume text is required for analysis."
         
         # Check if Google AI is available and configured
         if not GOOGLE_AI_AVAILABLE:
-            return {"error": "Google AI is not available in this environment. Please use OpenRouter analysis instead."}
+            return "Google AI is not available in this environment. Please use OpenRouter analysis instead."
             
         if not self.google_ai_configured:
-            return {"error": "Google AI is not configured. Please check your API key or use OpenRouter analysis instead."}
+            return "Google AI is not configured. Please check your API key or use OpenRouter analysis instead."
+        return None
+    
+    def _gemini_prompt(self, resume_text, job_description=None, job_role=None):
+        """Build the resume analysis prompt for Gemini"""
+        base_prompt = f"""
+        You are an expert resume analyst with deep knowledge of industry standards, job requirements, and hiring practices across various fields. Your task is to provide a comprehensive, detailed analysis of the resume provided.
         
-        try:
-            model = genai.GenerativeModel("gemini-1.5-flash")
-            
-            base_prompt = f"""
-            You are an expert resume analyst with deep knowledge of industry standards, job requirements, and hiring practices across various fields. Your task is to provide a comprehensive, detailed analysis of the resume provided.
-            
-            Please structure your response in the following format:
-            
-            ## Overall Assessment
-            [Provide a detailed assessment of the resume's overall quality, effectiveness, and alignment with industry standards. Include specific observations about formatting, content organization, and general impression. Be thorough and specific.]
-            
-            ## Professional Profile Analysis
-            [Analyze the candidate's professional profile, experience trajectory, and career narrative. Discuss how well their story comes across and whether their career progression makes sense for their apparent goals.]
-            
-            ## Skills Analysis
-            - **Current Skills**: [List ALL skills the candidate demonstrates in their resume, categorized by type (technical, soft, domain-specific, etc.). Be comprehensive.]
-            - **Skill Proficiency**: [Assess the apparent level of expertise in key skills based on how they're presented in the resume]
-            - **Missing Skills**: [List important skills that would improve the resume for their target role. Be specific and explain why each skill matters.]
-            
-            ## Experience Analysis
-            [Provide detailed feedback on how well the candidate has presented their experience. Analyze the use of action verbs, quantifiable achievements, and relevance to their target role. Suggest specific improvements.]
-            
-            ## Education Analysis
-            [Analyze the education section, including relevance of degrees, certifications, and any missing educational elements that would strengthen their profile.]
-            
-            ## Key Strengths
-            [List 5-7 specific strengths of the resume with detailed explanations of why these are effective]
-            
-            ## Areas for Improvement
-            [List 5-7 specific areas where the resume could be improved with detailed, actionable recommendations]
-            
-            ## ATS Optimization Assessment
-            [Analyze how well the resume is optimized for Applicant Tracking Systems. Provide a specific ATS score from 0-100, with 100 being perfectly optimized. Use this format: "ATS Score: XX/100". Then suggest specific keywords and formatting changes to improve ATS performance.]
-            
-            ## Recommended Courses/Certifications
-            [Suggest 5-7 specific courses or certifications that would enhance the candidate's profile, with a brief explanation of why each would be valuable]
+        Please structure your response in the following format:
+        
+        ## Overall Assessment
+        [Provide a detailed assessment of the resume's overall quality, effectiveness, and alignment with industry standards. Include specific observations about formatting, content organization, and general impression. Be thorough and specific.]
+        
+        ## Professional Profile Analysis
+        [Analyze the candidate's professional profile, experience trajectory, and career narrative. Discuss how well their story comes across and whether their career progression makes sense for their apparent goals.]
+        
+        ## Skills Analysis
+        - **Current Skills**: [List ALL skills the candidate demonstrates in their resume, categorized by type (technical, soft, domain-specific, etc.). Be comprehensive.]
+        - **Skill Proficiency**: [Assess the apparent level of expertise in key skills based on how they're presented in the resume]
+        - **Missing Skills**: [List important skills that would improve the resume for their target role. Be specific and explain why each skill matters.]
+        
+        ## Experience Analysis
+        [Provide detailed feedback on how well the candidate has presented their experience. Analyze the use of action verbs, quantifiable achievements, and relevance to their target role. Suggest specific improvements.]
+        
+        ## Education Analysis
+        [Analyze the education section, including relevance of degrees, certifications, and any missing educational elements that would strengthen their profile.]
+        
+        ## Key Strengths
+        [List 5-7 specific strengths of the resume with detailed explanations of why these are effective]
+        
+        ## Areas for Improvement
+        [List 5-7 specific areas where the resume could be improved with detailed, actionable recommendations]
+        
+        ## ATS Optimization Assessment
+        [Analyze how well the resume is optimized for Applicant Tracking Systems. Provide a specific ATS score from 0-100, with 100 being perfectly optimized. Use this format: "ATS Score: XX/100". Then suggest specific keywords and formatting changes to improve ATS performance.]
+        
+        ## Recommended Courses/Certifications
+        [Suggest 5-7 specific courses or certifications that would enhance the candidate's profile, with a brief explanation of why each would be valuable]
+        
+        ## Resume Score
+        [Provide a score from 0-100 based on the overall quality of the resume. Use this format exactly: "Resume Score: XX/100" where XX is the numerical score. Be consistent with your assessment - a resume with significant issues should score below 60, an average resume 60-75, a good resume 75-85, and an excellent resume 85-100.]
+        
+        Resume:
+        {resume_text}
+        """
+        
+        if job_role:
+            base_prompt += f"""
             
-            ## Resume Score
-            [Provide a score from 0-100 based on the overall quality of the resume. Use this format exactly: "Resume Score: XX/100" where XX is the numerical score. Be consistent with your assessment - a resume with significant issues should score below 60, an average resume 60-75, a good resume 75-85, and an excellent resume 85-100.]
+            The candidate is targeting a role as: {job_role}
             
-            Resume:
-            {resume_text}
+            ## Role Alignment Analysis
+            [Analyze how well the resume aligns with the target role of {job_role}. Provide specific recommendations to better align the resume with this role.]
             """
+        
+        if job_description:
+            base_prompt += f"""
             
-            if job_role:
-                base_prompt += f"""
-                
-                The candidate is targeting a role as: {job_role}
-                
-                ## Role Alignment Analysis
-                [Analyze how well the resume aligns with the target role of {job_role}. Provide specific recommendations to better align the resume with this role.]
-                """
-            
-            if job_description:
-                base_prompt += f"""
-                
-                Additionally, compare this resume to the following job description:
-                
-                Job Description:
-                {job_description}
-                
-                ## Job Match Analysis
-                [Provide a detailed analysis of how well the resume matches the job description, with a match percentage and specific areas of alignment and misalignment]
-                
-                ## Key Job Requirements Not Met
-                [List specific requirements from the job description that are not addressed in the resume, with recommendations on how to address each gap]
-                """
-            
-            response = model.generate_content(base_prompt)
-            analysis = response.text.strip()
+            Additionally, compare this resume to the following job description:
             
-            # Extract resume score if present
-            resume_score = self._extract_score_from_text(analysis)
+            Job Description:
+            {job_description}
             
-            # Extract ATS score if present
-            ats_score = self._extract_ats_score_from_text(analysis)
+            ## Job Match Analysis
+            [Provide a detailed analysis of how well the resume matches the job description, with a match percentage and specific areas of alignment and misalignment]
             
-            return {
-                "analysis": analysis,
-                "resume_score": resume_score,
-                "ats_score": ats_score
-            }
+            ## Key Job Requirements Not Met
+            [List specific requirements from the job description that are not addressed in the resume, with recommendations on how to address each gap]
+            """
+        
+        return base_prompt
+    
+    def gemini_result_from_text(self, analysis):
+        """Turn a finished Gemini analysis into the result dict, scores included"""
+        analysis = analysis.strip()
+        
+        # Extract resume score if present
+        resume_score = self._extract_score_from_text(analysis)
+        
+        # Extract ATS score if present
+        ats_score = self._extract_ats_score_from_text(analysis)
+        
+        return {
+            "analysis": analysis,
+            "resume_score": resume_score,
+            "ats_score": ats_score
+        }
+    
+    def analyze_resume_with_gemini(self, resume_text, job_description=None, job_role=None):
+        """Analyze resume using Google Gemini AI"""
+        error = self._gemini_unavailable(resume_text)
+        if error:
+            return {"error": error}
+        
+        try:
+            model = genai.GenerativeModel("gemini-1.5-flash")
+            response = model.generate_content(self._gemini_prompt(resume_text, job_description, job_role))
+            return self.gemini_result_from_text(response.text)
         
         except Exception as e:
             return {"error": f"Analysis failed: {str(e)}"}
-
+    
+    def analyze_resume_with_gemini_stream(self, resume_text, job_description=None, job_role=None):
+        """Yield the Gemini analysis text as it is generated.
+        
+        Raises RuntimeError if Gemini can't be used; pass the joined text to
+        gemini_result_from_text for the scores.
+        """
+        error = self._gemini_unavailable(resume_text)
+        if error:
+            raise RuntimeError(error)
+        
+        model = genai.GenerativeModel("gemini-1.5-flash")
+        response = model.generate_content(
+            self._gemini_prompt(resume_text, job_description, job_role), stream=True)
+        for chunk in response:
+            if chunk.text:
+                yield chunk.text
     
     def generate_pdf_report(self, analysis_result, candidate_name, job_role):
         """Generate a PDF report of the analysis"""
@@ -901,7 +934,7 @@ class AIResumeAnalyzer:
                         
                         for line in current_part.split("\n"):
                             if line.strip() and ("-" in line or "*" in line or "•" in line):
-                                skill = line.replace("-", "").replace("*", "").replace("•", "").strip()
+                                skill = line.translate(BULLET_DELETE_TABLE).strip()
                                 if skill:
                                     current_skills.append(skill)
                     
@@ -909,7 +942,7 @@ class AIResumeAnalyzer:
                         missing_part = section_content.split("Missing Skills")[1]
                         for line in missing_part.split("\n"):
                             if line.strip() and ("-" in line or "*" in line or "•" in line):
-                                skill = line.replace("-", "").replace("*", "").replace("•", "").strip()
+                                skill = line.translate(BULLET_DELETE_TABLE).strip()
                                 if skill:
                                     missing_skills.append(skill)
                     
@@ -1143,7 +1176,7 @@ class AIResumeAnalyzer:
                 
                 for line in skills_section.split("\n"):
                     if line.strip() and ("-" in line or "*" in line or "•" in line):
-                        skill = line.replace("-", "").replace("*", "").replace("•", "").strip()
+                        skill = line.translate(BULLET_DELETE_TABLE).strip()
                         if skill:
                             skills.append(skill)
         except Exception as e:
@@ -1163,7 +1196,7 @@ class AIResumeAnalyzer:
                 
                 for line in missing_section.split("\n"):
                     if line.strip() and ("-" in line or "*" in line or "•" in line):
-                        skill = line.replace("-", "").replace("*", "").replace("•", "").strip()
+                        skill = line.translate(BULLET_DELETE_TABLE).strip()
                         if skill:
                             missing_skills.append(skill)
         except Exception as e:
@@ -1897,7 +1930,7 @@ class AIResumeAnalyzer:
                     
                     for line in current_part.split("\n"):
                         if line.strip() and ("-" in line or "*" in line or "•" in line):
-                            skill = clean_markdown(line.replace("-", "").replace("*", "").replace("•", "").strip())
+                            skill = clean_markdown(line.translate(BULLET_DELETE_TABLE).strip())
                             if skill:
                                 current_skills.append(skill)
                 
@@ -1905,7 +1938,7 @@ class AIResumeAnalyzer:
                     missing_part = section_content.split("Missing Skills")[1]
                     for line in missing_part.split("\n"):
                         if line.strip() and ("-" in line or "*" in line or "•" in line):
-                            skill = clean_markdown(line.replace("-", "").replace("*", "").replace("•", "").strip())
+                            skill = clean_markdown(line.translate(BULLET_DELETE_TABLE).strip())
                             if skill:
                                 missing_skills.append(skill)
                 